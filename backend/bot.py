@@ -7,6 +7,7 @@ from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, Messa
 from backend.database import engine, SessionLocal
 
 from backend.models import Base, Issue
+from backend.integrity_chain import integrity_chain
 
 
 # Enable logging
@@ -77,8 +78,8 @@ def save_issue_to_db(description, category, photo_path):
             image_path=photo_path,
             source='telegram'
         )
-        db.add(new_issue)
-        db.commit()
+        # Sealed onto the integrity chain like web reports (adds and commits)
+        integrity_chain.append(db, [new_issue])
         db.refresh(new_issue)
         return new_issue.id
     except Exception as e:
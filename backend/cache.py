@@ -1,139 +1,674 @@
+import os
 import time
+import heapq
+import asyncio
+import inspect
 import logging
 import threading
-from typing import Any, Optional
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from fastapi.concurrency import run_in_threadpool
+
+from backend.cache_backend import CacheBackend, InvalidationEvent, SharedEntry, create_cache_backend
 
 logger = logging.getLogger(__name__)
 
+# Dependency tags for cache entries derived from issues. Writers invalidate
+# only the tags they touch instead of clearing whole caches.
+TAG_ISSUES_RECENT = "issues:recent"            # Recent issue listings (new issues shift every page)
+TAG_ISSUES_STATS = "issues:stats"              # Aggregate counts by status/category
+TAG_ISSUES_LEADERBOARD = "issues:leaderboard"  # Reporter rankings
+
+
+def issue_tag(issue_id: int) -> str:
+    """Tag for entries that embed data of a single issue."""
+    return f"issue:{issue_id}"
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent computations of the same key into one.
+
+    The first caller for a key runs the computation; callers arriving while it
+    is in flight wait and share its result (or its exception). do() is for
+    threads (sync handlers run in the threadpool), do_async() for coroutines
+    on the event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, "asyncio.Task"] = {}
+        self._executions = 0
+        self._collapsed = 0
+
+    def do(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._executions += 1
+            else:
+                self._collapsed += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def do_async(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        compute may return a value or an awaitable. It runs as its own task, so
+        cancelling any caller (the first one included) neither cancels it nor
+        fails the other callers.
+        """
+        task = self._async_flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_flight(key, compute))
+            # Retrieve the outcome even when every caller was cancelled, so asyncio does not warn about it
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._async_flights[key] = task
+            with self._lock:
+                self._executions += 1
+        else:
+            with self._lock:
+                self._collapsed += 1
+        return await asyncio.shield(task)
+
+    async def _run_flight(self, key: str, compute: Callable[[], Any]) -> Any:
+        try:
+            result = compute()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            if self._async_flights.get(key) is asyncio.current_task():
+                del self._async_flights[key]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "collapsed": self._collapsed,
+                "in_flight": len(self._flights) + len(self._async_flights),
+            }
+
+
+class _CacheShard:
+    """
+    One independently locked partition of a ThreadSafeCache.
+
+    Entries live in an OrderedDict kept in recency order (oldest first), so
+    get/set/evict are O(1). Expiry is lazy: a min-heap of (expires_at, key)
+    lets set() drop expired entries from the front in amortized O(log n),
+    and get() simply treats an expired entry as a miss.
+    """
+
+    __slots__ = ("data", "expiry_heap", "lock", "max_size", "hits", "stale_hits", "shared_hits",
+                 "misses", "evictions", "expirations")
+
+    def __init__(self, max_size: int):
+        # key -> (value, expires_at, fresh_until); entries between fresh_until
+        # and expires_at are stale but may still be served (stale-while-revalidate)
+        self.data: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.stale_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def purge_expired(self, now: float) -> List[str]:
+        """Drop expired entries from the front of the expiry heap and return their keys. Lock must be held."""
+        heap = self.expiry_heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.data.get(key)
+            # Heap entries outlive overwritten/invalidated keys; only act on current ones
+            if entry is not None and entry[1] == expires_at:
+                del self.data[key]
+                self.expirations += 1
+                expired.append(key)
+
+        # Keep stale heap entries from piling up when keys are rewritten often
+        if len(heap) > 2 * len(self.data) + 64:
+            self.expiry_heap = [(entry[1], key) for key, entry in self.data.items()]
+            heapq.heapify(self.expiry_heap)
+        return expired
+
+
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Small shared pool running stale-while-revalidate refreshes."""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+        return _refresh_executor
+
+
 class ThreadSafeCache:
     """
-    Thread-safe cache implementation with TTL and memory management.
-    Fixes race conditions and implements proper cache expiration.
+    Thread-safe LRU cache with per-key TTL.
+
+    All operations are O(1) (amortized O(log n) for expiry bookkeeping on set).
+    With stripes > 1 keys are spread over independently locked shards so that
+    concurrent requests do not serialize on one lock; recency order and the
+    size limit are then kept per shard.
+
+    Entries can carry dependency tags (see TAG_* above); invalidate_tags()
+    drops every entry registered under any of the given tags.
+
+    With a shared backend (see cache_backend.py), entries are also written to
+    it under "<name>:<key>", local misses are filled from it, and
+    invalidations are broadcast to the caches of the same name in other
+    workers, which poll for them at most every sync_interval seconds. When
+    that backend blocks (SQLite), the async methods make their backend calls
+    in the threadpool; local hits between syncs stay on the event loop.
     """
-    
-    def __init__(self, ttl: int = 300, max_size: int = 100):
-        self._data = {}
-        self._timestamps = {}
-        self._ttl = ttl  # Time to live in seconds
+
+    def __init__(self, ttl: int = 300, max_size: int = 100, stripes: int = 1,
+                 backend: Optional[CacheBackend] = None, name: str = "default", sync_interval: float = 0.5):
+        self._ttl = ttl  # Default time to live in seconds
         self._max_size = max_size  # Maximum number of cache entries
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
-        self._access_count = {}  # Track access frequency for LRU eviction
-        
+        self._shards = [
+            _CacheShard(max(1, -(-max_size // stripes)))
+            for _ in range(max(1, stripes))
+        ]
+        self._flight = SingleFlight()
+        self._epoch = 0  # Bumped by every invalidation (see _set)
+        self._refresh_lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set["asyncio.Task"] = set()
+        self._refreshes = 0
+        self._tag_lock = threading.Lock()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._tags_by_key: Dict[str, Tuple[str, ...]] = {}
+        self._backend = backend
+        self._blocking_backend = backend is not None and getattr(backend, "blocking", True)
+        self._name = name
+        self._origin = f"{os.getpid()}:{id(self)}"
+        self._sync_interval = sync_interval
+        self._sync_lock = threading.Lock()
+        self._next_sync = 0.0
+        self._remote_invalidations = 0
+        self._backend_errors = 0
+        self._seen_seq = self._backend_call("latest_seq") or 0
+
+    def _shard(self, key: str) -> _CacheShard:
+        shards = self._shards
+        return shards[0] if len(shards) == 1 else shards[hash(key) % len(shards)]
+
     def get(self, key: str = "default") -> Optional[Any]:
         """
-        Thread-safe get operation with automatic cleanup.
+        Thread-safe get operation. Expired (and stale) entries count as misses.
         """
-        with self._lock:
-            current_time = time.time()
-            
-            # Check if key exists and is not expired
-            if key in self._data and key in self._timestamps:
-                if current_time - self._timestamps[key] < self._ttl:
-                    # Update access count for LRU
-                    self._access_count[key] = self._access_count.get(key, 0) + 1
-                    return self._data[key]
+        return self._lookup(key, allow_stale=False)[0]
+
+    async def get_async(self, key: str = "default") -> Optional[Any]:
+        """get() for the event loop."""
+        return (await self._lookup_async(key, allow_stale=False))[0]
+
+    async def run_async(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call func(*args), which uses this cache, from the event loop: in the
+        threadpool when the shared backend blocks, inline otherwise.
+        """
+        if self._blocking_backend:
+            return await run_in_threadpool(func, *args)
+        return func(*args)
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        """Return (value, is_stale); value is None on a miss."""
+        if self._backend is not None:
+            self._sync()
+        found, data, stale = self._lookup_local(key, allow_stale)
+        if found or self._backend is None:
+            return data, stale
+        return self._lookup_shared(key, allow_stale)
+
+    async def _lookup_async(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        if not self._blocking_backend:
+            return self._lookup(key, allow_stale)
+        if time.monotonic() < self._next_sync:
+            # Optimization: no sync due, so a local hit needs no thread hop
+            found, data, stale = self._lookup_local(key, allow_stale)
+            if found:
+                return data, stale
+            return await run_in_threadpool(self._lookup_shared, key, allow_stale)
+        return await run_in_threadpool(self._lookup, key, allow_stale)
+
+    def _lookup_local(self, key: str, allow_stale: bool) -> Tuple[bool, Optional[Any], bool]:
+        """(found, value, is_stale) from this worker's tier; misses are counted here without a backend."""
+        shard = self._shard(key)
+        now = time.monotonic()
+        expired = False
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is not None:
+                data, expires_at, fresh_until = entry
+                if expires_at > now:
+                    if fresh_until > now:
+                        shard.data.move_to_end(key)
+                        shard.hits += 1
+                        return True, data, False
+                    if allow_stale:
+                        shard.data.move_to_end(key)
+                        shard.stale_hits += 1
+                        return True, data, True
+                    # Stale entries stay around for callers that accept them
                 else:
                     # Expired entry - remove it
-                    self._remove_key(key)
-            
-            return None
-    
-    def set(self, data: Any, key: str = "default") -> None:
+                    del shard.data[key]
+                    shard.expirations += 1
+                    expired = True
+            if self._backend is None:
+                shard.misses += 1
+        if expired and self._tags_by_key:
+            with self._tag_lock:
+                self._unregister_dropped_locked([key])
+        return False, None, False
+
+    def _lookup_shared(self, key: str, allow_stale: bool) -> Tuple[Optional[Any], bool]:
+        """Fill a local miss from the shared backend."""
+        epoch = self._epoch
+        entry = self._backend_call("get", self._shared_key(key))
+        shard = self._shard(key)
+        now = time.time()
+        if entry is None or not (entry.fresh_until > now or allow_stale):
+            with shard.lock:
+                shard.misses += 1
+            return None, False
+
+        offset = time.monotonic() - now
+        self._set_entry(entry.value, key, entry.tags, entry.fresh_until + offset, entry.expires_at + offset,
+                        epoch, share=False)
+        with shard.lock:
+            shard.shared_hits += 1
+        return entry.value, entry.fresh_until <= now
+
+    def set(self, data: Any, key: str = "default", ttl: Optional[float] = None,
+            tags: Optional[Iterable[str]] = None, stale_ttl: float = 0) -> None:
         """
-        Thread-safe set operation with memory management.
+        Thread-safe set operation. ttl overrides the cache default for this key;
+        tags register the entry for invalidate_tags(); stale_ttl keeps the entry
+        servable by get_or_compute() for that long after it goes stale.
         """
-        with self._lock:
-            current_time = time.time()
-            
-            # Clean up expired entries before adding new one
-            self._cleanup_expired()
-            
-            # If cache is full, evict least recently used entry
-            if len(self._data) >= self._max_size and key not in self._data:
-                self._evict_lru()
-            
-            # Set new data atomically
-            self._data[key] = data
-            self._timestamps[key] = current_time
-            self._access_count[key] = 1
-            
-            logger.debug(f"Cache set: key={key}, size={len(self._data)}")
-    
+        self._set(data, key, ttl, tags, stale_ttl)
+
+    def _set(self, data: Any, key: str, ttl: Optional[float], tags: Optional[Iterable[str]],
+             stale_ttl: float, epoch: Optional[int] = None) -> bool:
+        """Store an entry; with epoch, only if nothing was invalidated since that epoch."""
+        fresh_until = time.monotonic() + (self._ttl if ttl is None else ttl)
+        expires_at = fresh_until + stale_ttl
+        return self._set_entry(data, key, tuple(tags or ()), fresh_until, expires_at, epoch)
+
+    def _set_entry(self, data: Any, key: str, tags: Tuple[str, ...], fresh_until: float, expires_at: float,
+                   epoch: Optional[int] = None, share: bool = True) -> bool:
+        if epoch is not None and self._backend is not None:
+            # Apply invalidations from other workers first, so that they too
+            # prevent storing a value computed before them
+            self._sync(force=True)
+
+        if tags or epoch is not None or self._tags_by_key:
+            # Register and store together so a concurrent invalidate_tags()
+            # cannot slip in between and leave an untracked entry behind
+            with self._tag_lock:
+                if epoch is not None and epoch != self._epoch:
+                    return False
+                self._register_tags_locked(key, tags)
+                dropped = self._store(key, data, expires_at, fresh_until)
+                if dropped:
+                    self._unregister_dropped_locked(dropped)
+        else:
+            # No tags registered at all: evicted keys have nothing to unregister
+            self._store(key, data, expires_at, fresh_until)
+
+        if share and self._backend is not None:
+            offset = time.time() - time.monotonic()
+            self._backend_call(
+                "set", self._shared_key(key), SharedEntry(data, fresh_until + offset, expires_at + offset, tags)
+            )
+        return True
+
+    def _store(self, key: str, data: Any, expires_at: float, fresh_until: float) -> List[str]:
+        """Store an entry; returns the keys dropped to make room (expired or evicted)."""
+        shard = self._shard(key)
+        with shard.lock:
+            dropped = shard.purge_expired(time.monotonic())
+
+            if key in shard.data:
+                shard.data.move_to_end(key)
+            elif len(shard.data) >= shard.max_size:
+                # Evict the least recently used entry
+                evicted_key, _ = shard.data.popitem(last=False)
+                shard.evictions += 1
+                dropped.append(evicted_key)
+                logger.debug(f"Evicted LRU cache entry: {evicted_key}")
+
+            shard.data[key] = (data, expires_at, fresh_until)
+            heapq.heappush(shard.expiry_heap, (expires_at, key))
+
+            logger.debug(f"Cache set: key={key}, size={len(shard.data)}")
+        return dropped
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None,
+                       tags: Union[Iterable[str], Callable[[Any], Iterable[str]], None] = None,
+                       stale_ttl: float = 0, refresh: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+        Concurrent misses for the same key run compute() only once.
+        tags may be a callable deriving the tags from the computed value.
+
+        With stale_ttl, an entry past its ttl is still returned for that long
+        while refresh() (default: compute) recomputes it on a background
+        thread. refresh must not depend on request-scoped state such as the
+        request's DB session.
+        """
+        data, stale = self._lookup(key, allow_stale=stale_ttl > 0)
+        if data is not None:
+            if stale:
+                self._schedule_refresh(key, refresh or compute, ttl, tags, stale_ttl)
+            return data
+
+        return self._flight.do(key, lambda: self._compute_and_store(key, compute, ttl, tags, stale_ttl))
+
+    async def get_or_compute_async(self, key: str, compute: Callable[[], Any], ttl: Optional[float] = None,
+                                   tags: Union[Iterable[str], Callable[[Any], Iterable[str]], None] = None,
+                                   stale_ttl: float = 0, refresh: Optional[Callable[[], Any]] = None) -> Any:
+        """Async variant of get_or_compute; compute/refresh may return a value or an awaitable."""
+        data, stale = await self._lookup_async(key, allow_stale=stale_ttl > 0)
+        if data is not None:
+            if stale:
+                self._schedule_refresh_async(key, refresh or compute, ttl, tags, stale_ttl)
+            return data
+
+        return await self._flight.do_async(
+            key, lambda: self._compute_and_store_async(key, compute, ttl, tags, stale_ttl)
+        )
+
+    def _compute_and_store(self, key, compute, ttl, tags, stale_ttl):
+        # A write invalidating while we compute must not be overwritten by our result
+        epoch = self._epoch
+        data = compute()
+        self._set(data, key, ttl, tags(data) if callable(tags) else tags, stale_ttl, epoch)
+        return data
+
+    async def _compute_and_store_async(self, key, compute, ttl, tags, stale_ttl):
+        epoch = self._epoch
+        data = compute()
+        if inspect.isawaitable(data):
+            data = await data
+        await self.run_async(self._set, data, key, ttl, tags(data) if callable(tags) else tags, stale_ttl, epoch)
+        return data
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._refreshes += 1
+            return True
+
+    def _release_refresh(self, key: str) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(key)
+
+    def _schedule_refresh(self, key, refresh, ttl, tags, stale_ttl) -> None:
+        if not self._claim_refresh(key):
+            return
+
+        def run():
+            try:
+                self._flight.do(key, lambda: self._compute_and_store(key, refresh, ttl, tags, stale_ttl))
+            except Exception as e:
+                logger.error(f"Background cache refresh failed for key={key}: {e}", exc_info=True)
+            finally:
+                self._release_refresh(key)
+
+        _get_refresh_executor().submit(run)
+
+    def _schedule_refresh_async(self, key, refresh, ttl, tags, stale_ttl) -> None:
+        if not self._claim_refresh(key):
+            return
+
+        async def run():
+            try:
+                await self._flight.do_async(
+                    key, lambda: self._compute_and_store_async(key, refresh, ttl, tags, stale_ttl)
+                )
+            except Exception as e:
+                logger.error(f"Background cache refresh failed for key={key}: {e}", exc_info=True)
+            finally:
+                self._release_refresh(key)
+                self._refresh_tasks.discard(task)
+
+        task = asyncio.get_running_loop().create_task(run())
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._refresh_tasks.add(task)
+
     def invalidate(self, key: str = "default") -> None:
         """
         Thread-safe invalidation of specific key.
         """
-        with self._lock:
-            self._remove_key(key)
-            logger.debug(f"Cache invalidated: key={key}")
-    
+        self.invalidate_keys([key])
+
+    def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """Invalidate several keys at once (one broadcast to other workers)."""
+        keys = list(keys)
+        self._invalidate_local_keys(keys)
+        if self._backend is not None:
+            self._backend_call("delete", [self._shared_key(key) for key in keys])
+            self._publish("keys", keys)
+
+    async def invalidate_keys_async(self, keys: Iterable[str]) -> None:
+        """invalidate_keys() for the event loop."""
+        await self.run_async(self.invalidate_keys, list(keys))
+
+    def _invalidate_local_keys(self, keys: List[str]) -> None:
+        with self._tag_lock:
+            self._epoch += 1
+            for key in keys:
+                self._unregister_key_locked(key)
+                shard = self._shard(key)
+                with shard.lock:
+                    shard.data.pop(key, None)
+        logger.debug(f"Cache invalidated: keys={keys}")
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalidate every entry tagged with any of the given tags.
+        Returns the number of keys dropped (in this worker).
+        """
+        dropped = self._invalidate_local_tags(tags)
+        if self._backend is not None:
+            self._backend_call("delete_tags", self._name, tags)
+            self._publish("tags", tags)
+        return dropped
+
+    async def invalidate_tags_async(self, *tags: str) -> int:
+        """invalidate_tags() for the event loop."""
+        return await self.run_async(self.invalidate_tags, *tags)
+
+    def _invalidate_local_tags(self, tags: Iterable[str]) -> int:
+        with self._tag_lock:
+            self._epoch += 1
+            keys = set()
+            for tag in tags:
+                keys |= self._keys_by_tag.pop(tag, set())
+            for key in keys:
+                self._unregister_key_locked(key)
+                shard = self._shard(key)
+                with shard.lock:
+                    shard.data.pop(key, None)
+
+        logger.debug(f"Cache invalidated tags={tags}: {len(keys)} keys")
+        return len(keys)
+
     def clear(self) -> None:
         """
         Thread-safe clear all cache entries.
         """
-        with self._lock:
-            self._data.clear()
-            self._timestamps.clear()
-            self._access_count.clear()
-            logger.debug("Cache cleared")
-    
+        self._clear_local()
+        if self._backend is not None:
+            self._backend_call("clear", self._name)
+            self._publish("clear", ())
+
+    def _clear_local(self) -> None:
+        with self._tag_lock:
+            self._epoch += 1
+            for shard in self._shards:
+                with shard.lock:
+                    shard.data.clear()
+                    shard.expiry_heap.clear()
+            self._keys_by_tag.clear()
+            self._tags_by_key.clear()
+        logger.debug("Cache cleared")
+
     def get_stats(self) -> dict:
         """
-        Get cache statistics for monitoring.
+        Get cache statistics for monitoring (O(number of stripes)).
         """
-        with self._lock:
-            current_time = time.time()
-            expired_count = sum(
-                1 for ts in self._timestamps.values() 
-                if current_time - ts >= self._ttl
-            )
-            
-            return {
-                "total_entries": len(self._data),
-                "expired_entries": expired_count,
-                "max_size": self._max_size,
-                "ttl_seconds": self._ttl
+        totals = {"total_entries": 0, "hits": 0, "stale_hits": 0, "shared_hits": 0, "misses": 0,
+                  "evictions": 0, "expirations": 0}
+        for shard in self._shards:
+            with shard.lock:
+                totals["total_entries"] += len(shard.data)
+                totals["hits"] += shard.hits
+                totals["stale_hits"] += shard.stale_hits
+                totals["shared_hits"] += shard.shared_hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["expirations"] += shard.expirations
+
+        served = totals["hits"] + totals["stale_hits"] + totals["shared_hits"]
+        lookups = served + totals["misses"]
+        stats = {
+            **totals,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            "background_refreshes": self._refreshes,
+            "max_size": self._max_size,
+            "ttl_seconds": self._ttl,
+            "stripes": len(self._shards),
+            "tags": len(self._keys_by_tag),
+            "single_flight": self._flight.get_stats(),
+        }
+        if self._backend is not None:
+            stats["shared"] = {
+                "name": self._name,
+                "backend": self._backend_call("get_stats"),
+                "remote_invalidations": self._remote_invalidations,
+                "backend_errors": self._backend_errors,
             }
-    
-    def _remove_key(self, key: str) -> None:
-        """
-        Internal method to remove a key from all tracking dictionaries.
-        Must be called within lock context.
-        """
-        self._data.pop(key, None)
-        self._timestamps.pop(key, None)
-        self._access_count.pop(key, None)
-    
-    def _cleanup_expired(self) -> None:
-        """
-        Internal method to clean up expired entries.
-        Must be called within lock context.
-        """
-        current_time = time.time()
-        expired_keys = [
-            key for key, timestamp in self._timestamps.items()
-            if current_time - timestamp >= self._ttl
-        ]
-        
-        for key in expired_keys:
-            self._remove_key(key)
-        
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-    
-    def _evict_lru(self) -> None:
-        """
-        Internal method to evict least recently used entry.
-        Must be called within lock context.
-        """
-        if not self._access_count:
+        return stats
+
+    # --- Shared backend ---
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self._name}:{key}"
+
+    def _backend_call(self, method: str, *args: Any) -> Any:
+        """Call the shared backend; failures are logged and the cache carries on locally."""
+        if self._backend is None:
+            return None
+        try:
+            return getattr(self._backend, method)(*args)
+        except Exception as e:
+            self._backend_errors += 1
+            logger.warning(f"Shared cache backend {method} failed for cache {self._name}: {e}")
+            return None
+
+    def _publish(self, kind: str, targets: Iterable[str]) -> None:
+        seq = self._backend_call("publish", self._origin, self._name, kind, tuple(targets))
+        if seq is not None:
+            with self._sync_lock:
+                # Our own events need no replay, but earlier ones from others do
+                if seq == self._seen_seq + 1:
+                    self._seen_seq = seq
+
+    def _sync(self, force: bool = False) -> None:
+        """Apply invalidations broadcast by other workers since the last sync."""
+        now = time.monotonic()
+        if not force and now < self._next_sync:
+            return
+        if not self._sync_lock.acquire(blocking=force):
+            return  # Another thread is syncing right now
+        try:
+            self._next_sync = now + self._sync_interval
+            for event in self._backend_call("poll", self._seen_seq) or ():
+                self._seen_seq = event.seq
+                self._apply_remote(event)
+        finally:
+            self._sync_lock.release()
+
+    def _apply_remote(self, event: InvalidationEvent) -> None:
+        if event.origin == self._origin or event.namespace != self._name:
             return
-        
-        # Find key with lowest access count
-        lru_key = min(self._access_count.keys(), key=lambda k: self._access_count[k])
-        self._remove_key(lru_key)
-        logger.debug(f"Evicted LRU cache entry: {lru_key}")
+        self._remote_invalidations += 1
+        if event.kind == "keys":
+            self._invalidate_local_keys(list(event.targets))
+        elif event.kind == "tags":
+            self._invalidate_local_tags(event.targets)
+        elif event.kind == "clear":
+            self._clear_local()
+
+    def _register_tags_locked(self, key: str, tags: Tuple[str, ...]) -> None:
+        """Replace the tags of key (unregistered again when the entry is evicted, expires or is invalidated)."""
+        self._unregister_key_locked(key)
+        if tags:
+            self._tags_by_key[key] = tags
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def _unregister_dropped_locked(self, keys: Iterable[str]) -> None:
+        """Unregister the tags of evicted/expired keys, unless the key was stored again meanwhile."""
+        for key in keys:
+            if key in self._tags_by_key:
+                shard = self._shard(key)
+                with shard.lock:
+                    stored_again = key in shard.data
+                if not stored_again:
+                    self._unregister_key_locked(key)
+
+    def _unregister_key_locked(self, key: str) -> None:
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
 
 class SimpleCache:
     """
@@ -152,7 +687,12 @@ class SimpleCache:
     def invalidate(self):
         self._cache.invalidate("default")
 
+# Shared tier for multi-worker deployments (CACHE_BACKEND_URL); None means per-worker caches only
+shared_cache_backend = create_cache_backend()
+
 # Global instances with improved configuration
-recent_issues_cache = ThreadSafeCache(ttl=300, max_size=20)  # 5 minutes TTL, max 20 entries
-nearby_issues_cache = ThreadSafeCache(ttl=60, max_size=100)  # 1 minute TTL, max 100 entries
-user_upload_cache = ThreadSafeCache(ttl=3600, max_size=1000)  # 1 hour TTL for upload limits
+recent_issues_cache = ThreadSafeCache(ttl=300, max_size=20, backend=shared_cache_backend, name="recent_issues")  # 5 minutes TTL, max 20 entries
+# Dashboard entries (stats, leaderboard, recent issues) keep being served this
+# long past their TTL while a background refresh recomputes them
+DASHBOARD_STALE_TTL = 600
+nearby_issues_cache = ThreadSafeCache(ttl=60, max_size=100, backend=shared_cache_backend, name="nearby_issues")  # 1 minute TTL, max 100 entries
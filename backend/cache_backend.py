@@ -0,0 +1,383 @@
+"""
+Shared cache tier and invalidation broadcast for multi-worker deployments.
+
+Each worker keeps its own ThreadSafeCache (the fast in-process tier). When a
+CacheBackend is configured, caches also write their entries to it, fill local
+misses from it, and publish every invalidation to its event log. Workers poll
+that log and apply the invalidations of other workers to their local tier, so
+one worker's write clears the others.
+
+Implementations:
+- InProcessCacheBackend: a dict and an event list; a stand-in that lets several
+  caches in one process share a tier (tests, single-process development).
+- SQLiteCacheBackend: a SQLite WAL file shared by all workers on one host, no
+  external service needed. Its calls block (BEGIN IMMEDIATE writes may wait
+  for the write lock), so async callers run them in the threadpool.
+
+Values cross process boundaries as JSON (encode_value/decode_value), never
+pickle: any local process can write to the shared file, and decoding only
+builds plain JSON data, bytes and the NamedTuple types marked @shared_type.
+
+Times stored in a backend are wall-clock (time.time()) since monotonic clocks
+are not comparable across processes.
+"""
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKEND_URL = os.environ.get("CACHE_BACKEND_URL", "memory://")
+
+# Invalidation events are kept this long; workers poll far more often than that
+EVENT_RETENTION_SECONDS = 300
+
+
+# NamedTuple classes whose values may be stored in a shared backend, by name
+_SHARED_TYPES: Dict[str, type] = {}
+_BYTES_MARKER = "$bytes"
+_TYPE_MARKER = "$type"
+_FIELDS_MARKER = "fields"
+
+
+def shared_type(cls: type) -> type:
+    """Class decorator allowing NamedTuple values of cls in shared cache entries."""
+    _SHARED_TYPES[cls.__name__] = cls
+    return cls
+
+
+def _to_json(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, bytes):
+        return {_BYTES_MARKER: base64.b64encode(value).decode("ascii")}
+    if isinstance(value, tuple) and _SHARED_TYPES.get(type(value).__name__) is type(value):
+        return {_TYPE_MARKER: type(value).__name__, _FIELDS_MARKER: [_to_json(item) for item in value]}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _to_json(item) for key, item in value.items()}
+    raise TypeError(f"{type(value).__name__} values cannot be stored in a shared cache")
+
+
+def _from_json_object(obj: dict) -> Any:
+    if len(obj) == 1 and _BYTES_MARKER in obj:
+        return base64.b64decode(obj[_BYTES_MARKER])
+    if len(obj) == 2 and _TYPE_MARKER in obj and _FIELDS_MARKER in obj:
+        cls = _SHARED_TYPES.get(obj[_TYPE_MARKER])
+        if cls is None:
+            raise ValueError(f"Unknown shared cache type {obj[_TYPE_MARKER]!r}")
+        return cls(*obj[_FIELDS_MARKER])
+    return obj
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    JSON bytes of a cache value: JSON data, bytes and @shared_type NamedTuples
+    (plain tuples come back as lists). Raises TypeError for anything else.
+    """
+    return json.dumps(_to_json(value), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_value(raw: bytes) -> Any:
+    return json.loads(raw, object_hook=_from_json_object)
+
+
+class SharedEntry(NamedTuple):
+    value: Any
+    fresh_until: float  # wall clock
+    expires_at: float   # wall clock
+    tags: Tuple[str, ...]
+
+
+class InvalidationEvent(NamedTuple):
+    seq: int
+    origin: str       # id of the publishing cache instance
+    namespace: str
+    kind: str         # "keys", "tags" or "clear"
+    targets: Tuple[str, ...]
+
+
+class CacheBackend:
+    """
+    Interface of a cache tier shared between workers.
+    Keys passed in are already namespaced by the calling cache.
+    """
+
+    # Whether calls do blocking I/O (async callers then use the threadpool)
+    blocking = True
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: SharedEntry) -> None:
+        raise NotImplementedError
+
+    def delete(self, keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def delete_tags(self, namespace: str, tags: Iterable[str]) -> None:
+        """Delete the entries of namespace registered under any of the tags."""
+        raise NotImplementedError
+
+    def clear(self, namespace: str) -> None:
+        raise NotImplementedError
+
+    def publish(self, origin: str, namespace: str, kind: str, targets: Iterable[str]) -> int:
+        """Append an invalidation event; returns its sequence number."""
+        raise NotImplementedError
+
+    def poll(self, after_seq: int) -> List[InvalidationEvent]:
+        """Events with seq > after_seq, oldest first."""
+        raise NotImplementedError
+
+    def latest_seq(self) -> int:
+        raise NotImplementedError
+
+    def get_stats(self) -> dict:
+        return {"backend": type(self).__name__}
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Shared tier living in this process."""
+
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._events: List[InvalidationEvent] = []
+        self._event_times: List[float] = []
+        self._seq = 0
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return entry
+
+    def set(self, key: str, entry: SharedEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_tags(self, namespace: str, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        prefix = namespace + ":"
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if k.startswith(prefix) and tags & set(entry.tags)]:
+                del self._entries[key]
+
+    def clear(self, namespace: str) -> None:
+        prefix = namespace + ":"
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def publish(self, origin: str, namespace: str, kind: str, targets: Iterable[str]) -> int:
+        now = time.time()
+        with self._lock:
+            self._seq += 1
+            self._events.append(InvalidationEvent(self._seq, origin, namespace, kind, tuple(targets)))
+            self._event_times.append(now)
+            # Drop events past the retention window
+            cutoff = 0
+            while cutoff < len(self._event_times) and self._event_times[cutoff] < now - EVENT_RETENTION_SECONDS:
+                cutoff += 1
+            if cutoff:
+                del self._events[:cutoff]
+                del self._event_times[:cutoff]
+            return self._seq
+
+    def poll(self, after_seq: int) -> List[InvalidationEvent]:
+        with self._lock:
+            return [event for event in self._events if event.seq > after_seq]
+
+    def latest_seq(self) -> int:
+        with self._lock:
+            return self._seq
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "entries": len(self._entries), "events": len(self._events)}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Shared tier in a SQLite file (WAL mode, so readers never block the writer).
+    Every worker process on the host opens the same file.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.executescript(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+            " fresh_until REAL NOT NULL, expires_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS cache_tags ("
+            " tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS ix_cache_tags_key ON cache_tags (key);"
+            "CREATE TABLE IF NOT EXISTS cache_events ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT, origin TEXT NOT NULL, namespace TEXT NOT NULL,"
+            " kind TEXT NOT NULL, targets TEXT NOT NULL, created_at REAL NOT NULL);"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, fresh_until, expires_at FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            value = decode_value(row[0])
+        except ValueError:
+            # Not written by encode_value (e.g. an older format): a miss, overwritten on the next set
+            return None
+        tags = tuple(tag for (tag,) in conn.execute("SELECT tag FROM cache_tags WHERE key = ?", (key,)))
+        return SharedEntry(value, row[1], row[2], tags)
+
+    def set(self, key: str, entry: SharedEntry) -> None:
+        value = encode_value(entry.value)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, fresh_until, expires_at) VALUES (?, ?, ?, ?)",
+                (key, value, entry.fresh_until, entry.expires_at)
+            )
+            conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            conn.executemany("INSERT INTO cache_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in entry.tags])
+            # Expired entries are removed as new ones come in
+            now = time.time()
+            conn.execute(
+                "DELETE FROM cache_tags WHERE key IN (SELECT key FROM cache_entries WHERE expires_at <= ?)", (now,)
+            )
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete(self, keys: Iterable[str]) -> None:
+        params = [(key,) for key in keys]
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", params)
+            conn.executemany("DELETE FROM cache_tags WHERE key = ?", params)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete_tags(self, namespace: str, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        if not tags:
+            return
+        placeholders = ",".join("?" * len(tags))
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            keys = [
+                (key,) for (key,) in conn.execute(
+                    f"SELECT DISTINCT key FROM cache_tags WHERE tag IN ({placeholders}) AND key GLOB ?",
+                    (*tags, namespace + ":*")
+                )
+            ]
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", keys)
+            conn.executemany("DELETE FROM cache_tags WHERE key = ?", keys)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self, namespace: str) -> None:
+        pattern = namespace + ":*"
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM cache_entries WHERE key GLOB ?", (pattern,))
+            conn.execute("DELETE FROM cache_tags WHERE key GLOB ?", (pattern,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def publish(self, origin: str, namespace: str, kind: str, targets: Iterable[str]) -> int:
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "INSERT INTO cache_events (origin, namespace, kind, targets, created_at) VALUES (?, ?, ?, ?, ?)",
+                (origin, namespace, kind, "\n".join(targets), now)
+            )
+            conn.execute("DELETE FROM cache_events WHERE created_at < ?", (now - EVENT_RETENTION_SECONDS,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return cursor.lastrowid
+
+    def poll(self, after_seq: int) -> List[InvalidationEvent]:
+        rows = self._connection().execute(
+            "SELECT seq, origin, namespace, kind, targets FROM cache_events WHERE seq > ? ORDER BY seq",
+            (after_seq,)
+        ).fetchall()
+        return [
+            InvalidationEvent(seq, origin, namespace, kind, tuple(targets.split("\n")) if targets else ())
+            for seq, origin, namespace, kind, targets in rows
+        ]
+
+    def latest_seq(self) -> int:
+        row = self._connection().execute("SELECT MAX(seq) FROM cache_events").fetchone()
+        return row[0] or 0
+
+    def get_stats(self) -> dict:
+        conn = self._connection()
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "entries": conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0],
+            "events": conn.execute("SELECT COUNT(*) FROM cache_events").fetchone()[0],
+        }
+
+
+def create_cache_backend(url: str = CACHE_BACKEND_URL) -> Optional[CacheBackend]:
+    """
+    Shared backend for a CACHE_BACKEND_URL: sqlite:///path/to/cache.db for a
+    file shared by the workers on this host, memory:// (the default) for none,
+    in which case every worker only uses its own in-process cache.
+    """
+    if url.startswith("sqlite:///"):
+        return SQLiteCacheBackend(url[len("sqlite:///"):])
+    if url not in ("", "memory://"):
+        logger.warning(f"Unknown cache backend '{url}', using in-process caches only")
+    return None
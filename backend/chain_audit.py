@@ -0,0 +1,241 @@
+"""
+Merkle checkpoints and range audits for the issue integrity chain.
+
+verify_blockchain_integrity checks one link at a time. Auditing the whole
+chain that way costs one request and two queries per issue. This module adds:
+
+- Checkpoints: every CHAIN_CHECKPOINT_BLOCK_SIZE issues (by id) form a block.
+  A block's Merkle root is persisted in chain_checkpoints, together with the
+  root over all block roots so far. The latest checkpoint's root therefore
+  commits to every checkpointed issue. Blocks are sealed periodically (see
+  main.py) and only once complete.
+- verify_range: streams an id range in keyset batches. It recomputes every
+  seal, checks every prev_hash link, and recomputes the root of each
+  checkpointed block inside the range. The block check catches rows that were
+  rewritten together with a recomputed, self-consistent seal.
+- prove_inclusion: the sibling path from one issue to its block root, then
+  from the block root to the latest root (O(log n) hashes in total).
+
+The leaf of an issue is leaf_hash(f"{id}|{integrity_hash}"), so its position
+and seal are both committed. Issues without a seal are leaves too, with an
+empty hash. Archived issues keep their id and seal, and every read here
+covers the hot and archive tables (issue_archive.issue_rows).
+"""
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.integrity_chain import chain_hash
+from backend.issue_archive import issue_rows
+from backend.merkle import inclusion_proof, leaf_hash, merkle_root, root_from_proof
+from backend.models import ChainCheckpoint
+
+logger = logging.getLogger(__name__)
+
+CHAIN_CHECKPOINT_BLOCK_SIZE = int(os.environ.get("CHAIN_CHECKPOINT_BLOCK_SIZE", "1024"))
+CHAIN_CHECKPOINT_SECONDS = float(os.environ.get("CHAIN_CHECKPOINT_SECONDS", "600"))
+# Issues newer than this are not checkpointed yet: with several writers, ids
+# can commit out of order, and a block must not close over a missing id
+CHAIN_CHECKPOINT_SETTLE_SECONDS = float(os.environ.get("CHAIN_CHECKPOINT_SETTLE_SECONDS", "60"))
+
+VERIFY_BATCH_SIZE = 1000
+# Failing ids listed per category in a range report (the counts are exact)
+MAX_REPORTED_IDS = 100
+
+
+def issue_leaf(issue_id: int, integrity_hash: Optional[str]) -> str:
+    return leaf_hash(f"{issue_id}|{integrity_hash or ''}")
+
+
+def _block_roots(db: Session) -> List[str]:
+    return list(db.execute(select(ChainCheckpoint.block_root).order_by(ChainCheckpoint.start_issue_id)).scalars())
+
+
+def latest_checkpoint(db: Session) -> Optional[ChainCheckpoint]:
+    return db.execute(
+        select(ChainCheckpoint).order_by(ChainCheckpoint.start_issue_id.desc()).limit(1)
+    ).scalar()
+
+
+def create_checkpoints(db: Session, block_size: int = CHAIN_CHECKPOINT_BLOCK_SIZE,
+                       settle_seconds: float = CHAIN_CHECKPOINT_SETTLE_SECONDS) -> int:
+    """Checkpoint every complete block after the latest checkpoint. Returns the number created."""
+    last = latest_checkpoint(db)
+    after_id = last.end_issue_id if last else 0
+
+    upper_id = None
+    if settle_seconds > 0:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settle_seconds)
+        newest = issue_rows(db, ["id"], where=lambda table: table.c.created_at < cutoff, descending=True, limit=1)
+        if not newest:
+            return 0
+        upper_id = newest[0].id
+
+    block_roots = _block_roots(db)
+    created = []
+    while True:
+        rows = issue_rows(db, ["id", "integrity_hash"], min_id=after_id + 1, max_id=upper_id, limit=block_size)
+        if len(rows) < block_size:
+            break
+
+        block_root = merkle_root([issue_leaf(row.id, row.integrity_hash) for row in rows])
+        block_roots.append(block_root)
+        created.append(ChainCheckpoint(
+            start_issue_id=rows[0].id, end_issue_id=rows[-1].id, leaf_count=len(rows),
+            block_root=block_root, root=merkle_root(block_roots)
+        ))
+        after_id = rows[-1].id
+
+    if not created:
+        return 0
+    db.add_all(created)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker checkpointed the same blocks first
+        db.rollback()
+        logger.info("Chain checkpoints were created concurrently by another worker")
+        return 0
+    logger.info(f"Created {len(created)} chain checkpoints (up to issue {after_id})")
+    return len(created)
+
+
+def verify_range(db: Session, start_id: int, end_id: int, batch_size: int = VERIFY_BATCH_SIZE) -> dict:
+    """
+    Audit issues start_id..end_id (inclusive), streaming batch_size rows at a time.
+    Seals are checked against the recomputed hash, links against the previous
+    sealed issue, and checkpointed blocks fully inside the range against their root.
+    """
+    # Predecessors of the first row: the previous sealed issue (link check) and
+    # the previous row (legacy seals without prev_hash were chained to it)
+    head = issue_rows(
+        db, ["id", "integrity_hash"], max_id=start_id - 1,
+        where=lambda table: table.c.integrity_hash.isnot(None), descending=True, limit=1
+    )
+    head = head[0].integrity_hash if head else ""
+    previous_row = issue_rows(db, ["id", "integrity_hash"], max_id=start_id - 1, descending=True, limit=1)
+    previous_row_hash = (previous_row[0].integrity_hash or "") if previous_row else ""
+
+    # Blocks fully inside the range, in id order; each collects the leaves of its rows
+    checkpoints = db.execute(
+        select(ChainCheckpoint.id, ChainCheckpoint.start_issue_id, ChainCheckpoint.end_issue_id,
+               ChainCheckpoint.block_root)
+        .where(ChainCheckpoint.start_issue_id >= start_id, ChainCheckpoint.end_issue_id <= end_id)
+        .order_by(ChainCheckpoint.start_issue_id)
+    ).all()
+    pending = iter(checkpoints)
+    block, block_leaves = next(pending, None), []
+
+    checked = sealed = invalid_count = broken_count = 0
+    invalid_hashes: List[int] = []
+    broken_links: List[int] = []
+    checkpoint_mismatches: List[int] = []
+
+    def close_block():
+        # Compares the rows found in the block (deleted rows change the root too)
+        if merkle_root(block_leaves) != block.block_root:
+            checkpoint_mismatches.append(block.id)
+
+    last_id = start_id - 1
+    while True:
+        rows = issue_rows(
+            db, ["id", "description", "category", "integrity_hash", "prev_hash"],
+            min_id=last_id + 1, max_id=end_id, limit=batch_size
+        )
+        if not rows:
+            break
+
+        # Optimization: plain tuples and locals in the per-row loop
+        for issue_id, description, category, integrity_hash, prev_hash in rows:
+            checked += 1
+            while block is not None and issue_id > block.end_issue_id:
+                close_block()
+                block, block_leaves = next(pending, None), []
+            if block is not None and issue_id >= block.start_issue_id:
+                block_leaves.append(issue_leaf(issue_id, integrity_hash))
+
+            if integrity_hash is not None:
+                sealed += 1
+                if prev_hash is not None and prev_hash != head:
+                    broken_count += 1
+                    if len(broken_links) < MAX_REPORTED_IDS:
+                        broken_links.append(issue_id)
+                link = prev_hash if prev_hash is not None else previous_row_hash
+                if chain_hash(description, category, link) != integrity_hash:
+                    invalid_count += 1
+                    if len(invalid_hashes) < MAX_REPORTED_IDS:
+                        invalid_hashes.append(issue_id)
+                head = integrity_hash
+            previous_row_hash = integrity_hash or ""
+
+        last_id = rows[-1][0]
+
+    while block is not None:
+        close_block()
+        block, block_leaves = next(pending, None), []
+
+    return {
+        "start_id": start_id,
+        "end_id": end_id,
+        "is_valid": not (invalid_count or broken_count or checkpoint_mismatches),
+        "checked": checked,
+        "sealed": sealed,
+        "invalid_count": invalid_count,
+        "invalid_hashes": invalid_hashes,
+        "broken_link_count": broken_count,
+        "broken_links": broken_links,
+        "checkpoints_checked": len(checkpoints),
+        "checkpoint_mismatches": checkpoint_mismatches,
+    }
+
+
+def prove_inclusion(db: Session, issue_id: int) -> Optional[dict]:
+    """
+    Inclusion proof of an issue against the latest checkpoint root, or None when
+    the issue does not exist or is not checkpointed yet.
+    """
+    checkpoint = db.execute(
+        select(ChainCheckpoint).where(
+            ChainCheckpoint.start_issue_id <= issue_id, ChainCheckpoint.end_issue_id >= issue_id
+        )
+    ).scalar()
+    if checkpoint is None:
+        return None
+
+    rows = issue_rows(db, ["id", "integrity_hash"], min_id=checkpoint.start_issue_id, max_id=checkpoint.end_issue_id)
+    index = next((i for i, row in enumerate(rows) if row.id == issue_id), None)
+    if index is None:
+        return None
+
+    leaves = [issue_leaf(row.id, row.integrity_hash) for row in rows]
+    # One snapshot of the checkpoint list, so that the path and the root agree
+    checkpoints = db.execute(
+        select(ChainCheckpoint.id, ChainCheckpoint.block_root, ChainCheckpoint.root)
+        .order_by(ChainCheckpoint.start_issue_id)
+    ).all()
+    block_index = next(i for i, row in enumerate(checkpoints) if row.id == checkpoint.id)
+
+    return {
+        "issue_id": issue_id,
+        "integrity_hash": rows[index].integrity_hash,
+        "leaf_hash": leaves[index],
+        "checkpoint_id": checkpoint.id,
+        "block_index": block_index,
+        "block_proof": inclusion_proof(leaves, index),
+        "block_root": checkpoint.block_root,
+        "root_proof": inclusion_proof([row.block_root for row in checkpoints], block_index),
+        "root": checkpoints[-1].root,
+        "root_checkpoint_id": checkpoints[-1].id,
+    }
+
+
+def verify_inclusion_proof(proof: dict) -> bool:
+    """Check a prove_inclusion() result: leaf -> block root -> latest root."""
+    leaf = issue_leaf(proof["issue_id"], proof["integrity_hash"])
+    block_root = root_from_proof(leaf, proof["block_proof"])
+    return root_from_proof(block_root, proof["root_proof"]) == proof["root"]
@@ -17,6 +17,45 @@ except ImportError:
     pass  # dotenv not installed, rely on system env vars
 
 
+@dataclass
+class DatabaseConfig:
+    """
+    Database engine tuning. Has no required variables, so unlike Config it can
+    be loaded at import time (backend/database.py builds the engine from it).
+    """
+
+    # SQLite connection pragmas
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kb: int = 65536      # 64MB page cache per connection
+    sqlite_mmap_size_mb: int = 256
+
+    # Connection pool (server databases such as Postgres)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle_seconds: int = 1800
+    pool_timeout_seconds: int = 30
+
+    @classmethod
+    def from_env(cls) -> "DatabaseConfig":
+        """Load database tuning from environment variables, falling back to the defaults above."""
+        defaults = cls()
+        return cls(
+            sqlite_journal_mode=os.getenv("SQLITE_JOURNAL_MODE", defaults.sqlite_journal_mode).upper(),
+            sqlite_synchronous=os.getenv("SQLITE_SYNCHRONOUS", defaults.sqlite_synchronous).upper(),
+            sqlite_busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", str(defaults.sqlite_busy_timeout_ms))),
+            sqlite_cache_size_kb=int(os.getenv("SQLITE_CACHE_SIZE_KB", str(defaults.sqlite_cache_size_kb))),
+            sqlite_mmap_size_mb=int(os.getenv("SQLITE_MMAP_SIZE_MB", str(defaults.sqlite_mmap_size_mb))),
+            pool_size=int(os.getenv("DB_POOL_SIZE", str(defaults.pool_size))),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", str(defaults.max_overflow))),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+            pool_recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", str(defaults.pool_recycle_seconds))),
+            pool_timeout_seconds=int(os.getenv("DB_POOL_TIMEOUT_SECONDS", str(defaults.pool_timeout_seconds))),
+        )
+
+
 @dataclass
 class Config:
     """
@@ -30,6 +69,7 @@ class Config:
     
     # Database
     database_url: str
+    database: DatabaseConfig
     
     # Application Settings
     environment: str
@@ -122,6 +162,7 @@ class Config:
             gemini_api_key=gemini_api_key,
             telegram_bot_token=telegram_bot_token,
             database_url=database_url,
+            database=DatabaseConfig.from_env(),
             environment=environment,
             debug=debug,
             cors_origins=cors_origins,
@@ -1,7 +1,23 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from typing import Optional
+import logging
 import os
 
+from backend.config import DatabaseConfig
+
+# Async engine support (aiosqlite locally, asyncpg for Postgres)
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+    HAS_ASYNC_DB = True
+except ImportError:
+    HAS_ASYNC_DB = False
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
 # Check for DATABASE_URL (Render/Postgres) or fall back to SQLite
 SQLALCHEMY_DATABASE_URL = os.environ.get("DATABASE_URL")
 
@@ -14,15 +30,105 @@ if not SQLALCHEMY_DATABASE_URL:
     # Ensure data directory exists for SQLite
     from pathlib import Path
     Path("./data").mkdir(exist_ok=True)
-    connect_args = {"check_same_thread": False}
-else:
-    connect_args = {}
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args=connect_args
-)
+
+def sqlite_pragmas(db_config: DatabaseConfig, in_memory: bool = False) -> dict:
+    """PRAGMA name -> value applied to every new SQLite connection."""
+    pragmas = {
+        # Wait for a competing writer instead of failing with "database is locked"
+        "busy_timeout": db_config.sqlite_busy_timeout_ms,
+        "synchronous": db_config.sqlite_synchronous,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -db_config.sqlite_cache_size_kb,
+        "mmap_size": db_config.sqlite_mmap_size_mb * 1024 * 1024,
+    }
+    if not in_memory:
+        # WAL lets readers proceed while a write is in progress (file databases only)
+        pragmas = {"journal_mode": db_config.sqlite_journal_mode, **pragmas}
+    return pragmas
+
+
+def create_db_engine(url: str, db_config: Optional[DatabaseConfig] = None) -> Engine:
+    """
+    Engine factory. SQLite connections get WAL and the tuning pragmas from
+    db_config; server databases (Postgres) get a sized, pre-pinged pool.
+    """
+    db_config = db_config or DatabaseConfig.from_env()
+
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        _install_sqlite_pragmas(engine, url, db_config)
+        return engine
+
+    return create_engine(url, **_pool_options(db_config))
+
+
+def _pool_options(db_config: DatabaseConfig) -> dict:
+    return {
+        "pool_size": db_config.pool_size,
+        "max_overflow": db_config.max_overflow,
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "pool_recycle": db_config.pool_recycle_seconds,
+        "pool_timeout": db_config.pool_timeout_seconds,
+    }
+
+
+def _install_sqlite_pragmas(engine: Engine, url: str, db_config: DatabaseConfig) -> None:
+    in_memory = url.split("://", 1)[1] in ("", "/:memory:")
+    pragmas = sqlite_pragmas(db_config, in_memory=in_memory)
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def async_database_url(url: str) -> str:
+    """The same database addressed through its async driver."""
+    scheme, rest = url.split("://", 1)
+    backend = scheme.split("+", 1)[0]
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    if backend == "postgresql":
+        # asyncpg spells libpq's sslmode as ssl
+        rest = rest.replace("sslmode=", "ssl=")
+    return f"{ASYNC_DRIVERS[backend]}://{rest}"
+
+
+def create_async_db_engine(url: str, db_config: Optional[DatabaseConfig] = None) -> "AsyncEngine":
+    """Async counterpart of create_db_engine (same pragmas and pool settings). url is a sync URL."""
+    db_config = db_config or DatabaseConfig.from_env()
+    async_url = async_database_url(url)
+
+    if url.startswith("sqlite"):
+        async_db_engine = create_async_engine(async_url)
+        # Pragmas are set on the DBAPI connections, which the sync engine wraps
+        _install_sqlite_pragmas(async_db_engine.sync_engine, url, db_config)
+        return async_db_engine
+
+    return create_async_engine(async_url, **_pool_options(db_config))
+
+
+database_config = DatabaseConfig.from_env()
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL, database_config)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database for routes that await their queries
+# directly instead of hopping to the threadpool for every statement
+async_engine = None
+AsyncSessionLocal = None
+if HAS_ASYNC_DB:
+    try:
+        async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL, database_config)
+        # expire_on_commit=False: committed objects stay readable without an awaited refresh
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+    except Exception as e:
+        logger.warning(f"Async database engine unavailable ({e}); install aiosqlite/asyncpg")
+
 Base = declarative_base()
 
 def get_db():
@@ -31,3 +137,42 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database engine is not available (aiosqlite/asyncpg not installed)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def run_with_session(func, *args, **kwargs):
+    """Run func(db, *args, **kwargs) with its own short-lived session (for work outside a request)."""
+    db = SessionLocal()
+    try:
+        return func(db, *args, **kwargs)
+    finally:
+        db.close()
+
+async def run_with_async_session(func, *args, **kwargs):
+    """Await func(db, *args, **kwargs) with its own short-lived async session."""
+    async with AsyncSessionLocal() as db:
+        return await func(db, *args, **kwargs)
+
+def get_engine_info(db_engine: Engine = engine) -> dict:
+    """Engine settings in effect, for health output (pragmas are read back from a pooled connection)."""
+    info = {"dialect": db_engine.dialect.name, "pool": db_engine.pool.status()}
+    if db_engine.dialect.name == "sqlite":
+        with db_engine.connect() as connection:
+            driver_connection = connection.connection.driver_connection
+            info["pragmas"] = {
+                name: driver_connection.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")
+            }
+    else:
+        info["pool_settings"] = {
+            "pool_size": database_config.pool_size,
+            "max_overflow": database_config.max_overflow,
+            "pool_pre_ping": database_config.pool_pre_ping,
+            "pool_recycle_seconds": database_config.pool_recycle_seconds,
+            "pool_timeout_seconds": database_config.pool_timeout_seconds,
+        }
+    return info
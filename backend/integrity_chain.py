@@ -0,0 +1,177 @@
+"""
+Append service for the issue integrity hash chain.
+
+Every sealed issue stores
+
+    integrity_hash = sha256(f"{description}|{category}|{prev_hash}")
+
+where prev_hash is the integrity_hash of the issue sealed before it ("" for
+the first one). Looking up the predecessor with a query per insert costs a
+round trip, and two concurrent inserts could read the same predecessor and
+fork the chain.
+
+IntegrityChain keeps the chain head in memory and serialises appends in this
+process (a thread lock for sync sessions, an asyncio lock per event loop for
+AsyncSessions). Each row records its prev_hash. A partial unique index on
+issues.prev_hash (migration 4) makes a fork impossible at the database level.
+An append racing with another process, or with the other lock, fails on that
+index, reloads the head from the database and retries. Any other constraint
+failure (e.g. a reference_id clash) is re-raised at once.
+
+The cached head is reloaded every HEAD_MAX_AGE_SECONDS as well: the successor
+of a stale head may have been archived (see issue_archive.py), out of reach of
+the index.
+
+Several issues can be appended in one transaction (bulk ingestion).
+Rows sealed before prev_hash existed have it NULL; verification falls back to
+the previous row by id for them.
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from typing import List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.models import Issue
+
+logger = logging.getLogger(__name__)
+
+# Attempts before giving up when other writers keep moving the head
+MAX_APPEND_ATTEMPTS = 5
+# Age after which the cached head is reloaded before an append
+HEAD_MAX_AGE_SECONDS = 300
+# Partial unique index on issues.prev_hash (see models.Issue)
+PREV_HASH_INDEX = "ux_issues_prev_hash"
+
+
+def chain_hash(description: Optional[str], category: Optional[str], prev_hash: str) -> str:
+    """Integrity hash of an issue chained to prev_hash."""
+    return hashlib.sha256(f"{description}|{category}|{prev_hash}".encode()).hexdigest()
+
+
+def _is_fork(error: IntegrityError) -> bool:
+    """Whether error is the prev_hash index rejecting a second successor of the head."""
+    diag = getattr(error.orig, "diag", None)  # psycopg2 reports the constraint by name
+    constraint = getattr(diag, "constraint_name", None)
+    if constraint:
+        return constraint == PREV_HASH_INDEX
+    # SQLite names the indexed column instead: "UNIQUE constraint failed: issues.prev_hash"
+    message = str(error.orig)
+    return PREV_HASH_INDEX in message or "issues.prev_hash" in message
+
+
+def _head_query():
+    return (
+        select(Issue.integrity_hash)
+        .where(Issue.integrity_hash.isnot(None))
+        .order_by(Issue.id.desc())
+        .limit(1)
+    )
+
+
+class IntegrityChain:
+    """In-memory chain head with serialised, retrying appends."""
+
+    def __init__(self, max_attempts: int = MAX_APPEND_ATTEMPTS, head_max_age: float = HEAD_MAX_AGE_SECONDS):
+        self._max_attempts = max_attempts
+        self._head_max_age = head_max_age
+        self._head: Optional[str] = None  # None: not loaded yet
+        self._head_loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._async_locks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._appended = 0
+        self._conflicts = 0
+
+    def _seal(self, issues: Sequence[Issue], head: str) -> str:
+        """Set prev_hash/integrity_hash on issues in order; returns the new head."""
+        for issue in issues:
+            issue.prev_hash = head
+            issue.integrity_hash = chain_hash(issue.description, issue.category, head)
+            head = issue.integrity_hash
+        return head
+
+    def _unseal(self, issues: Sequence[Issue]) -> None:
+        for issue in issues:
+            issue.prev_hash = None
+            issue.integrity_hash = None
+
+    def append(self, db: Session, issues: List[Issue]) -> None:
+        """Seal issues (in order) onto the chain, add them to db and commit."""
+        with self._lock:
+            for _ in range(self._max_attempts):
+                if self._head_expired():
+                    self._head = db.execute(_head_query()).scalar() or ""
+                    self._head_loaded_at = time.monotonic()
+                new_head = self._seal(issues, self._head)
+                db.add_all(issues)
+                try:
+                    db.commit()
+                except IntegrityError as e:
+                    db.rollback()
+                    if not _is_fork(e):
+                        self._unseal(issues)
+                        raise
+                    self._on_conflict(issues)
+                    continue
+                self._head = new_head
+                self._appended += len(issues)
+                return
+        raise RuntimeError(f"Could not append to the integrity chain after {self._max_attempts} attempts")
+
+    async def append_async(self, db: AsyncSession, issues: List[Issue]) -> None:
+        """append() for an AsyncSession."""
+        async with self._async_lock():
+            for _ in range(self._max_attempts):
+                if self._head_expired():
+                    self._head = (await db.execute(_head_query())).scalar() or ""
+                    self._head_loaded_at = time.monotonic()
+                new_head = self._seal(issues, self._head)
+                db.add_all(issues)
+                try:
+                    await db.commit()
+                except IntegrityError as e:
+                    await db.rollback()
+                    if not _is_fork(e):
+                        self._unseal(issues)
+                        raise
+                    self._on_conflict(issues)
+                    continue
+                self._head = new_head
+                self._appended += len(issues)
+                return
+        raise RuntimeError(f"Could not append to the integrity chain after {self._max_attempts} attempts")
+
+    def _head_expired(self) -> bool:
+        return self._head is None or time.monotonic() - self._head_loaded_at > self._head_max_age
+
+    def _async_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = self._async_locks[loop] = asyncio.Lock()
+        return lock
+
+    def _on_conflict(self, issues: Sequence[Issue]) -> None:
+        # Another writer extended the chain from the same head: reload it and reseal
+        logger.info("Integrity chain head moved by another writer; retrying append")
+        self._conflicts += 1
+        self._head = None
+        self._unseal(issues)
+
+    def reset(self) -> None:
+        """Forget the cached head (e.g. after the issues table was rewritten)."""
+        self._head = None
+
+    def get_stats(self) -> dict:
+        return {"head": self._head, "appended": self._appended, "conflicts": self._conflicts}
+
+
+# Global instance used by every writer of sealed issues
+integrity_chain = IntegrityChain()
@@ -0,0 +1,252 @@
+"""
+Hot/cold partitioning of the issues table.
+
+Resolved and verified issues are rarely read again, yet every status index,
+the ORDER BY created_at of the recent issues list and every aggregate keep
+growing with them. IssueArchiver moves issues closed for more than
+ISSUE_ARCHIVE_AFTER_DAYS into issues_archive. It walks the table in keyset
+batches of ISSUE_ARCHIVE_BATCH_SIZE and commits one transaction per batch
+(INSERT ... SELECT, then DELETE). It runs every ISSUE_ARCHIVE_SECONDS (see
+main.py). The archive is a table of the same database rather than a separate
+SQLite file, so it works on Postgres too and one session reads both tables.
+
+What stays consistent:
+- Reads by id or reference_id fall through to the archive (find_issue_row).
+  A status update restores an archived issue to the hot table first
+  (restore_issue).
+- The integrity chain: archived rows keep their id, seal and prev_hash, and
+  the chain audits read both tables merged by id (issue_rows), so Merkle
+  checkpoints and proofs do not change. The newest sealed issue is never
+  archived, so the chain head and the next id always come from the hot table.
+- issue_counters and the leaderboard count hot and archived issues.
+- The action plan moves into the archive row, and upvotes still waiting in
+  the upvote buffer are added to it.
+- Full-text search, the R*Tree and the open issue index cover hot issues only
+  (their delete triggers and hooks drop archived rows).
+
+Issues linked to a grievance stay hot: grievances.issue_id references issues.id.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import DateTime, bindparam, exists, func, literal, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from backend.cache import recent_issues_cache, issue_tag, TAG_ISSUES_RECENT
+from backend.issue_counters import RESOLVED_STATUSES
+from backend.models import Grievance, Issue, IssueActionPlan, IssueArchive
+from backend.upvote_buffer import upvote_buffer
+
+logger = logging.getLogger(__name__)
+
+ISSUE_ARCHIVE_AFTER_DAYS = float(os.environ.get("ISSUE_ARCHIVE_AFTER_DAYS", "90"))
+ISSUE_ARCHIVE_BATCH_SIZE = int(os.environ.get("ISSUE_ARCHIVE_BATCH_SIZE", "500"))
+ISSUE_ARCHIVE_SECONDS = float(os.environ.get("ISSUE_ARCHIVE_SECONDS", "3600"))
+
+issues = Issue.__table__
+archive = IssueArchive.__table__
+action_plans = IssueActionPlan.__table__
+
+# Columns copied between the two tables
+ISSUE_COLUMNS = [column.name for column in issues.columns]
+
+# Buffered upvotes of issues moved in the same transaction
+_increment_archived_upvotes = (
+    update(archive)
+    .where(archive.c.id == bindparam("issue_id"))
+    .values(upvotes=func.coalesce(archive.c.upvotes, 0) + bindparam("delta"))
+)
+
+
+def issue_rows(db: Session, columns: Sequence[str], min_id: Optional[int] = None, max_id: Optional[int] = None,
+               where: Optional[Callable] = None, descending: bool = False, limit: Optional[int] = None) -> List[Row]:
+    """
+    Rows of hot and archived issues with ids in min_id..max_id (inclusive),
+    merged in id order. columns must include "id"; where(table) adds a filter.
+    """
+    results = []
+    for table in (issues, archive):
+        query = select(*(table.c[name] for name in columns))
+        if min_id is not None:
+            query = query.where(table.c.id >= min_id)
+        if max_id is not None:
+            query = query.where(table.c.id <= max_id)
+        if where is not None:
+            query = query.where(where(table))
+        query = query.order_by(table.c.id.desc() if descending else table.c.id)
+        if limit is not None:
+            query = query.limit(limit)
+        results.append(db.execute(query).all())
+    hot, archived = results
+    if not archived or not hot:
+        # Optimization: nothing to merge (typical outside the oldest id ranges)
+        return hot or archived
+    rows = sorted(hot + archived, key=lambda row: row.id, reverse=descending)
+    return rows[:limit] if limit is not None else rows
+
+
+def find_issue_row(db: Session, columns: Sequence[str], issue_id: Optional[int] = None,
+                   reference_id: Optional[str] = None) -> Optional[Row]:
+    """One issue by id or reference_id: the hot table first, then the archive."""
+    for table in (issues, archive):
+        condition = table.c.id == issue_id if issue_id is not None else table.c.reference_id == reference_id
+        row = db.execute(select(*(table.c[name] for name in columns)).where(condition)).first()
+        if row is not None:
+            return row
+    return None
+
+
+def restore_issue(db: Session, issue_id: Optional[int] = None, reference_id: Optional[str] = None) -> bool:
+    """
+    Move an archived issue (and its action plan) back into the hot table,
+    within db's transaction. Returns False when the issue is not archived.
+    """
+    condition = archive.c.id == issue_id if issue_id is not None else archive.c.reference_id == reference_id
+    row = db.execute(select(archive.c.id, archive.c.action_plan).where(condition)).first()
+    if row is None:
+        return False
+
+    db.execute(issues.insert().from_select(
+        ISSUE_COLUMNS, select(*(archive.c[name] for name in ISSUE_COLUMNS)).where(archive.c.id == row.id)
+    ))
+    if row.action_plan is not None:
+        db.execute(action_plans.insert().values(issue_id=row.id, plan=row.action_plan))
+    db.execute(archive.delete().where(archive.c.id == row.id))
+    logger.info(f"Restored issue {row.id} from the archive")
+    return True
+
+
+def table_sizes(db: Session) -> dict:
+    return {
+        "issues": db.execute(select(func.count()).select_from(issues)).scalar(),
+        "issues_archive": db.execute(select(func.count()).select_from(archive)).scalar(),
+    }
+
+
+class IssueArchiver:
+    """Batched mover of closed issues into issues_archive, with throughput stats."""
+
+    def __init__(self, after_days: float = ISSUE_ARCHIVE_AFTER_DAYS, batch_size: int = ISSUE_ARCHIVE_BATCH_SIZE):
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self._lock = threading.Lock()  # one run at a time (periodic task and admin endpoint)
+        self._runs = 0
+        self._archived = 0
+        self._batches = 0
+        self._seconds = 0.0
+        self._last_run: Optional[dict] = None
+
+    def archive(self, db: Session, max_batches: Optional[int] = None) -> dict:
+        """Archive every eligible issue (at most max_batches batches). Returns the run's report."""
+        with self._lock:
+            started = time.perf_counter()
+            archived = batches = 0
+            for ids, eligible in self._eligible_batches(db):
+                archived += self._move(db, ids, eligible)
+                batches += 1
+                if max_batches is not None and batches >= max_batches:
+                    break
+            seconds = time.perf_counter() - started
+
+            self._runs += 1
+            self._archived += archived
+            self._batches += batches
+            self._seconds += seconds
+            self._last_run = {
+                "archived": archived,
+                "batches": batches,
+                "seconds": round(seconds, 3),
+                "rows_per_second": round(archived / seconds, 1) if archived and seconds > 0 else 0.0,
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+            }
+        if archived:
+            logger.info(f"Archived {archived} closed issues in {batches} batches ({seconds:.2f} s)")
+        return self._last_run
+
+    def _eligible_batches(self, db: Session):
+        """(ids, eligibility conditions) of the issues to archive, batch_size at a time in id order."""
+        # The newest sealed issue stays hot: it is the chain head, and SQLite
+        # would otherwise hand its id out again
+        head_id = db.execute(select(func.max(issues.c.id)).where(issues.c.integrity_hash.isnot(None))).scalar()
+        if head_id is None:
+            head_id = db.execute(select(func.max(issues.c.id))).scalar()
+        if head_id is None:
+            return
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.after_days)
+        eligible = (
+            issues.c.id < head_id,
+            issues.c.status.in_(RESOLVED_STATUSES),
+            func.coalesce(issues.c.resolved_at, issues.c.verified_at, issues.c.created_at) < cutoff,
+            ~exists().where(Grievance.issue_id == issues.c.id),
+        )
+        last_id = 0
+        while True:
+            ids = db.execute(
+                select(issues.c.id).where(issues.c.id > last_id, *eligible)
+                .order_by(issues.c.id).limit(self.batch_size)
+                # Postgres: a concurrent status change waits for the move (or is skipped)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+            if not ids:
+                return
+            yield ids, eligible
+            last_id = ids[-1]
+
+    def _move(self, db: Session, ids: List[int], eligible: tuple) -> int:
+        """Copy one batch (with its action plans) into the archive and delete it, in one transaction."""
+        # Votes not flushed yet would match no row once the issues are gone: add them to the archive rows
+        pending = upvote_buffer.take_many(ids)
+        archived_votes = {}
+        try:
+            # The conditions are checked again: on SQLite the write transaction starts
+            # here, and an issue may have been reopened since the ids were read
+            db.execute(archive.insert().from_select(
+                ISSUE_COLUMNS + ["action_plan", "archived_at"],
+                select(
+                    *(issues.c[name] for name in ISSUE_COLUMNS), action_plans.c.plan,
+                    literal(datetime.now(timezone.utc), DateTime)
+                )
+                .select_from(issues.outerjoin(action_plans, action_plans.c.issue_id == issues.c.id))
+                .where(issues.c.id.in_(ids), *eligible)
+            ))
+            copied = select(archive.c.id).where(archive.c.id.in_(ids))
+            if pending:
+                copied_ids = set(db.execute(copied.where(archive.c.id.in_(list(pending)))).scalars())
+                archived_votes = {issue_id: delta for issue_id, delta in pending.items() if issue_id in copied_ids}
+                if archived_votes:
+                    db.connection().execute(_increment_archived_upvotes, [
+                        {"issue_id": issue_id, "delta": delta} for issue_id, delta in archived_votes.items()
+                    ])
+            db.execute(action_plans.delete().where(action_plans.c.issue_id.in_(copied)))
+            moved = db.execute(issues.delete().where(issues.c.id.in_(copied))).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            upvote_buffer.restore(pending)
+            raise
+        # Issues that stayed hot (reopened meanwhile) get their votes through the next flush
+        upvote_buffer.restore({issue_id: delta for issue_id, delta in pending.items() if issue_id not in archived_votes})
+        # Cached pages listing these issues (recent issues) must not serve them from the hot table
+        recent_issues_cache.invalidate_tags(TAG_ISSUES_RECENT, *(issue_tag(issue_id) for issue_id in ids))
+        return moved
+
+    def get_stats(self) -> dict:
+        return {
+            "after_days": self.after_days,
+            "batch_size": self.batch_size,
+            "runs": self._runs,
+            "archived": self._archived,
+            "batches": self._batches,
+            "rows_per_second": round(self._archived / self._seconds, 1) if self._seconds > 0 else 0.0,
+            "last_run": self._last_run,
+        }
+
+
+# Global instance run periodically by main.py
+issue_archiver = IssueArchiver()
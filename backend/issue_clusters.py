@@ -0,0 +1,288 @@
+"""
+Incrementally maintained clusters of open issues.
+
+Two open issues belong to the same cluster when they are linked by a chain of
+issues each within CLUSTER_EPS_METERS of the next. This is exactly what
+cluster_issues_dbscan computes (DBSCAN with min_samples=1), but instead of
+re-running it over every issue, the assignment is kept up to date as issues
+are opened and closed:
+
+- a new issue joins the clusters of its neighbours, merging them if it
+  bridges several (members of the smaller clusters are relabelled);
+- a removed issue can only split its own cluster, so connected components are
+  recomputed among that cluster's members and nothing else.
+
+The index subscribes to the open issue index (spatial_index.open_issue_index)
+and so follows the same startup build and session hooks.
+"""
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.models import Issue
+from backend.spatial_index import OpenIssueRecord, open_issue_index, NEARBY_ISSUE_COLUMNS
+from backend.spatial_utils import (
+    grid_cell, grid_cells_in_radius, equirectangular_distance,
+    cluster_issues_dbscan, calculate_cluster_centroid, get_cluster_representative
+)
+
+logger = logging.getLogger(__name__)
+
+# Link distance between issues of the same cluster (same default as cluster_issues_dbscan)
+CLUSTER_EPS_METERS = 30.0
+
+
+class ClusterSummary(NamedTuple):
+    """Precomputed view of one cluster."""
+    cluster_id: Optional[int]
+    size: int
+    centroid_latitude: float
+    centroid_longitude: float
+    representative: Any
+
+
+class IssueClusterIndex:
+    """
+    Thread-safe cluster assignment of open issues.
+    Issues are bucketed in grid cells of eps_meters so that neighbour lookups
+    only look at the 3x3 block of cells around an issue.
+    """
+
+    def __init__(self, eps_meters: float = CLUSTER_EPS_METERS):
+        self._eps = eps_meters
+        self._records: Dict[int, OpenIssueRecord] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._cluster_of: Dict[int, int] = {}
+        self._members: Dict[int, Set[int]] = {}
+        self._summaries: Dict[int, ClusterSummary] = {}
+        self._next_cluster_id = 1
+        self._lock = threading.RLock()
+        self._ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    # --- Listener interface (called by OpenIssueIndex) ---
+
+    def reset(self, records: Iterable[OpenIssueRecord]) -> None:
+        """Recompute all clusters from scratch."""
+        with self._lock:
+            self._records = {}
+            self._cells = {}
+            self._cluster_of = {}
+            self._members = {}
+            self._summaries = {}
+            for record in records:
+                self._records[record.id] = record
+                self._cells.setdefault(self._cell_of(record), set()).add(record.id)
+
+            for component in self._components(set(self._records)):
+                self._assign_new_cluster(component)
+            self._ready = True
+
+    def upsert(self, record: OpenIssueRecord) -> None:
+        with self._lock:
+            existing = self._records.get(record.id)
+            if existing is not None:
+                if (existing.latitude, existing.longitude) == (record.latitude, record.longitude):
+                    # Same position (e.g. an upvote): membership is unchanged
+                    self._records[record.id] = record
+                    self._summaries.pop(self._cluster_of[record.id], None)
+                    return
+                self._discard_locked(record.id)
+            self._add_locked(record)
+
+    def discard(self, issue_id: int) -> None:
+        with self._lock:
+            self._discard_locked(issue_id)
+
+    # --- Queries ---
+
+    def clusters_in_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                         min_size: int = 1, limit: Optional[int] = None) -> List[ClusterSummary]:
+        """Clusters whose centroid lies inside the bounding box, largest first."""
+        with self._lock:
+            results = []
+            for cluster_id, members in self._members.items():
+                if len(members) < min_size:
+                    continue
+                summary = self._summary_locked(cluster_id)
+                if min_lat <= summary.centroid_latitude <= max_lat and min_lon <= summary.centroid_longitude <= max_lon:
+                    results.append(summary)
+
+        results.sort(key=lambda summary: (-summary.size, summary.cluster_id))
+        return results[:limit] if limit is not None else results
+
+    def cluster_of(self, issue_id: int) -> Optional[int]:
+        with self._lock:
+            return self._cluster_of.get(issue_id)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "clustered_issues": len(self._records),
+                "clusters": len(self._members),
+                "largest_cluster": max((len(members) for members in self._members.values()), default=0),
+                "eps_meters": self._eps,
+            }
+
+    # --- Internals (lock held) ---
+
+    def _cell_of(self, record: OpenIssueRecord) -> Tuple[int, int]:
+        return grid_cell(record.latitude, record.longitude, self._eps)
+
+    def _neighbours(self, record: OpenIssueRecord, within: Optional[Set[int]] = None) -> List[int]:
+        """Ids of issues within eps of record (optionally restricted to `within`)."""
+        neighbours = []
+        for cell in grid_cells_in_radius(record.latitude, record.longitude, self._eps, self._eps):
+            for other_id in self._cells.get(cell, ()):
+                if other_id == record.id or (within is not None and other_id not in within):
+                    continue
+                other = self._records[other_id]
+                if equirectangular_distance(record.latitude, record.longitude, other.latitude, other.longitude) <= self._eps:
+                    neighbours.append(other_id)
+        return neighbours
+
+    def _components(self, ids: Set[int]) -> List[Set[int]]:
+        """Connected components of the eps-neighbour graph restricted to ids."""
+        components = []
+        unvisited = set(ids)
+        while unvisited:
+            start = unvisited.pop()
+            component = {start}
+            queue = deque([start])
+            while queue:
+                current = self._records[queue.popleft()]
+                for neighbour_id in self._neighbours(current, within=unvisited):
+                    unvisited.discard(neighbour_id)
+                    component.add(neighbour_id)
+                    queue.append(neighbour_id)
+            components.append(component)
+        return components
+
+    def _assign_new_cluster(self, members: Set[int]) -> int:
+        cluster_id = self._next_cluster_id
+        self._next_cluster_id += 1
+        self._members[cluster_id] = members
+        for issue_id in members:
+            self._cluster_of[issue_id] = cluster_id
+        return cluster_id
+
+    def _add_locked(self, record: OpenIssueRecord) -> None:
+        self._records[record.id] = record
+        self._cells.setdefault(self._cell_of(record), set()).add(record.id)
+
+        touched = {self._cluster_of[neighbour_id] for neighbour_id in self._neighbours(record)}
+        if not touched:
+            self._assign_new_cluster({record.id})
+            return
+
+        # Merge into the largest touched cluster so the fewest issues are relabelled
+        target = max(touched, key=lambda cluster_id: (len(self._members[cluster_id]), -cluster_id))
+        for cluster_id in touched - {target}:
+            members = self._members.pop(cluster_id)
+            self._summaries.pop(cluster_id, None)
+            for issue_id in members:
+                self._cluster_of[issue_id] = target
+            self._members[target] |= members
+
+        self._members[target].add(record.id)
+        self._cluster_of[record.id] = target
+        self._summaries.pop(target, None)
+
+    def _discard_locked(self, issue_id: int) -> None:
+        record = self._records.pop(issue_id, None)
+        if record is None:
+            return
+        cell = self._cell_of(record)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(issue_id)
+            if not bucket:
+                del self._cells[cell]
+
+        cluster_id = self._cluster_of.pop(issue_id)
+        self._summaries.pop(cluster_id, None)
+        members = self._members[cluster_id]
+        members.discard(issue_id)
+        if not members:
+            del self._members[cluster_id]
+            return
+
+        # The removed issue may have been the only link between parts of its cluster
+        components = self._components(members)
+        if len(components) == 1:
+            return
+        components.sort(key=len, reverse=True)
+        self._members[cluster_id] = components[0]
+        for component in components[1:]:
+            self._assign_new_cluster(component)
+
+    def _summary_locked(self, cluster_id: int) -> ClusterSummary:
+        summary = self._summaries.get(cluster_id)
+        if summary is None:
+            members = [self._records[issue_id] for issue_id in self._members[cluster_id]]
+            centroid_lat, centroid_lon = calculate_cluster_centroid(members)
+            summary = ClusterSummary(
+                cluster_id, len(members), centroid_lat, centroid_lon,
+                get_cluster_representative(members)
+            )
+            self._summaries[cluster_id] = summary
+        return summary
+
+
+# Global instance, maintained through the open issue index
+issue_cluster_index = IssueClusterIndex()
+open_issue_index.add_listener(issue_cluster_index)
+
+
+def find_issue_clusters(db: Session, min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                        min_size: int = 1, limit: Optional[int] = None) -> List[Tuple[ClusterSummary, Any]]:
+    """
+    Clusters of open issues with their centroid inside the bounding box, largest first.
+    Returns (summary, representative row) tuples; rows carry NEARBY_ISSUE_COLUMNS.
+
+    Served from the precomputed clusters when the open issue index is ready.
+    Otherwise the open issues inside the box are clustered on the fly with
+    cluster_issues_dbscan (clusters crossing the box edge are then cut).
+    """
+    if open_issue_index.needs_rebuild and open_issue_index.tracks(db):
+        open_issue_index.rebuild(db)
+
+    if not (open_issue_index.is_ready and issue_cluster_index.is_ready):
+        rows = db.query(*NEARBY_ISSUE_COLUMNS).filter(
+            Issue.status == "open",
+            Issue.latitude >= min_lat, Issue.latitude <= max_lat,
+            Issue.longitude >= min_lon, Issue.longitude <= max_lon
+        ).all()
+        results = []
+        for cluster in cluster_issues_dbscan(rows, eps_meters=CLUSTER_EPS_METERS):
+            if len(cluster) < min_size:
+                continue
+            centroid_lat, centroid_lon = calculate_cluster_centroid(cluster)
+            representative = get_cluster_representative(cluster)
+            # Ad-hoc clusters have no stable id
+            results.append((ClusterSummary(None, len(cluster), centroid_lat, centroid_lon, representative), representative))
+        results.sort(key=lambda item: -item[0].size)
+        return results[:limit] if limit is not None else results
+
+    summaries = issue_cluster_index.clusters_in_bbox(min_lat, min_lon, max_lat, max_lon, min_size, limit)
+    if not summaries:
+        return []
+
+    rows = db.query(*NEARBY_ISSUE_COLUMNS).filter(
+        Issue.id.in_([summary.representative.id for summary in summaries]),
+        Issue.status == "open"
+    ).all()
+    rows_by_id = {row.id: row for row in rows}
+
+    # Representatives missing from the result were closed by another process
+    return [
+        (summary, rows_by_id[summary.representative.id])
+        for summary in summaries if summary.representative.id in rows_by_id
+    ]
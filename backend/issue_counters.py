@@ -0,0 +1,193 @@
+"""
+Issue counts maintained on write, for /api/stats.
+
+Counting the issues table (total, resolved, GROUP BY category) costs time
+linear in its size. Instead the issue_counters table holds one row per count:
+
+    total               every issue
+    status:<status>     issues per status
+    category:<category> issues per category
+
+Counters are updated in the same transaction as the write that changes them:
+- ORM inserts, deletes and status/category changes are picked up by a session
+  hook at flush time.
+- Bulk UPDATE statements are invisible to session hooks, so the routers call
+  record_status_change() next to them.
+
+Reading the stats is then a scan of a table with O(categories) rows.
+Archived issues (issue_archive.py) keep counting; moving them does not touch
+the counters.
+Writes that bypass both paths (raw SQL, bulk deletes) make the counters drift;
+reconcile_issue_counters() recounts the issues table and repairs them. It runs
+at startup and every ISSUE_COUNTER_RECONCILE_SECONDS.
+"""
+import logging
+import os
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, func, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.models import Issue, IssueArchive, IssueCounter
+
+logger = logging.getLogger(__name__)
+
+ISSUE_COUNTER_RECONCILE_SECONDS = float(os.environ.get("ISSUE_COUNTER_RECONCILE_SECONDS", "3600"))
+
+TOTAL = "total"
+RESOLVED_STATUSES = ("resolved", "verified")
+_DEFAULT_STATUS = Issue.__table__.c.status.default.arg
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def status_counter(status: Optional[str]) -> str:
+    return f"status:{status}"
+
+
+def category_counter(category: Optional[str]) -> Optional[str]:
+    # Uncategorised issues only count towards the total
+    return f"category:{category}" if category is not None else None
+
+
+def issue_deltas(status: Optional[str], category: Optional[str], sign: int) -> Dict[str, int]:
+    """Counter changes for adding (sign=1) or removing (sign=-1) one issue."""
+    deltas = {TOTAL: sign, status_counter(status): sign}
+    if category_counter(category):
+        deltas[category_counter(category)] = sign
+    return deltas
+
+
+def apply_counter_deltas(db: Session, deltas: Dict[str, int]) -> None:
+    """Add deltas to the counters within db's current transaction (atomic increments)."""
+    deltas = {name: delta for name, delta in deltas.items() if name is not None and delta}
+    if not deltas:
+        return
+
+    connection = db.connection()
+    insert = _UPSERT_INSERTS.get(connection.dialect.name)
+    for name, delta in sorted(deltas.items()):  # fixed order: no lock-order deadlocks between writers
+        if insert is not None:
+            statement = insert(IssueCounter).values(name=name, count=delta)
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=[IssueCounter.name],
+                set_={"count": IssueCounter.count + statement.excluded.count}
+            ))
+        else:
+            result = connection.execute(
+                update(IssueCounter).where(IssueCounter.name == name).values(count=IssueCounter.count + delta)
+            )
+            if result.rowcount == 0:
+                connection.execute(IssueCounter.__table__.insert().values(name=name, count=delta))
+
+
+def record_status_change(db: Session, old_status: Optional[str], new_status: Optional[str]) -> None:
+    """Move one issue between status counters (for bulk UPDATEs the session hook cannot see)."""
+    if old_status != new_status:
+        apply_counter_deltas(db, {status_counter(old_status): -1, status_counter(new_status): 1})
+
+
+def read_issue_counters(db: Session) -> Dict[str, int]:
+    return {name: count for name, count in db.query(IssueCounter.name, IssueCounter.count)}
+
+
+def stats_from_counters(counters: Dict[str, int]) -> dict:
+    """total/resolved/pending/by-category figures from a counters mapping."""
+    total = counters.get(TOTAL, 0)
+    resolved = sum(counters.get(status_counter(status), 0) for status in RESOLVED_STATUSES)
+    by_category = {
+        name[len("category:"):]: count
+        for name, count in counters.items()
+        if name.startswith("category:") and count > 0
+    }
+    return {
+        "total_issues": total,
+        "resolved_issues": resolved,
+        "pending_issues": total - resolved,
+        "issues_by_category": by_category,
+    }
+
+
+def count_issues(db: Session) -> Dict[str, int]:
+    """Exact counters computed from the issues table and its archive (archived issues still count)."""
+    counts = Counter()
+    for model in (Issue, IssueArchive):
+        counts[TOTAL] += db.query(func.count(model.id)).scalar() or 0
+        for status, count in db.query(model.status, func.count(model.id)).group_by(model.status):
+            counts[status_counter(status)] += count
+        for category, count in db.query(model.category, func.count(model.id)).group_by(model.category):
+            if category_counter(category):
+                counts[category_counter(category)] += count
+    return dict(counts)
+
+
+def reconcile_issue_counters(db: Session, repair: bool = True) -> dict:
+    """
+    Recount the issues table and compare it with the counters. With repair,
+    drifted counters are overwritten with the recounted values (and committed).
+    """
+    expected = count_issues(db)
+    stored = read_issue_counters(db)
+    drift = {
+        name: {"stored": stored.get(name, 0), "expected": expected.get(name, 0)}
+        for name in set(expected) | set(stored)
+        if stored.get(name, 0) != expected.get(name, 0)
+    }
+
+    if drift:
+        logger.warning(f"Issue counter drift in {len(drift)} counters: {sorted(drift)[:10]}")
+        if repair:
+            for name in drift:
+                if name in stored:
+                    db.query(IssueCounter).filter(IssueCounter.name == name).update(
+                        {IssueCounter.count: expected.get(name, 0)}, synchronize_session=False
+                    )
+                else:
+                    db.add(IssueCounter(name=name, count=expected[name]))
+            db.commit()
+
+    return {"consistent": not drift, "counters": len(expected), "drift": drift, "repaired": bool(drift) and repair}
+
+
+# --- Session hook applying ORM writes to the counters in the same transaction ---
+
+def _changed_value(issue: Issue, attribute: str):
+    """(old, new) for a modified attribute, or None when it did not change."""
+    history = inspect(issue).attrs[attribute].history
+    if not history.has_changes():
+        return None
+    old = history.deleted[0] if history.deleted else None
+    new = history.added[0] if history.added else None
+    return (old, new) if old != new else None
+
+
+def _collect_deltas(new: Iterable, dirty: Iterable, deleted: Iterable) -> Dict[str, int]:
+    deltas: Dict[str, int] = Counter()
+    for obj in new:
+        if isinstance(obj, Issue):
+            # Column defaults are only applied by the INSERT itself
+            deltas.update(issue_deltas(obj.status or _DEFAULT_STATUS, obj.category, 1))
+    for obj in deleted:
+        if isinstance(obj, Issue):
+            deltas.update(issue_deltas(obj.status, obj.category, -1))
+    for obj in dirty:
+        if not isinstance(obj, Issue):
+            continue
+        status = _changed_value(obj, "status")
+        if status:
+            deltas.update({status_counter(status[0]): -1, status_counter(status[1]): 1})
+        category = _changed_value(obj, "category")
+        if category:
+            deltas.update({category_counter(category[0]): -1, category_counter(category[1]): 1})
+    return deltas
+
+
+# before_flush rather than after_flush: deleted rows can still be loaded here
+@event.listens_for(Session, "before_flush")
+def _count_issue_changes(session, flush_context, instances):
+    deltas = _collect_deltas(session.new, session.dirty, session.deleted)
+    if deltas:
+        apply_counter_deltas(session, deltas)
@@ -0,0 +1,215 @@
+"""
+Full-text search over issue descriptions, locations and categories.
+
+SQLite: an external-content FTS5 table (issues_fts) over the issues table,
+kept in sync by triggers so that ORM writes, bulk updates and raw SQL all
+maintain it, like the R*Tree index in spatial_utils. Results are ranked by
+bm25 (lower is better).
+
+PostgreSQL: a generated tsvector column (issues.search_vector) with a GIN
+index, queried with websearch_to_tsquery and ranked by ts_rank_cd (higher is
+better).
+
+Other databases, and SQLite builds without FTS5, fall back to LIKE scans.
+Results are paginated with keyset cursors on (rank, id).
+"""
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import Float, cast, column, event, func, literal, literal_column, or_, table, text
+from sqlalchemy.orm import Session
+
+from backend.models import Issue
+from backend.pagination import paginate
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_TABLE = "issues_fts"
+SEARCH_INDEX_TRIGGERS = ("issues_fts_insert", "issues_fts_update", "issues_fts_delete")
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+_issues_fts = table(SEARCH_INDEX_TABLE, column("rowid"))
+
+# Porter stemming: "potholes" finds "pothole"
+_SEARCH_INDEX_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE}
+        USING fts5(description, location, category, content='issues', content_rowid='id',
+                   tokenize='porter unicode61 remove_diacritics 2')""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_fts_insert AFTER INSERT ON issues
+        BEGIN
+            INSERT INTO {SEARCH_INDEX_TABLE} (rowid, description, location, category)
+            VALUES (NEW.id, NEW.description, NEW.location, NEW.category);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_fts_update AFTER UPDATE OF description, location, category ON issues
+        BEGIN
+            INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}, rowid, description, location, category)
+            VALUES ('delete', OLD.id, OLD.description, OLD.location, OLD.category);
+            INSERT INTO {SEARCH_INDEX_TABLE} (rowid, description, location, category)
+            VALUES (NEW.id, NEW.description, NEW.location, NEW.category);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_fts_delete AFTER DELETE ON issues
+        BEGIN
+            INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}, rowid, description, location, category)
+            VALUES ('delete', OLD.id, OLD.description, OLD.location, OLD.category);
+        END""",
+]
+
+_SEARCH_INDEX_REBUILD = f"INSERT INTO {SEARCH_INDEX_TABLE} ({SEARCH_INDEX_TABLE}) VALUES ('rebuild')"
+
+_POSTGRES_SEARCH_DDL = [
+    f"""ALTER TABLE issues ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+        GENERATED ALWAYS AS (to_tsvector('english',
+            coalesce(description, '') || ' ' || coalesce(location, '') || ' ' || coalesce(category, ''))) STORED""",
+    f"CREATE INDEX IF NOT EXISTS ix_issues_search_vector ON issues USING GIN ({SEARCH_VECTOR_COLUMN})",
+]
+
+# Per-engine cache of the search backend ("fts5", "tsvector" or "like")
+_search_backend = {}
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+MAX_QUERY_TERMS = 16
+
+
+def _search_index_installed(conn) -> bool:
+    names = {
+        row[0] for row in conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        )
+    }
+    return SEARCH_INDEX_TABLE in names and all(t in names for t in SEARCH_INDEX_TRIGGERS)
+
+
+def ensure_search_index(conn) -> bool:
+    """
+    Create (or repair) the full-text index and backfill it.
+    Returns True if an index is available after the call.
+    """
+    try:
+        if conn.dialect.name == "postgresql":
+            for statement in _POSTGRES_SEARCH_DDL:
+                conn.execute(text(statement))
+            _search_backend[conn.engine] = "tsvector"
+            return True
+        if conn.dialect.name != "sqlite":
+            return False
+
+        if _search_index_installed(conn):
+            _search_backend[conn.engine] = "fts5"
+            return True
+        # Missing triggers mean the index missed writes: rebuild it from the issues table
+        for statement in _SEARCH_INDEX_DDL:
+            conn.execute(text(statement))
+        conn.execute(text(_SEARCH_INDEX_REBUILD))
+        _search_backend[conn.engine] = "fts5"
+        logger.info("Search index: created FTS5 index over issues.")
+        return True
+    except Exception as e:
+        # SQLite builds without FTS5 fall back to LIKE scans
+        logger.warning(f"Full-text search index unavailable, using LIKE scans: {e}")
+        _search_backend[conn.engine] = "like"
+        return False
+
+
+def search_backend(db: Session) -> str:
+    """Check (once per engine) which search implementation this session can use."""
+    engine = db.get_bind().engine
+    if engine not in _search_backend:
+        if engine.dialect.name == "sqlite":
+            installed = _search_index_installed(db.connection())
+            _search_backend[engine] = "fts5" if installed else "like"
+        elif engine.dialect.name == "postgresql":
+            installed = db.connection().execute(text(
+                "SELECT 1 FROM information_schema.columns WHERE table_name = 'issues' AND column_name = :name"
+            ), {"name": SEARCH_VECTOR_COLUMN}).first()
+            _search_backend[engine] = "tsvector" if installed else "like"
+        else:
+            _search_backend[engine] = "like"
+    return _search_backend[engine]
+
+
+def search_terms(q: str) -> List[str]:
+    """Words of a user query; query syntax characters are dropped."""
+    return _TOKEN.findall(q)[:MAX_QUERY_TERMS]
+
+
+def fts5_query(terms: List[str]) -> str:
+    # Each word quoted (no user-controlled FTS5 syntax), all required; the last
+    # one is a prefix so that search-as-you-type matches partial words
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search_issues(db: Session, q: str, status: Optional[str] = None,
+                  bbox: Optional[Tuple[float, float, float, float]] = None,
+                  limit: int = 20, cursor: Optional[str] = None) -> List[tuple]:
+    """
+    One page of issues matching q, best match first, as rows of
+    (Issue summary columns..., rank). bbox is (min_lon, min_lat, max_lon, max_lat).
+    """
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    return search_query(db, terms, search_backend(db), status, bbox, limit, cursor).all()
+
+
+def search_query(db: Session, terms: List[str], backend: str, status: Optional[str] = None,
+                 bbox: Optional[Tuple[float, float, float, float]] = None,
+                 limit: int = 20, cursor: Optional[str] = None):
+    """The page query of search_issues() for a search backend ("fts5", "tsvector" or "like")."""
+    columns = (
+        Issue.id, Issue.category, Issue.description, Issue.created_at, Issue.image_path,
+        Issue.status, Issue.upvotes, Issue.location, Issue.latitude, Issue.longitude,
+    )
+    if backend == "fts5":
+        fts = literal_column(SEARCH_INDEX_TABLE)
+        rank = func.bm25(fts)
+        query = (
+            db.query(*columns, rank.label("rank"))
+            .select_from(Issue)
+            .join(_issues_fts, _issues_fts.c.rowid == Issue.id)
+            .filter(fts.op("MATCH")(fts5_query(terms)))
+        )
+        descending = False
+    elif backend == "tsvector":
+        tsquery = func.websearch_to_tsquery("english", " ".join(terms))
+        vector = literal_column(f"issues.{SEARCH_VECTOR_COLUMN}")
+        # ts_rank_cd returns real: compared with the float8 cursor value, rows of equal rank
+        # would fail both < and =, so rank, order and compare in double precision
+        rank = cast(func.ts_rank_cd(vector, tsquery), Float(53))
+        query = db.query(*columns, rank.label("rank")).filter(vector.op("@@")(tsquery))
+        descending = True
+    else:
+        # No index: every term must appear in one of the searched columns
+        rank = literal(0.0)
+        query = db.query(*columns, rank.label("rank"))
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.filter(or_(
+                Issue.description.ilike(pattern), Issue.location.ilike(pattern), Issue.category.ilike(pattern)
+            ))
+        descending = False
+
+    if status:
+        query = query.filter(Issue.status == status)
+    if bbox:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        query = query.filter(
+            Issue.latitude.between(min_lat, max_lat), Issue.longitude.between(min_lon, max_lon)
+        )
+
+    return paginate(query, (rank, Issue.id), (float, int), limit, cursor=cursor, descending=descending)
+
+
+@event.listens_for(Issue.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    ensure_search_index(connection)
+
+
+@event.listens_for(Issue.__table__, "after_drop")
+def _drop_search_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}"))
+    _search_backend.pop(connection.engine, None)
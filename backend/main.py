@@ -20,13 +20,24 @@ import httpx
 import logging
 import asyncio
 
-from backend.database import Base, engine
+from backend.database import Base, engine, run_with_session
 from backend.ai_factory import create_all_ai_services
 from backend.ai_interfaces import initialize_ai_services
 from backend.bot import start_bot_thread, stop_bot_thread
-from backend.init_db import migrate_db
+from backend.migrations import ensure_schema_current
+from backend.spatial_index import (
+    build_open_issue_index, check_open_issue_index, open_issue_index,
+    OPEN_ISSUE_INDEX_CHECK_SECONDS, OPEN_ISSUE_INDEX_REFRESH_SECONDS
+)
+from backend.issue_counters import reconcile_issue_counters, ISSUE_COUNTER_RECONCILE_SECONDS
+from backend.chain_audit import create_checkpoints, CHAIN_CHECKPOINT_SECONDS
+from backend.upvote_buffer import upvote_buffer
+from backend.issue_archive import issue_archiver, ISSUE_ARCHIVE_SECONDS
 from backend.maharashtra_locator import load_maharashtra_pincode_data, load_maharashtra_mla_data
 from backend.exceptions import EXCEPTION_HANDLERS
+from backend.rate_limiter import RateLimitMiddleware
+from backend.sql_instrumentation import SQLInstrumentationMiddleware, SQL_DEBUG_HEADER_NAMES, track_queries
+from backend.pagination import NEXT_CURSOR_HEADER
 from backend.routers import issues, detection, grievances, utility, auth, admin, analysis
 from backend.grievance_service import GrievanceService
 import backend.dependencies
@@ -38,8 +49,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def warm_dashboard_caches():
+    """Precompute the dashboard cache entries so the first visitors after a deploy hit warm caches"""
+    run_with_session(utility.get_cached_stats)
+    run_with_session(utility.get_cached_leaderboard)
+    # Default page requested by the home screen
+    run_with_session(issues.get_cached_recent_issues, 10, 0)
+
+async def run_periodically(interval_seconds: float, func, description: str):
+    """Run func(db) in the threadpool every interval_seconds until cancelled at shutdown"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            # Statements are reported under the job's description (see /admin/sql-report)
+            with track_queries(description):
+                await run_in_threadpool(run_with_session, func)
+        except Exception as e:
+            logger.error(f"{description} failed: {e}", exc_info=True)
+
 async def background_initialization(app: FastAPI):
     """Perform non-critical startup tasks in background to speed up app availability"""
+    # 0. Warm dashboard caches (stats, leaderboard, recent issues)
+    try:
+        await run_in_threadpool(warm_dashboard_caches)
+        logger.info("Dashboard caches warmed.")
+    except Exception as e:
+        logger.error(f"Dashboard cache warming failed: {e}", exc_info=True)
+
     try:
         # 1. AI Services initialization
         # These can take a few seconds due to imports and configuration
@@ -75,12 +111,48 @@ async def lifespan(app: FastAPI):
     # Startup: Database setup (Blocking but necessary for app consistency)
     try:
         await run_in_threadpool(Base.metadata.create_all, bind=engine)
-        await run_in_threadpool(migrate_db)
+        # Single version check; pending migrations only run when AUTO_MIGRATE is on
+        await run_in_threadpool(ensure_schema_current, engine)
         logger.info("Database initialized successfully.")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}", exc_info=True)
         # We continue to allow health checks even if DB has issues (for debugging)
 
+    # Startup: Build the in-memory open issue index used for spatial deduplication
+    try:
+        await run_in_threadpool(build_open_issue_index)
+    except Exception as e:
+        # Lookups fall back to database queries until the index is rebuilt
+        logger.error(f"Open issue index build failed: {e}", exc_info=True)
+
+    # Startup: Backfill/repair the issue counters behind /api/stats
+    try:
+        report = await run_in_threadpool(run_with_session, reconcile_issue_counters)
+        logger.info(f"Issue counters reconciled ({report['counters']} counters, {len(report['drift'])} repaired).")
+    except Exception as e:
+        logger.error(f"Issue counter reconciliation failed: {e}", exc_info=True)
+
+    app.state.periodic_tasks = [
+        # Repair drift in the write-maintained issue counters (writes that bypassed the ORM hooks)
+        asyncio.create_task(run_periodically(
+            ISSUE_COUNTER_RECONCILE_SECONDS, reconcile_issue_counters, "Issue counter reconciliation")),
+        # Merkle checkpoints over complete blocks of the integrity chain
+        asyncio.create_task(run_periodically(
+            CHAIN_CHECKPOINT_SECONDS, create_checkpoints, "Chain checkpointing")),
+        # Move long-closed issues out of the hot issues table
+        asyncio.create_task(run_periodically(
+            ISSUE_ARCHIVE_SECONDS, issue_archiver.archive, "Issue archiving")),
+        # Exchange the ids of issues opened, closed or upvoted with the other worker processes
+        asyncio.create_task(run_periodically(
+            OPEN_ISSUE_INDEX_REFRESH_SECONDS, open_issue_index.refresh, "Open issue index refresh")),
+        # Full comparison of the open issue index with the database (rebuilt on drift)
+        asyncio.create_task(run_periodically(
+            OPEN_ISSUE_INDEX_CHECK_SECONDS, check_open_issue_index, "Open issue index consistency check")),
+    ]
+
+    # Startup: Batched writer for buffered upvotes
+    upvote_buffer.start()
+
     # Startup: Initialize Grievance Service (needed for escalation engine)
     try:
         grievance_service = GrievanceService()
@@ -94,6 +166,15 @@ async def lifespan(app: FastAPI):
     
     yield
     
+    for task in app.state.periodic_tasks:
+        task.cancel()
+
+    # Shutdown: Write the upvotes still buffered in memory
+    try:
+        await upvote_buffer.stop()
+    except Exception as e:
+        logger.error(f"Flushing buffered upvotes at shutdown failed: {e}", exc_info=True)
+
     # Shutdown: Close Shared HTTP Client
     if app.state.http_client:
         await app.state.http_client.aclose()
@@ -153,12 +234,23 @@ if not is_production:
     if frontend_url not in allowed_origins:
         allowed_origins.append(frontend_url)
 
+# Query count, DB time and N+1 detection per request (inside the rate limiter:
+# rejected requests run no queries)
+app.add_middleware(SQLInstrumentationMiddleware)
+
+# Rejects over-limit uploads/detection/auth requests before the body is read.
+# Added before CORS so that 429 responses still carry CORS headers.
+app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    # Lets browser clients read the cursor of the next page on list endpoints
+    # (and the per-request query stats in debug mode)
+    expose_headers=[NEXT_CURSOR_HEADER, *SQL_DEBUG_HEADER_NAMES],
 )
 
 app.add_middleware(GZipMiddleware, minimum_size=500)
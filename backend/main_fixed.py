@@ -40,7 +40,7 @@ from backend.maharashtra_locator import (
     find_constituency_by_pincode,
     find_mla_by_constituency
 )
-from backend.init_db import migrate_db
+from backend.migrations import ensure_schema_current
 from backend.pothole_detection import detect_potholes, validate_image_for_processing
 from backend.garbage_detection import detect_garbage
 from backend.local_ml_service import (
@@ -153,8 +153,8 @@ async def process_action_plan_background(issue_id: int, description: str, catego
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Migrate DB
-    migrate_db()
+    # Startup: Check the schema version (applies pending migrations when AUTO_MIGRATE is set)
+    ensure_schema_current(engine)
 
     # Startup: Initialize Shared HTTP Client for external APIs (Connection Pooling)
     app.state.http_client = httpx.AsyncClient()
@@ -0,0 +1,68 @@
+"""
+Binary Merkle trees over hex sha256 digests.
+
+Leaves and interior nodes are hashed with different prefixes (0x00 and 0x01),
+so an interior node can never be passed off as a leaf. A node without a
+sibling at the end of an odd-sized level is promoted to the next level
+unchanged. A proof is the list of sibling hashes from the leaf up to the root,
+at most ceil(log2(n)) of them.
+"""
+import hashlib
+from typing import Dict, List, Optional, Sequence
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Root of a tree without leaves
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def leaf_hash(data: str) -> str:
+    return hashlib.sha256(LEAF_PREFIX + data.encode()).hexdigest()
+
+
+def node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def _next_level(level: Sequence[str]) -> List[str]:
+    parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def merkle_root(leaves: Sequence[str]) -> str:
+    """Root over already hashed leaves."""
+    if not leaves:
+        return EMPTY_ROOT
+    level = list(leaves)
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+
+def inclusion_proof(leaves: Sequence[str], index: int) -> List[Dict[str, str]]:
+    """Sibling path of leaves[index]: [{"position": "left"|"right", "hash": ...}, ...] from the bottom up."""
+    if not 0 <= index < len(leaves):
+        raise IndexError(f"Leaf {index} is outside a tree of {len(leaves)} leaves")
+    proof = []
+    level = list(leaves)
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({"position": "left" if sibling < index else "right", "hash": level[sibling]})
+        level = _next_level(level)
+        index //= 2
+    return proof
+
+
+def root_from_proof(leaf: str, proof: Sequence[Dict[str, str]]) -> str:
+    node = leaf
+    for step in proof:
+        node = node_hash(step["hash"], node) if step["position"] == "left" else node_hash(node, step["hash"])
+    return node
+
+
+def verify_inclusion(leaf: str, proof: Sequence[Dict[str, str]], root: Optional[str]) -> bool:
+    return root is not None and root_from_proof(leaf, proof) == root
@@ -0,0 +1,246 @@
+"""
+Versioned schema migrations.
+
+Each migration is an ordered step with a version number. Applied versions are
+recorded in the schema_migrations table, so a step runs exactly once per
+database. Each step runs in one transaction with the insert of its version
+row, and that insert goes first. A second process trying the same step blocks
+on the row, then fails on the primary key and skips the step.
+
+Startup only checks the recorded version against the latest one (one query).
+Pending migrations are applied at startup when AUTO_MIGRATE is true (the
+default, convenient for SQLite development). In production, set it to false
+and apply them outside the serving processes:
+
+    python -m backend.migrations upgrade
+    python -m backend.migrations status
+
+New tables come from Base.metadata.create_all; migrations handle changes to
+tables that already exist (new columns, indexes, backfills). Steps must be safe
+on a database whose tables create_all just made in their final shape.
+"""
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List, NamedTuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+from backend.spatial_utils import ensure_spatial_index
+from backend.issue_search import ensure_search_index
+from backend.models import IssueActionPlan
+
+logger = logging.getLogger(__name__)
+
+AUTO_MIGRATE = os.environ.get("AUTO_MIGRATE", "true").lower() == "true"
+
+schema_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", schema_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def add_column(conn: Connection, table: str, column: str, ddl_type: str) -> None:
+    """ALTER TABLE ... ADD COLUMN unless the table is missing or already has the column."""
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return
+    if column not in {c["name"] for c in inspector.get_columns(table)}:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+        logger.info(f"Migration: added column {table}.{column}")
+
+
+def drop_column(conn: Connection, table: str, column: str) -> None:
+    """ALTER TABLE ... DROP COLUMN; SQLite before 3.35 cannot drop columns, so the values are cleared instead."""
+    if conn.dialect.name == "sqlite" and conn.dialect.server_version_info < (3, 35, 0):
+        conn.execute(text(f"UPDATE {table} SET {column} = NULL"))
+    else:
+        conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+    logger.info(f"Migration: dropped column {table}.{column}")
+
+
+def create_index(conn: Connection, name: str, table: str, columns: Iterable[str]) -> None:
+    if inspect(conn).has_table(table):
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+
+
+# --- Migration steps (append only; never edit or reorder an applied step) ---
+
+def _baseline(conn: Connection) -> None:
+    """Columns and indexes that releases before versioned migrations added to existing tables at every startup."""
+    add_column(conn, "issues", "upvotes", "INTEGER DEFAULT 0")
+    add_column(conn, "issues", "latitude", "FLOAT")
+    add_column(conn, "issues", "longitude", "FLOAT")
+    add_column(conn, "issues", "location", "VARCHAR")
+    add_column(conn, "issues", "action_plan", "TEXT")
+    add_column(conn, "issues", "integrity_hash", "VARCHAR")
+    create_index(conn, "ix_issues_upvotes", "issues", ["upvotes"])
+    create_index(conn, "ix_issues_created_at", "issues", ["created_at"])
+    create_index(conn, "ix_issues_status", "issues", ["status"])
+    create_index(conn, "ix_issues_latitude", "issues", ["latitude"])
+    create_index(conn, "ix_issues_longitude", "issues", ["longitude"])
+    create_index(conn, "ix_issues_status_lat_lon", "issues", ["status", "latitude", "longitude"])
+    create_index(conn, "ix_issues_user_email", "issues", ["user_email"])
+
+    add_column(conn, "grievances", "latitude", "FLOAT")
+    add_column(conn, "grievances", "longitude", "FLOAT")
+    add_column(conn, "grievances", "address", "VARCHAR")
+    add_column(conn, "grievances", "issue_id", "INTEGER")
+    create_index(conn, "ix_grievances_latitude", "grievances", ["latitude"])
+    create_index(conn, "ix_grievances_longitude", "grievances", ["longitude"])
+    create_index(conn, "ix_grievances_status_lat_lon", "grievances", ["status", "latitude", "longitude"])
+    create_index(conn, "ix_grievances_status_jurisdiction", "grievances", ["status", "current_jurisdiction_id"])
+    create_index(conn, "ix_grievances_issue_id", "grievances", ["issue_id"])
+    create_index(conn, "ix_grievances_assigned_authority", "grievances", ["assigned_authority"])
+    create_index(conn, "ix_grievances_category_status", "grievances", ["category", "status"])
+
+
+def _issues_rtree_index(conn: Connection) -> None:
+    # R*Tree spatial index for open issues (SQLite only): virtual table, sync triggers, backfill
+    if inspect(conn).has_table("issues"):
+        ensure_spatial_index(conn)
+
+
+def _issues_user_email_created_at_index(conn: Connection) -> None:
+    # Per-user issue lists (keyset pagination on created_at, id)
+    create_index(conn, "ix_issues_user_email_created_at", "issues", ["user_email", "created_at", "id"])
+
+
+def _issues_prev_hash(conn: Connection) -> None:
+    # Explicit chain links, unique so that concurrent appends cannot fork the chain
+    add_column(conn, "issues", "prev_hash", "VARCHAR")
+    if inspect(conn).has_table("issues"):
+        conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_issues_prev_hash ON issues (prev_hash) WHERE prev_hash IS NOT NULL"
+        ))
+
+
+def _issues_search_index(conn: Connection) -> None:
+    # Full-text search: FTS5 table and sync triggers (SQLite) or tsvector column and GIN index (Postgres)
+    if inspect(conn).has_table("issues"):
+        ensure_search_index(conn)
+
+
+def _copy_action_plans(conn: Connection) -> None:
+    """Copy issues.action_plan into issue_action_plans for issues that have no row there yet."""
+    inspector = inspect(conn)
+    if not inspector.has_table("issues") or "action_plan" not in {c["name"] for c in inspector.get_columns("issues")}:
+        return
+    conn.execute(text(
+        "INSERT INTO issue_action_plans (issue_id, plan, updated_at) "
+        "SELECT id, action_plan, CURRENT_TIMESTAMP FROM issues "
+        "WHERE action_plan IS NOT NULL AND id NOT IN (SELECT issue_id FROM issue_action_plans)"
+    ))
+
+
+def _issue_action_plans_table(conn: Connection) -> None:
+    # Action plans move to their own table; issue rows keep only the columns the scans need.
+    # issues.action_plan stays for processes of the previous release still running during
+    # a rolling deploy. A later step copies again what they wrote, then drops it
+    # (drop_column) once no deployed release reads it.
+    IssueActionPlan.__table__.create(conn, checkfirst=True)
+    _copy_action_plans(conn)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline", _baseline),
+    Migration(2, "issues_rtree_index", _issues_rtree_index),
+    Migration(3, "issues_user_email_created_at_index", _issues_user_email_created_at_index),
+    Migration(4, "issues_prev_hash", _issues_prev_hash),
+    Migration(5, "issues_search_index", _issues_search_index),
+    Migration(6, "issue_action_plans_table", _issue_action_plans_table),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def applied_versions(engine: Engine) -> List[int]:
+    with engine.begin() as conn:
+        schema_metadata.create_all(conn)
+        return sorted(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    applied = set(applied_versions(engine))
+    return [migration for migration in MIGRATIONS if migration.version not in applied]
+
+
+def upgrade(engine: Engine) -> List[int]:
+    """Apply pending migrations in order. Returns the versions applied by this call."""
+    applied = []
+    for migration in pending_migrations(engine):
+        try:
+            with engine.begin() as conn:
+                # Claim the version first: a concurrent upgrade blocks here, then skips
+                conn.execute(schema_migrations.insert().values(
+                    version=migration.version, name=migration.name, applied_at=datetime.now(timezone.utc)
+                ))
+                migration.apply(conn)
+        except IntegrityError:
+            logger.info(f"Migration {migration.version} ({migration.name}) was applied by another process")
+            continue
+        logger.info(f"Applied migration {migration.version} ({migration.name})")
+        applied.append(migration.version)
+    return applied
+
+
+def ensure_schema_current(engine: Engine, auto_migrate: bool = AUTO_MIGRATE) -> bool:
+    """
+    Startup check: a single version query when the schema is current. Pending
+    migrations are applied when auto_migrate is set, otherwise reported.
+    Returns True when the schema is current afterwards.
+    """
+    with engine.connect() as conn:
+        if inspect(conn).has_table("schema_migrations"):
+            current = conn.execute(select(schema_migrations.c.version).order_by(
+                schema_migrations.c.version.desc()).limit(1)).scalar()
+            if current == LATEST_VERSION:
+                return True
+
+    if not auto_migrate:
+        pending = [migration.version for migration in pending_migrations(engine)]
+        logger.error(f"Database schema is behind (pending migrations {pending}); "
+                     f"run 'python -m backend.migrations upgrade'")
+        return False
+
+    upgrade(engine)
+    return not pending_migrations(engine)
+
+
+def main(argv: List[str]) -> int:
+    from backend.database import Base, engine
+    import backend.models  # noqa: F401 (registers the tables on Base)
+
+    command = argv[0] if argv else "status"
+    if command == "upgrade":
+        Base.metadata.create_all(bind=engine)
+        applied = upgrade(engine)
+        print(f"Applied migrations: {applied}" if applied else "Database schema is up to date.")
+        return 0
+    if command == "status":
+        applied = applied_versions(engine)
+        pending = [migration for migration in MIGRATIONS if migration.version not in set(applied)]
+        print(f"Schema version: {applied[-1] if applied else 0} (latest {LATEST_VERSION})")
+        for migration in pending:
+            print(f"  pending: {migration.version} {migration.name}")
+        return 0
+
+    print("Usage: python -m backend.migrations [upgrade|status]")
+    return 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main(sys.argv[1:]))
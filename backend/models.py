@@ -1,8 +1,9 @@
 import json
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, Enum, Index, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, Enum, Index, Boolean, text
 from sqlalchemy.types import TypeDecorator
 from backend.database import Base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
+from sqlalchemy.ext.associationproxy import association_proxy
 
 import datetime
 import enum
@@ -141,15 +142,22 @@ class Issue(Base):
     __tablename__ = "issues"
     __table_args__ = (
         Index("ix_issues_status_lat_lon", "status", "latitude", "longitude"),
+        # Per-user issue lists: keyset pages on (created_at, id) within one user_email
+        Index("ix_issues_user_email_created_at", "user_email", "created_at", "id"),
+        # One successor per chain link: concurrent appends cannot fork the integrity chain
+        Index("ux_issues_prev_hash", "prev_hash", unique=True,
+              sqlite_where=text("prev_hash IS NOT NULL"), postgresql_where=text("prev_hash IS NOT NULL")),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     reference_id = Column(String, unique=True, index=True)  # Secure reference for government updates
     description = Column(Text)
-    category = Column(String, index=True)
+    # active_history: the previous value is loaded on assignment so that
+    # issue_counters can move a count from the old status/category to the new one
+    category = column_property(Column(String, index=True), active_history=True)
     image_path = Column(String)
     source = Column(String)  # 'telegram', 'web', etc.
-    status = Column(String, default="open", index=True)
+    status = column_property(Column(String, default="open", index=True), active_history=True)
     created_at = Column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc), index=True)
     verified_at = Column(DateTime, nullable=True)
     assigned_at = Column(DateTime, nullable=True)
@@ -160,8 +168,79 @@ class Issue(Base):
     latitude = Column(Float, nullable=True, index=True)
     longitude = Column(Float, nullable=True, index=True)
     location = Column(String, nullable=True)
-    action_plan = Column(JSONEncodedDict, nullable=True)
     integrity_hash = Column(String, nullable=True)  # Blockchain integrity seal
+    prev_hash = Column(String, nullable=True)  # integrity_hash this seal is chained to (NULL on legacy rows)
+
+    # Optimization: The generated plan (messaging drafts, RAG rule) lives in
+    # issue_action_plans, so issue rows stay narrow for the list and spatial
+    # scans; it is loaded only when issue.action_plan is read
+    action_plan_record = relationship(
+        "IssueActionPlan", uselist=False, back_populates="issue", cascade="all, delete-orphan"
+    )
+    action_plan = association_proxy(
+        "action_plan_record", "plan", creator=lambda plan: IssueActionPlan(plan=plan)
+    )
+
+class IssueActionPlan(Base):
+    """Action plan of an issue, kept out of the issues table."""
+    __tablename__ = "issue_action_plans"
+
+    issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), primary_key=True)
+    plan = Column(JSONEncodedDict, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+        onupdate=lambda: datetime.datetime.now(datetime.timezone.utc)
+    )
+
+    issue = relationship("Issue", back_populates="action_plan_record")
+
+class IssueArchive(Base):
+    """Issues closed long ago, moved out of the issues table (see backend/issue_archive.py)."""
+    __tablename__ = "issues_archive"
+
+    # Same columns as issues (ids and seals are kept, so the integrity chain spans both tables)
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    reference_id = Column(String, unique=True, index=True)
+    description = Column(Text)
+    category = Column(String)
+    image_path = Column(String)
+    source = Column(String)
+    status = Column(String)
+    created_at = Column(DateTime)
+    verified_at = Column(DateTime, nullable=True)
+    assigned_at = Column(DateTime, nullable=True)
+    resolved_at = Column(DateTime, nullable=True)
+    user_email = Column(String, nullable=True)
+    assigned_to = Column(String, nullable=True)
+    upvotes = Column(Integer, default=0)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    location = Column(String, nullable=True)
+    integrity_hash = Column(String, nullable=True)
+    prev_hash = Column(String, nullable=True)
+
+    action_plan = Column(JSONEncodedDict, nullable=True)  # Moved from issue_action_plans
+    archived_at = Column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+class IssueCounter(Base):
+    """Issue counts maintained on write (see backend/issue_counters.py)."""
+    __tablename__ = "issue_counters"
+
+    name = Column(String, primary_key=True)  # "total", "status:<status>" or "category:<category>"
+    count = Column(Integer, nullable=False, default=0)
+
+class ChainCheckpoint(Base):
+    """Merkle root over one block of the issue integrity chain (see backend/chain_audit.py)."""
+    __tablename__ = "chain_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    start_issue_id = Column(Integer, nullable=False, unique=True)  # One checkpoint per block
+    end_issue_id = Column(Integer, nullable=False, index=True)
+    leaf_count = Column(Integer, nullable=False)
+    block_root = Column(String, nullable=False)  # Root over the issues of this block
+    root = Column(String, nullable=False)  # Root over the block roots of this and every earlier checkpoint
+    created_at = Column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc))
 
 class PushSubscription(Base):
     __tablename__ = "push_subscriptions"
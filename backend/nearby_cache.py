@@ -0,0 +1,217 @@
+"""
+Grid-cell keyed cache for nearby issue lookups.
+
+Keying the cache on exact coordinates means two users a metre apart never
+share an entry. Instead, the radius is rounded up to a bucket and the location
+is mapped to a grid cell of that size. Each entry holds every open issue that
+any point of the cell could see at the bucket radius, and every request
+filters that superset exactly for its own location, radius and limit.
+
+Writes invalidate only the cells whose superset can contain the changed issue.
+
+Cached issues are stored pre-encoded: the NearbyIssueResponse JSON of each
+issue is rendered once, split around its distance_meters value, so building a
+response is a byte join with no model construction.
+"""
+import logging
+import threading
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.cache import ThreadSafeCache, nearby_issues_cache
+from backend.cache_backend import shared_type
+from backend.response_cache import dumps_json
+from backend.schemas import NearbyIssueResponse
+from backend.spatial_index import find_nearby_open_issues
+from backend.spatial_utils import (
+    grid_cell, grid_cell_center, grid_cells_in_radius, find_nearby_issues
+)
+
+logger = logging.getLogger(__name__)
+
+# Radius buckets (meters); requests are served from the smallest bucket >= radius
+NEARBY_RADIUS_BUCKETS = (50.0, 100.0, 250.0, 500.0)
+
+# A point in a cell of side B is at most B * sqrt(2) / 2 from the cell centre,
+# so every issue within B of it is within B * (1 + 0.707) of the centre.
+# 1.75 leaves room for the slight non-squareness of grid cells.
+SUPERSET_RADIUS_FACTOR = 1.75
+
+
+@shared_type
+class EncodedNearbyIssue(NamedTuple):
+    """A cached open issue with its response JSON split around distance_meters."""
+    id: int
+    latitude: float
+    longitude: float
+    head: bytes  # '{"id":...,"longitude":...,"distance_meters":'
+    tail: bytes  # ',"upvotes":...,"status":"..."}'
+
+
+def encode_nearby_issue(row: Any) -> EncodedNearbyIssue:
+    """Render a row carrying NEARBY_ISSUE_COLUMNS as NearbyIssueResponse JSON (distance left open)."""
+    description = row.description[:100] + "..." if len(row.description) > 100 else row.description
+    fields = NearbyIssueResponse(
+        id=row.id,
+        description=description,
+        category=row.category,
+        latitude=row.latitude,
+        longitude=row.longitude,
+        distance_meters=0.0,
+        upvotes=row.upvotes or 0,
+        created_at=row.created_at,
+        status=row.status
+    ).model_dump(mode="json")
+
+    names = list(NearbyIssueResponse.model_fields)
+    split = names.index("distance_meters")
+    head = dumps_json({name: fields[name] for name in names[:split]})
+    tail = dumps_json({name: fields[name] for name in names[split + 1:]})
+    return EncodedNearbyIssue(
+        row.id, row.latitude, row.longitude,
+        head[:-1] + b',"distance_meters":',
+        b"," + tail[1:]
+    )
+
+
+class NearbyIssuesCache:
+    """Nearby lookups cached per (radius bucket, grid cell) with hit/miss counts."""
+
+    def __init__(self, cache: ThreadSafeCache, radius_buckets: Tuple[float, ...] = NEARBY_RADIUS_BUCKETS):
+        self._cache = cache
+        self._buckets = tuple(sorted(radius_buckets))
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so that a fill racing with a write is not stored
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidated_keys = 0
+
+    def radius_bucket(self, radius_meters: float) -> float:
+        for bucket in self._buckets:
+            if radius_meters <= bucket:
+                return bucket
+        raise ValueError(f"Radius {radius_meters} exceeds the largest cache bucket {self._buckets[-1]}")
+
+    def get_nearby(self, db: Session, lat: float, lon: float, radius_meters: float, limit: int) -> List[Tuple[Any, float]]:
+        """
+        Open issues within radius_meters of (lat, lon), closest first (at most `limit`).
+        Returns (EncodedNearbyIssue, distance) tuples.
+        """
+        cell, candidates = self._lookup(lat, lon, radius_meters)
+        if candidates is None:
+            candidates = self._fill(db, *cell)
+        return find_nearby_issues(candidates, lat, lon, radius_meters, limit=limit)
+
+    def get_nearby_json(self, db: Session, lat: float, lon: float, radius_meters: float, limit: int) -> bytes:
+        """Same as get_nearby, rendered as a JSON list of NearbyIssueResponse objects."""
+        return self._render(self.get_nearby(db, lat, lon, radius_meters, limit))
+
+    async def get_nearby_json_async(self, db: AsyncSession, lat: float, lon: float,
+                                    radius_meters: float, limit: int) -> bytes:
+        """
+        get_nearby_json for an AsyncSession: hits never touch the session, misses
+        load through run_sync. Shared cache backend calls stay off the event loop.
+        """
+        bucket, row, col, key = self._cell(lat, lon, radius_meters)
+        candidates = await self._cache.get_async(key)
+        generation = self._count_lookup(candidates)
+        if candidates is None:
+            candidates = await db.run_sync(self._load, bucket, row, col)
+            await self._cache.run_async(self._store, key, generation, candidates)
+        return self._render(find_nearby_issues(candidates, lat, lon, radius_meters, limit=limit))
+
+    def _lookup(self, lat: float, lon: float, radius_meters: float):
+        """((bucket, row, col, key, generation), cached candidates or None)."""
+        bucket, row, col, key = self._cell(lat, lon, radius_meters)
+        candidates = self._cache.get(key)
+        return (bucket, row, col, key, self._count_lookup(candidates)), candidates
+
+    def _cell(self, lat: float, lon: float, radius_meters: float) -> Tuple[float, int, int, str]:
+        bucket = self.radius_bucket(radius_meters)
+        row, col = grid_cell(lat, lon, bucket)
+        return bucket, row, col, self._key(bucket, row, col)
+
+    def _count_lookup(self, candidates) -> int:
+        """Count a hit or miss; returns the generation a fill must still see to be stored."""
+        with self._lock:
+            if candidates is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+            return self._generation
+
+    def _fill(self, db: Session, bucket: float, row: int, col: int, key: str, generation: int) -> List[EncodedNearbyIssue]:
+        """Load and cache every open issue the cell can see at the bucket radius."""
+        candidates = self._load(db, bucket, row, col)
+        self._store(key, generation, candidates)
+        return candidates
+
+    def _load(self, db: Session, bucket: float, row: int, col: int) -> List[EncodedNearbyIssue]:
+        center_lat, center_lon = grid_cell_center(row, col, bucket)
+        matches = find_nearby_open_issues(
+            db, center_lat, center_lon, bucket * SUPERSET_RADIUS_FACTOR, None
+        )
+        return [encode_nearby_issue(issue) for issue, _ in matches]
+
+    def _store(self, key: str, generation: int, candidates: List[EncodedNearbyIssue]) -> None:
+        with self._lock:
+            # Bumped on every invalidation: a fill racing with a write is not stored
+            if generation == self._generation:
+                self._cache.set(candidates, key)
+
+    @staticmethod
+    def _render(matches: List[Tuple[EncodedNearbyIssue, float]]) -> bytes:
+        return b"[" + b",".join(
+            issue.head + dumps_json(float(distance)) + issue.tail for issue, distance in matches
+        ) + b"]"
+
+    def invalidate_at(self, lat: float, lon: float) -> int:
+        """Drop every cached cell whose superset can contain (lat, lon). Returns the number of keys."""
+        return self.invalidate_points([(lat, lon)])
+
+    def invalidate_points(self, points: Iterable[Tuple[float, float]]) -> int:
+        """
+        invalidate_at() for several points at once: one invalidation (and one
+        shared backend event) for all their cells. Returns the number of keys.
+        """
+        keys = sorted({
+            self._key(bucket, row, col)
+            for lat, lon in points
+            for bucket in self._buckets
+            for row, col in grid_cells_in_radius(lat, lon, bucket * SUPERSET_RADIUS_FACTOR, bucket)
+        })
+        if not keys:
+            return 0
+        with self._lock:
+            self._generation += 1
+            self._invalidated_keys += len(keys)
+            self._cache.invalidate_keys(keys)
+        logger.debug(f"Nearby cache invalidated {len(keys)} cells")
+        return len(keys)
+
+    async def invalidate_at_async(self, lat: float, lon: float) -> int:
+        """invalidate_at() for the event loop."""
+        return await self._cache.run_async(self.invalidate_at, lat, lon)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidated_keys": self._invalidated_keys,
+                "radius_buckets": list(self._buckets),
+                "cache": self._cache.get_stats(),
+            }
+
+    @staticmethod
+    def _key(bucket: float, row: int, col: int) -> str:
+        return f"nearby:{bucket:g}:{row}:{col}"
+
+
+# Global instance backed by the shared nearby_issues_cache
+nearby_cache = NearbyIssuesCache(nearby_issues_cache)
@@ -0,0 +1,362 @@
+"""
+Sliding-window rate limiting.
+
+Each (policy, client) key keeps two counters: requests in the current fixed
+window and in the previous one. The sliding-window estimate weights the
+previous count by how much of it still overlaps the last `window` seconds:
+
+    estimate = previous * (1 - elapsed / window) + current
+
+so memory per key is constant, unlike a list of timestamps. A request is
+allowed when estimate + 1 <= limit, and the check and the increment happen
+atomically in the storage backend.
+
+Backends:
+- InMemoryRateLimitStorage: per process (the default).
+- SQLiteRateLimitStorage: a SQLite file shared by every worker process on the
+  host, selected with RATE_LIMIT_STORAGE_URL=sqlite:///path/to/file.db.
+  Its hits are blocking writes, so async callers (hit_async) run them in the
+  threadpool; idle keys are pruned every RATE_LIMIT_PRUNE_EVERY hits.
+
+RateLimitMiddleware applies per-route policies (uploads, detection, auth) keyed
+by client IP before the request reaches the router.
+"""
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
+MAX_REQUESTS_PER_MINUTE = int(os.environ.get("MAX_REQUESTS_PER_MINUTE", "60"))
+RATE_LIMIT_STORAGE_URL = os.environ.get("RATE_LIMIT_STORAGE_URL", "memory://")
+RATE_LIMIT_PRUNE_EVERY = int(os.environ.get("RATE_LIMIT_PRUNE_EVERY", "1000"))
+
+
+class RateLimitPolicy(NamedTuple):
+    name: str
+    limit: int
+    window_seconds: float
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until a request would be allowed (0 when allowed)
+
+
+def sliding_window_hit(window_start: float, current: int, previous: int,
+                       limit: int, window: float, now: float) -> Tuple[float, int, int, RateLimitResult]:
+    """
+    Pure check-and-consume step shared by the storage backends.
+    Takes the stored (window_start, current, previous) state and returns the
+    new state with the result. Denied requests are not counted.
+    """
+    start = math.floor(now / window) * window
+    if start != window_start:
+        # Rolled into a new window; anything older than one window is dropped
+        previous = current if start - window_start == window else 0
+        current = 0
+        window_start = start
+
+    elapsed = now - window_start
+    weight = 1.0 - elapsed / window
+    estimate = previous * weight + current
+
+    if estimate + 1 <= limit:
+        current += 1
+        remaining = max(0, int(limit - (previous * weight + current)))
+        return window_start, current, previous, RateLimitResult(True, limit, remaining, 0.0)
+
+    return window_start, current, previous, RateLimitResult(
+        False, limit, 0, _retry_after(current, previous, limit, window, elapsed)
+    )
+
+
+def _retry_after(current: int, previous: int, limit: int, window: float, elapsed: float) -> float:
+    """Seconds until previous * weight + current drops to limit - 1."""
+    target = limit - 1
+    if current <= target and previous > 0:
+        # The previous window's share decays enough within the current window
+        return max(0.0, window * (1.0 - (target - current) / previous) - elapsed)
+    # Wait for the next window, where this window's count becomes the decaying share
+    if current <= 0:
+        return window - elapsed
+    return (window - elapsed) + max(0.0, window * (1.0 - target / current))
+
+
+class InMemoryRateLimitStorage:
+    """
+    Per-process storage: one [window_start, current, previous] list per key.
+    Beyond max_keys the least recently used key is dropped; keys idle for two
+    windows carry no state, so only dropping an active key counts as an eviction.
+    """
+
+    # Hits only take a lock: safe to call on the event loop
+    blocking = False
+
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.time):
+        self._max_keys = max_keys
+        self._clock = clock
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [0.0, 0, 0]
+                self._entries[key] = entry
+                if len(self._entries) > self._max_keys:
+                    self._prune_locked(now, window)
+            else:
+                self._entries.move_to_end(key)
+
+            entry[0], entry[1], entry[2], result = sliding_window_hit(
+                entry[0], entry[1], entry[2], limit, window, now
+            )
+            return result
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "keys": len(self._entries), "evictions": self._evictions}
+
+    def _prune_locked(self, now: float, window: float) -> None:
+        # Keys are in LRU order, so the idle ones are at the front
+        while len(self._entries) > self._max_keys:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry[0] < 2 * window:
+                self._evictions += 1
+            del self._entries[key]
+
+
+class SQLiteRateLimitStorage:
+    """
+    Storage in a SQLite file, shared by all worker processes on the host.
+    Each hit runs in a BEGIN IMMEDIATE transaction, which serialises
+    concurrent writers across processes (and may wait for the write lock).
+    Every prune_every hits, keys idle for two windows of the longest window
+    seen so far are deleted, so the table stays bounded by the active clients.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time,
+                 prune_every: int = RATE_LIMIT_PRUNE_EVERY):
+        self._path = path
+        self._clock = clock
+        self._prune_every = prune_every
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._max_window = 0.0
+        self._pruned = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, window_start REAL NOT NULL, "
+            "current INTEGER NOT NULL, previous INTEGER NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = self._clock()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT window_start, current, previous FROM rate_limits WHERE key = ?", (key,)
+            ).fetchone()
+            window_start, current, previous, result = sliding_window_hit(
+                *(row or (0.0, 0, 0)), limit, window, now
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (key, window_start, current, previous) VALUES (?, ?, ?, ?)",
+                (key, window_start, current, previous)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        with self._lock:
+            self._hits += 1
+            self._max_window = max(self._max_window, window)
+            due = self._prune_every > 0 and self._hits % self._prune_every == 0
+        if due:
+            try:
+                self.prune(self._max_window)
+            except Exception as e:
+                logger.warning(f"Pruning rate limit keys failed: {e}")
+        return result
+
+    def reset(self, key: Optional[str] = None) -> None:
+        conn = self._connection()
+        if key is None:
+            conn.execute("DELETE FROM rate_limits")
+        else:
+            conn.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def prune(self, max_window: float) -> int:
+        """Delete keys idle for two windows of the longest policy. Returns the number removed."""
+        cursor = self._connection().execute(
+            "DELETE FROM rate_limits WHERE window_start < ?", (self._clock() - 2 * max_window,)
+        )
+        with self._lock:
+            self._pruned += cursor.rowcount
+        return cursor.rowcount
+
+    def get_stats(self) -> dict:
+        keys = self._connection().execute("SELECT COUNT(*) FROM rate_limits").fetchone()[0]
+        return {"backend": "sqlite", "path": self._path, "keys": keys, "pruned": self._pruned}
+
+
+def create_storage(url: str = RATE_LIMIT_STORAGE_URL):
+    """Storage backend for a RATE_LIMIT_STORAGE_URL (memory:// or sqlite:///path)."""
+    if url.startswith("sqlite:///"):
+        return SQLiteRateLimitStorage(url[len("sqlite:///"):])
+    if url not in ("", "memory://"):
+        logger.warning(f"Unknown rate limit storage '{url}', using in-memory storage")
+    return InMemoryRateLimitStorage()
+
+
+class RateLimiter:
+    """Applies policies to client keys on top of a storage backend, with per-policy counters."""
+
+    def __init__(self, storage=None, enabled: bool = True):
+        self.storage = storage if storage is not None else InMemoryRateLimitStorage()
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def hit(self, policy: RateLimitPolicy, identifier: str) -> RateLimitResult:
+        if not self.enabled:
+            return RateLimitResult(True, policy.limit, policy.limit, 0.0)
+        try:
+            result = self.storage.hit(f"{policy.name}:{identifier}", policy.limit, policy.window_seconds)
+        except Exception as e:
+            # Fail open: a storage problem must not take the API down
+            logger.error(f"Rate limit storage error for policy {policy.name}: {e}", exc_info=True)
+            return RateLimitResult(True, policy.limit, policy.limit, 0.0)
+
+        with self._lock:
+            allowed, denied = self._counts.get(policy.name, (0, 0))
+            self._counts[policy.name] = (allowed + 1, denied) if result.allowed else (allowed, denied + 1)
+        return result
+
+    async def hit_async(self, policy: RateLimitPolicy, identifier: str) -> RateLimitResult:
+        """hit() for the event loop: storages doing blocking I/O run in the threadpool."""
+        if not self.enabled or not getattr(self.storage, "blocking", True):
+            return self.hit(policy, identifier)
+        return await run_in_threadpool(self.hit, policy, identifier)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            policies = {
+                name: {"allowed": allowed, "denied": denied}
+                for name, (allowed, denied) in self._counts.items()
+            }
+        try:
+            storage = self.storage.get_stats()
+        except Exception as e:
+            storage = {"error": str(e)}
+        return {"enabled": self.enabled, "storage": storage, "policies": policies}
+
+
+# Route policies, keyed by client IP
+UPLOAD_POLICY = RateLimitPolicy("uploads", 20, 60.0)
+DETECTION_POLICY = RateLimitPolicy("detection", MAX_REQUESTS_PER_MINUTE, 60.0)
+AUTH_POLICY = RateLimitPolicy("auth", 10, 60.0)
+
+DETECTION_PATH_PREFIXES = ("/api/detect-", "/api/analyze-", "/api/generate-description", "/api/transcribe-audio")
+AUTH_PATHS = ("/auth/token", "/auth/login", "/auth/signup")
+
+
+def route_policy(method: str, path: str) -> Optional[RateLimitPolicy]:
+    """Policy for a request, or None when the route is not rate limited."""
+    if method != "POST":
+        return None
+    if path == "/api/issues" or (path.startswith("/api/issues/") and path.endswith("/verify")):
+        return UPLOAD_POLICY
+    if path.startswith(DETECTION_PATH_PREFIXES):
+        return DETECTION_POLICY
+    if path in AUTH_PATHS:
+        return AUTH_POLICY
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware rejecting requests over their route policy with 429 and a
+    Retry-After header, before the body is read or the route runs.
+    """
+
+    def __init__(self, app, limiter: "RateLimiter" = None,
+                 policy_for: Callable[[str, str], Optional[RateLimitPolicy]] = route_policy):
+        self.app = app
+        self.limiter = limiter
+        self.policy_for = policy_for
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.limiter or rate_limiter
+        policy = self.policy_for(scope["method"], scope["path"])
+        if policy is None or not limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        result = await limiter.hit_async(policy, client[0] if client else "unknown")
+        if not result.allowed:
+            body = json.dumps({"detail": "Rate limit exceeded. Please try again later."}).encode("utf-8")
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(result.retry_after)).encode()),
+                    (b"x-ratelimit-limit", str(result.limit).encode()),
+                    (b"x-ratelimit-remaining", b"0"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
+
+
+# Global limiter shared by the middleware and the upload checks
+rate_limiter = RateLimiter(create_storage(), enabled=RATE_LIMIT_ENABLED)
@@ -0,0 +1,71 @@
+"""
+Pre-encoded JSON responses for cached list endpoints.
+
+Caching dicts still costs a full JSON encode (and a gzip pass in the
+middleware) on every hit. Hot list endpoints instead cache the final bytes,
+plus a gzip variant computed once, so a hit only writes bytes to the socket.
+"""
+import gzip
+import json
+import logging
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from backend.cache_backend import shared_type
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Same threshold as the GZipMiddleware in main.py; smaller bodies are sent as-is
+GZIP_MIN_SIZE = 500
+GZIP_COMPRESS_LEVEL = 9
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode JSON-ready data (str keys, ISO date strings) to compact UTF-8 bytes.
+    Uses orjson when installed; the output matches JSONResponse either way.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+@shared_type
+class EncodedPayload(NamedTuple):
+    """A cached response body: the source data, its JSON bytes and their gzip variant."""
+    data: Any
+    body: bytes
+    gzip_body: Optional[bytes]
+
+
+def encode_payload(data: Any) -> EncodedPayload:
+    body = dumps_json(data)
+    gzip_body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL) if len(body) >= GZIP_MIN_SIZE else None
+    return EncodedPayload(data, body, gzip_body)
+
+
+def payload_response(payload: EncodedPayload, request: Optional[Request] = None) -> Response:
+    """
+    Response writing the cached bytes directly (no model construction or re-encoding).
+    The gzip variant is used when the client accepts it; GZipMiddleware leaves
+    responses that already carry a Content-Encoding untouched.
+    """
+    if payload.gzip_body is None:
+        return Response(content=payload.body, media_type="application/json")
+
+    if request is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=payload.gzip_body,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=payload.body, media_type="application/json", headers={"Vary": "Accept-Encoding"})
@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from backend.database import get_db
 from backend.models import User, UserRole
 from backend.schemas import UserResponse
 from backend.dependencies import get_current_admin_user
+from backend.spatial_index import open_issue_index
+from backend.issue_clusters import issue_cluster_index
+from backend.nearby_cache import nearby_cache
+from backend.cache import recent_issues_cache, nearby_issues_cache, TAG_ISSUES_STATS
+from backend.rate_limiter import rate_limiter
+from backend.upvote_buffer import upvote_buffer
+from backend.pagination import paginate, next_cursor, set_next_cursor
+from backend.issue_counters import reconcile_issue_counters
+from backend.chain_audit import create_checkpoints, latest_checkpoint
+from backend.issue_archive import issue_archiver, table_sizes
+from backend.sql_instrumentation import sql_report
 
 router = APIRouter(
     prefix="/admin",
@@ -14,8 +25,11 @@ router = APIRouter(
 )
 
 @router.get("/users", response_model=List[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    users = db.query(User).offset(skip).limit(limit).all()
+def get_users(response: Response, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+              db: Session = Depends(get_db)):
+    # Keyset pagination on id when a cursor (X-Next-Cursor of the previous page) is given
+    users = paginate(db.query(User), (User.id,), (int,), limit, skip, cursor, descending=False).all()
+    set_next_cursor(response, next_cursor(users, limit, lambda user: (user.id,)))
     return users
 
 @router.get("/stats")
@@ -28,3 +42,83 @@ def get_system_stats(db: Session = Depends(get_db)):
         "admin_count": admin_users,
         "active_users": db.query(User).filter(User.is_active == True).count(),
     }
+
+@router.get("/spatial-index")
+def get_spatial_index_status(db: Session = Depends(get_db)):
+    """Compare the in-memory open issue index with the database."""
+    return {
+        "stats": open_issue_index.get_stats(),
+        "clusters": issue_cluster_index.get_stats(),
+        "nearby_cache": nearby_cache.get_stats(),
+        "consistency": open_issue_index.check_consistency(db),
+    }
+
+@router.post("/spatial-index/repair")
+def repair_spatial_index(db: Session = Depends(get_db)):
+    """Compare the open issue index with the database and rebuild it if they drifted apart."""
+    return open_issue_index.check_consistency(db, repair=True)
+
+@router.post("/spatial-index/rebuild")
+def rebuild_spatial_index(db: Session = Depends(get_db)):
+    indexed = open_issue_index.rebuild(db)
+    return {"message": "Open issue index rebuilt", "indexed_issues": indexed}
+
+@router.get("/cache-stats")
+def get_cache_stats():
+    """Hit/miss/eviction counters and single-flight collapse counts for the shared caches, plus the upvote write buffer."""
+    return {
+        "recent_issues": recent_issues_cache.get_stats(),
+        "nearby_issues": nearby_issues_cache.get_stats(),
+        "upvote_buffer": upvote_buffer.get_stats(),
+    }
+
+@router.get("/rate-limits")
+def get_rate_limit_stats():
+    """Allowed/denied counts per rate limit policy and the storage backend in use."""
+    return rate_limiter.get_stats()
+
+@router.get("/issue-counters")
+def get_issue_counter_status(db: Session = Depends(get_db)):
+    """Compare the counters behind /api/stats with a recount of the issues table."""
+    return reconcile_issue_counters(db, repair=False)
+
+@router.post("/issue-counters/repair")
+def repair_issue_counters(db: Session = Depends(get_db)):
+    """Recount the issues table now and overwrite the counters that drifted."""
+    report = reconcile_issue_counters(db)
+    if report["repaired"]:
+        recent_issues_cache.invalidate_tags(TAG_ISSUES_STATS)
+    return report
+
+@router.post("/chain-checkpoints")
+def create_chain_checkpoints(db: Session = Depends(get_db)):
+    """Checkpoint the complete blocks of the integrity chain now instead of at the next periodic run."""
+    created = create_checkpoints(db)
+    latest = latest_checkpoint(db)
+    return {
+        "created": created,
+        "latest_checkpoint_id": latest.id if latest else None,
+        "checkpointed_up_to_issue_id": latest.end_issue_id if latest else None,
+        "root": latest.root if latest else None,
+    }
+
+@router.get("/issue-archive")
+def get_issue_archive_status(db: Session = Depends(get_db)):
+    """Row counts of the hot and archive tables, and archiving throughput."""
+    return {"tables": table_sizes(db), "archiver": issue_archiver.get_stats()}
+
+@router.post("/issue-archive")
+def archive_issues(max_batches: Optional[int] = None, db: Session = Depends(get_db)):
+    """Archive long-closed issues now instead of at the next periodic run."""
+    report = issue_archiver.archive(db, max_batches=max_batches)
+    return {**report, "tables": table_sizes(db)}
+
+@router.get("/sql-report")
+def get_sql_report():
+    """Queries and DB time per route, the most recent requests, and suspected N+1 statement shapes."""
+    return sql_report.get_report()
+
+@router.delete("/sql-report")
+def reset_sql_report():
+    sql_report.reset()
+    return {"message": "SQL report cleared"}
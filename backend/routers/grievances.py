@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func
 from typing import List, Optional
 import os
@@ -18,6 +18,7 @@ from backend.schemas import (
     ClosureStatusResponse
 )
 from backend.grievance_service import GrievanceService
+from backend.pagination import paginate, next_cursor, set_next_cursor
 from backend.closure_service import ClosureService
 
 logger = logging.getLogger(__name__)
@@ -26,25 +27,29 @@ router = APIRouter()
 
 @router.get("/api/grievances", response_model=List[GrievanceSummaryResponse])
 def get_grievances(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db)
 ):
     """Get list of grievances with escalation history"""
     try:
-        query = db.query(Grievance).options(
-            joinedload(Grievance.audit_logs),
-            joinedload(Grievance.jurisdiction)
-        )
+        # Escalation history in one extra query for the whole page (the jurisdiction is not part of the summary)
+        query = db.query(Grievance).options(selectinload(Grievance.audit_logs))
 
         if status:
             query = query.filter(Grievance.status == status)
         if category:
             query = query.filter(Grievance.category == category)
 
-        grievances = query.offset(offset).limit(limit).all()
+        # Newest first; keyset pagination on (created_at, id) when a cursor is given
+        grievances = paginate(
+            query, (Grievance.created_at, Grievance.id), (datetime.fromisoformat, int), limit, offset, cursor
+        ).all()
+        set_next_cursor(response, next_cursor(grievances, limit, lambda g: (g.created_at, g.id)))
 
         # Convert to response format
         result = []
@@ -82,6 +87,8 @@ def get_grievances(
 
         return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting grievances: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to retrieve grievances")
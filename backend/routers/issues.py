@@ -1,26 +1,28 @@
 from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, BackgroundTasks, status
-from fastapi.responses import JSONResponse
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from sqlalchemy.orm import Session, defer
-from sqlalchemy import func
-from typing import List, Union, Dict, Any
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union, Dict, Any
 import uuid
 import os
 import logging
-import hashlib
 from datetime import datetime, timezone
 
-from backend.database import get_db
-from backend.models import Issue, PushSubscription
+from backend.database import get_db, get_async_db, run_with_session, run_with_async_session
+from backend.models import Issue, IssueActionPlan, IssueArchive, PushSubscription
 from backend.schemas import (
     IssueCreateWithDeduplicationResponse, IssueCategory, NearbyIssueResponse,
     DeduplicationCheckResponse, IssueSummaryResponse, VoteResponse,
     IssueStatusUpdateRequest, IssueStatusUpdateResponse, PushSubscriptionRequest,
-    PushSubscriptionResponse, BlockchainVerificationResponse
+    PushSubscriptionResponse, BlockchainVerificationResponse, IssueClusterResponse,
+    ChainRangeVerificationResponse, InclusionProofResponse, IssueSearchResultResponse, IssueStatus,
+    IssueActionPlanResponse
 )
 from backend.utils import (
-    check_upload_limits, validate_uploaded_file, save_file_blocking, save_issue_db,
+    check_upload_limits, validate_uploaded_file, save_file_blocking,
     process_uploaded_image, save_processed_image,
     UPLOAD_LIMIT_PER_USER, UPLOAD_LIMIT_PER_IP
 )
@@ -28,8 +30,24 @@ from backend.tasks import (
     process_action_plan_background, create_grievance_from_issue_background,
     send_status_notification
 )
-from backend.spatial_utils import get_bounding_box, find_nearby_issues
-from backend.cache import recent_issues_cache, nearby_issues_cache
+from backend.spatial_index import (
+    open_issue_index, find_nearby_open_issues, find_nearest_open_issues, DEDUP_RADIUS_METERS
+)
+from backend.issue_clusters import find_issue_clusters
+from backend.issue_search import search_issues
+from backend.nearby_cache import nearby_cache
+from backend.upvote_buffer import upvote_buffer
+from backend.issue_counters import record_status_change
+from backend.integrity_chain import integrity_chain, chain_hash
+from backend.chain_audit import verify_range, prove_inclusion
+from backend.issue_archive import find_issue_row, issue_rows, restore_issue
+from backend.response_cache import EncodedPayload, encode_payload, payload_response
+from backend.pagination import paginate, decode_cursor, next_cursor, set_next_cursor
+from backend.spatial_utils import haversine_distance
+from backend.cache import (
+    recent_issues_cache, issue_tag, TAG_ISSUES_RECENT, TAG_ISSUES_STATS, TAG_ISSUES_LEADERBOARD,
+    DASHBOARD_STALE_TTL
+)
 from backend.hf_api_service import verify_resolution_vqa
 from backend.dependencies import get_http_client
 from backend.rag_service import rag_service
@@ -38,6 +56,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Largest id span audited by one /api/issues/chain/verify request
+CHAIN_VERIFY_MAX_RANGE = 100000
+
+# Sort key of issue lists (newest first); id makes it unique
+ISSUE_PAGE_KEY = (Issue.created_at, Issue.id)
+ISSUE_CURSOR_PARSERS = (datetime.fromisoformat, int)
+
+def _invalidate_nearby_cache(latitude, longitude):
+    """Drop cached nearby results around an issue that changed (no-op without coordinates)."""
+    # The write is already committed; a failed invalidation only leaves entries to expire
+    try:
+        if latitude is not None and longitude is not None:
+            nearby_cache.invalidate_at(latitude, longitude)
+    except Exception as e:
+        logger.error(f"Error invalidating nearby cache: {e}")
+
+async def _invalidate_nearby_cache_async(latitude, longitude):
+    """_invalidate_nearby_cache for async routes (shared cache backend calls run off the event loop)."""
+    try:
+        if latitude is not None and longitude is not None:
+            await nearby_cache.invalidate_at_async(latitude, longitude)
+    except Exception as e:
+        logger.error(f"Error invalidating nearby cache: {e}")
+
 @router.post("/api/issues", response_model=IssueCreateWithDeduplicationResponse, status_code=201)
 async def create_issue(
     request: Request,
@@ -50,7 +92,7 @@ async def create_issue(
     longitude: float = Form(None, ge=-180, le=180),
     location: str = Form(None, max_length=200),
     image: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     image_path = None
 
@@ -61,7 +103,8 @@ async def create_issue(
         # Use user_email if provided, otherwise IP
         identifier = user_email if user_email else client_ip
         limit = UPLOAD_LIMIT_PER_USER if user_email else UPLOAD_LIMIT_PER_IP
-        check_upload_limits(identifier, limit)
+        # The rate limit storage may be a shared SQLite file: keep its write off the event loop
+        await run_in_threadpool(check_upload_limits, identifier, limit)
 
     try:
         # Save image if provided (optimized single pass)
@@ -93,32 +136,10 @@ async def create_issue(
 
     if latitude is not None and longitude is not None:
         try:
-            # Find existing open issues within 50 meters
-            # Optimization: Use bounding box to filter candidates in SQL
-            min_lat, max_lat, min_lon, max_lon = get_bounding_box(latitude, longitude, 50.0)
-
-            # Performance Boost: Use column projection to avoid loading full model instances
-            open_issues = await run_in_threadpool(
-                lambda: db.query(
-                    Issue.id,
-                    Issue.description,
-                    Issue.category,
-                    Issue.latitude,
-                    Issue.longitude,
-                    Issue.upvotes,
-                    Issue.created_at,
-                    Issue.status
-                ).filter(
-                    Issue.status == "open",
-                    Issue.latitude >= min_lat,
-                    Issue.latitude <= max_lat,
-                    Issue.longitude >= min_lon,
-                    Issue.longitude <= max_lon
-                ).all()
-            )
-
-            nearby_issues_with_distance = find_nearby_issues(
-                open_issues, latitude, longitude, radius_meters=50.0
+            # Find existing open issues within 50 meters (top 3 closest)
+            # Optimization: Answered from the in-memory open issue index; only matches hit the DB
+            nearby_issues_with_distance = await db.run_sync(
+                find_nearby_open_issues, latitude, longitude, DEDUP_RADIUS_METERS, 3
             )
 
             if nearby_issues_with_distance:
@@ -135,7 +156,7 @@ async def create_issue(
                         created_at=issue.created_at,
                         status=issue.status
                     )
-                    for issue, distance in nearby_issues_with_distance[:3]  # Limit to top 3 closest
+                    for issue, distance in nearby_issues_with_distance
                 ]
 
                 deduplication_info = DeduplicationCheckResponse(
@@ -148,16 +169,9 @@ async def create_issue(
                 closest_issue_row, _ = nearby_issues_with_distance[0]
                 linked_issue_id = closest_issue_row.id
 
-                # Atomic update for upvotes to prevent race conditions
-                # Use query update to avoid fetching the full model instance
-                await run_in_threadpool(
-                    lambda: db.query(Issue).filter(Issue.id == linked_issue_id).update({
-                        Issue.upvotes: func.coalesce(Issue.upvotes, 0) + 1
-                    }, synchronize_session=False)
-                )
-
-                # Commit the upvote
-                await run_in_threadpool(db.commit)
+                # Performance Boost: Buffered; written with other pending votes in one batched flush
+                upvote_buffer.add(linked_issue_id)
+                await _invalidate_nearby_cache_async(closest_issue_row.latitude, closest_issue_row.longitude)
 
                 logger.info(f"Spatial deduplication: Linked new report to existing issue {linked_issue_id}")
 
@@ -168,17 +182,6 @@ async def create_issue(
     try:
         # Save to DB only if no nearby issues found or deduplication failed
         if deduplication_info is None or not deduplication_info.has_nearby_issues:
-            # Blockchain feature: calculate integrity hash for the report
-            # Optimization: Fetch only the last hash to maintain the chain with minimal overhead
-            prev_issue = await run_in_threadpool(
-                lambda: db.query(Issue.integrity_hash).order_by(Issue.id.desc()).first()
-            )
-            prev_hash = prev_issue[0] if prev_issue and prev_issue[0] else ""
-
-# Simple but effective SHA-256 chaining
-            hash_content = f"{description}|{category}|{prev_hash}"
-            integrity_hash = hashlib.sha256(hash_content.encode()).hexdigest()
-
             # RAG Retrieval (New)
             relevant_rule = rag_service.retrieve(description)
             initial_action_plan = None
@@ -194,13 +197,16 @@ async def create_issue(
                 user_email=user_email,
                 latitude=latitude,
                 longitude=longitude,
-                location=location,
-                action_plan=initial_action_plan,
-                integrity_hash=integrity_hash
+                location=location
             )
-
-            # Offload blocking DB operations to threadpool
-            await run_in_threadpool(save_issue_db, db, new_issue)
+            if initial_action_plan:
+                # Stored in issue_action_plans, inserted with the issue
+                new_issue.action_plan = initial_action_plan
+
+            # Blockchain feature: the chain service seals the report with its integrity hash
+            # Optimization: The chain head is kept in memory (no predecessor lookup per insert)
+            # and appends are serialised, so concurrent reports cannot fork the chain
+            await integrity_chain.append_async(db, [new_issue])
         else:
             # Don't create new issue, just return deduplication info
             new_issue = None
@@ -222,9 +228,10 @@ async def create_issue(
         # Create grievance for escalation management
         background_tasks.add_task(create_grievance_from_issue_background, new_issue.id)
 
-        # Invalidate cache so new issue appears
+        # Invalidate cached listings and aggregates so the new issue appears
         try:
-            recent_issues_cache.clear()
+            await recent_issues_cache.invalidate_tags_async(TAG_ISSUES_RECENT, TAG_ISSUES_STATS, TAG_ISSUES_LEADERBOARD)
+            await _invalidate_nearby_cache_async(new_issue.latitude, new_issue.longitude)
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
 
@@ -255,81 +262,73 @@ async def create_issue(
         )
 
 @router.post("/api/issues/{issue_id}/vote", response_model=VoteResponse)
-async def upvote_issue(issue_id: int, db: Session = Depends(get_db)):
+async def upvote_issue(issue_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Upvote an issue.
-    Optimized: Performs atomic update without loading full model instance.
+    Performance Boost: The vote is buffered in memory and written with other
+    pending votes in one batched UPDATE, so a popular issue no longer turns
+    every vote into a commit on the same row. The count returned is optimistic
+    (stored value plus pending votes).
     """
-    # Use update() for atomic increment and to avoid full model overhead
-    updated_count = await run_in_threadpool(
-        lambda: db.query(Issue).filter(Issue.id == issue_id).update({
-            Issue.upvotes: func.coalesce(Issue.upvotes, 0) + 1
-        }, synchronize_session=False)
-    )
+    stored_upvotes = (await db.execute(
+        select(Issue.upvotes).where(Issue.id == issue_id)
+    )).first()
 
-    if not updated_count:
+    if not stored_upvotes:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    await run_in_threadpool(db.commit)
-
-    # Fetch only the updated upvote count using column projection
-    new_upvotes = await run_in_threadpool(
-        lambda: db.query(Issue.upvotes).filter(Issue.id == issue_id).scalar()
-    )
+    pending = upvote_buffer.add(issue_id)
 
     return VoteResponse(
         id=issue_id,
-        upvotes=new_upvotes or 0,
+        upvotes=(stored_upvotes.upvotes or 0) + pending,
         message="Issue upvoted successfully"
     )
 
 @router.get("/api/issues/nearby", response_model=List[NearbyIssueResponse])
-def get_nearby_issues(
+async def get_nearby_issues(
     latitude: float = Query(..., ge=-90, le=90, description="Latitude of the location"),
     longitude: float = Query(..., ge=-180, le=180, description="Longitude of the location"),
     radius: float = Query(50.0, ge=10, le=500, description="Search radius in meters"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get issues near a specific location for deduplication purposes.
     Returns issues within the specified radius, sorted by distance.
     """
     try:
-        # Check cache first
-        cache_key = f"{latitude:.5f}_{longitude:.5f}_{radius}_{limit}"
-        cached_data = nearby_issues_cache.get(cache_key)
-        if cached_data:
-            return cached_data
-
-        # Query open issues with coordinates
-        # Optimization: Use bounding box to filter candidates in SQL
-        min_lat, max_lat, min_lon, max_lon = get_bounding_box(latitude, longitude, radius)
-
-        # Performance Boost: Use column projection to avoid loading full model instances
-        open_issues = db.query(
-            Issue.id,
-            Issue.description,
-            Issue.category,
-            Issue.latitude,
-            Issue.longitude,
-            Issue.upvotes,
-            Issue.created_at,
-            Issue.status
-        ).filter(
-            Issue.status == "open",
-            Issue.latitude >= min_lat,
-            Issue.latitude <= max_lat,
-            Issue.longitude >= min_lon,
-            Issue.longitude <= max_lon
-        ).all()
-
-        nearby_issues_with_distance = find_nearby_issues(
-            open_issues, latitude, longitude, radius_meters=radius
+        # Optimization: Cached per grid cell and radius bucket, so nearby users
+        # share an entry; the cached superset is filtered exactly per request.
+        # Issues are cached pre-encoded, so the response is assembled from bytes.
+        return Response(
+            content=await nearby_cache.get_nearby_json_async(db, latitude, longitude, radius, limit),
+            media_type="application/json"
+        )
+
+    except Exception as e:
+        logger.error(f"Error getting nearby issues: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to retrieve nearby issues")
+
+@router.get("/api/issues/nearest", response_model=List[NearbyIssueResponse])
+def get_nearest_issues(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude of the location"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude of the location"),
+    k: int = Query(5, ge=1, le=50, description="Number of closest issues to return"),
+    max_radius: float = Query(5000.0, ge=10, le=50000, description="Give up beyond this distance in meters"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the k open issues closest to a location, sorted by distance.
+    Searches outward from the location, so sparse areas still return results
+    and dense areas stop as soon as k issues are found.
+    """
+    try:
+        nearest_issues_with_distance = find_nearest_open_issues(
+            db, latitude, longitude, k, max_radius
         )
 
-        # Convert to response format and limit results
-        nearby_responses = [
+        return [
             NearbyIssueResponse(
                 id=issue.id,
                 description=issue.description[:100] + "..." if len(issue.description) > 100 else issue.description,
@@ -341,35 +340,129 @@ def get_nearby_issues(
                 created_at=issue.created_at,
                 status=issue.status
             )
-            for issue, distance in nearby_issues_with_distance[:limit]
+            for issue, distance in nearest_issues_with_distance
         ]
 
-        # Update cache
-        nearby_issues_cache.set(nearby_responses, cache_key)
+    except Exception as e:
+        logger.error(f"Error getting nearest issues: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to retrieve nearest issues")
+
+def _parse_bbox(bbox: str):
+    """(min_lon, min_lat, max_lon, max_lat) of a bbox query parameter; malformed boxes are a 400."""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lon,min_lat,max_lon,max_lat")
+    if not (-180 <= min_lon <= max_lon <= 180 and -90 <= min_lat <= max_lat <= 90):
+        raise HTTPException(status_code=400, detail="bbox is out of range or min > max")
+    return min_lon, min_lat, max_lon, max_lat
+
+@router.get("/api/issues/search", response_model=List[IssueSearchResultResponse])
+async def search_issues_endpoint(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in description, location or category"),
+    status: Optional[IssueStatus] = Query(None, description="Only issues with this status"),
+    bbox: Optional[str] = Query(None, description="Only issues inside min_lon,min_lat,max_lon,max_lat"),
+    limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full-text search over issues, best match first.
+    Performance Boost: Answered from the FTS5 (SQLite) / tsvector (PostgreSQL)
+    index instead of LIKE '%...%' scans of the issues table.
+    """
+    box = _parse_bbox(bbox) if bbox else None
+    try:
+        rows = await db.run_sync(
+            search_issues, q, status.value if status else None, box, limit, cursor
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Issue search failed for {q!r}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to search issues")
+
+    set_next_cursor(response, next_cursor(rows, limit, lambda row: (row.rank, row.id)))
+    results = []
+    for row in rows:
+        desc = row.description or ""
+        results.append(IssueSearchResultResponse(
+            id=row.id,
+            category=row.category,
+            description=desc[:100] + "..." if len(desc) > 100 else desc,
+            created_at=row.created_at,
+            image_path=row.image_path,
+            status=row.status,
+            upvotes=row.upvotes if row.upvotes is not None else 0,
+            location=row.location,
+            latitude=row.latitude,
+            longitude=row.longitude,
+            rank=row.rank
+        ))
+    return results
+
+@router.get("/api/issues/clusters", response_model=List[IssueClusterResponse])
+def get_issue_clusters(
+    bbox: str = Query(..., description="Bounding box as min_lon,min_lat,max_lon,max_lat"),
+    min_size: int = Query(1, ge=1, le=1000, description="Only return clusters with at least this many issues"),
+    limit: int = Query(200, ge=1, le=1000, description="Maximum number of clusters"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get clusters of open issues (likely duplicates) whose centroid lies in the box.
+    Clusters are maintained incrementally as issues are created and closed,
+    so this does not re-run clustering per request.
+    """
+    min_lon, min_lat, max_lon, max_lat = _parse_bbox(bbox)
 
-        return nearby_responses
+    try:
+        clusters = find_issue_clusters(db, min_lat, min_lon, max_lat, max_lon, min_size, limit)
+
+        return [
+            IssueClusterResponse(
+                cluster_id=summary.cluster_id,
+                size=summary.size,
+                centroid_latitude=summary.centroid_latitude,
+                centroid_longitude=summary.centroid_longitude,
+                representative=NearbyIssueResponse(
+                    id=issue.id,
+                    description=issue.description[:100] + "..." if len(issue.description) > 100 else issue.description,
+                    category=issue.category,
+                    latitude=issue.latitude,
+                    longitude=issue.longitude,
+                    distance_meters=haversine_distance(
+                        summary.centroid_latitude, summary.centroid_longitude, issue.latitude, issue.longitude
+                    ),
+                    upvotes=issue.upvotes or 0,
+                    created_at=issue.created_at,
+                    status=issue.status
+                )
+            )
+            for summary, issue in clusters
+        ]
 
     except Exception as e:
-        logger.error(f"Error getting nearby issues: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Failed to retrieve nearby issues")
+        logger.error(f"Error getting issue clusters: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to retrieve issue clusters")
 
 @router.post("/api/issues/{issue_id}/verify", response_model=Union[VoteResponse, Dict[str, Any]])
 async def verify_issue_endpoint(
     issue_id: int,
     request: Request,
     image: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Verify an issue manually or via AI.
     Optimized: Uses column projection for initial check and atomic updates.
     """
     # Performance Boost: Fetch only necessary columns
-    issue_data = await run_in_threadpool(
-        lambda: db.query(
-            Issue.id, Issue.category, Issue.status, Issue.upvotes
-        ).filter(Issue.id == issue_id).first()
-    )
+    issue_data = (await db.execute(
+        select(
+            Issue.id, Issue.category, Issue.status, Issue.upvotes, Issue.latitude, Issue.longitude
+        ).where(Issue.id == issue_id)
+    )).first()
 
     if not issue_data:
         raise HTTPException(status_code=404, detail="Issue not found")
@@ -412,13 +505,16 @@ async def verify_issue_endpoint(
                 is_resolved = True
                 if issue_data.status != "resolved":
                     # Perform update using primary key
-                    await run_in_threadpool(
-                        lambda: db.query(Issue).filter(Issue.id == issue_id).update({
-                            Issue.status: "verified",
-                            Issue.verified_at: datetime.now(timezone.utc)
-                        }, synchronize_session=False)
+                    await db.execute(
+                        update(Issue).where(Issue.id == issue_id)
+                        .values(status="verified", verified_at=datetime.now(timezone.utc))
+                        .execution_options(synchronize_session=False)
                     )
-                    await run_in_threadpool(db.commit)
+                    await db.run_sync(record_status_change, issue_data.status, "verified")
+                    await db.commit()
+                    open_issue_index.discard(issue_id)
+                    await recent_issues_cache.invalidate_tags_async(issue_tag(issue_id), TAG_ISSUES_STATS)
+                    await _invalidate_nearby_cache_async(issue_data.latitude, issue_data.longitude)
 
             return {
                 "is_resolved": is_resolved,
@@ -433,35 +529,43 @@ async def verify_issue_endpoint(
         # Manual Verification Logic (Vote)
         # Atomic increment by 2 for verification
         # Optimized: Use a single transaction for all updates
-        await run_in_threadpool(
-            lambda: db.query(Issue).filter(Issue.id == issue_id).update({
-                Issue.upvotes: func.coalesce(Issue.upvotes, 0) + 2
-            }, synchronize_session=False)
-        )
-
-        # Flush to DB so we can query the updated value within the same transaction
-        await run_in_threadpool(db.flush)
-
-        # Performance Boost: Fetch only needed fields to check auto-verification threshold
-        # This query is performed within the same transaction after flush
-        updated_issue = await run_in_threadpool(
-            lambda: db.query(Issue.upvotes, Issue.status).filter(Issue.id == issue_id).first()
-        )
-
-        final_status = updated_issue.status if updated_issue else "open"
-        final_upvotes = updated_issue.upvotes if updated_issue else 0
-
-        if updated_issue and updated_issue.upvotes >= 5 and updated_issue.status == "open":
-            await run_in_threadpool(
-                lambda: db.query(Issue).filter(Issue.id == issue_id).update({
-                    Issue.status: "verified"
-                }, synchronize_session=False)
-            )
-            logger.info(f"Issue {issue_id} automatically verified due to {updated_issue.upvotes} upvotes")
-            final_status = "verified"
-
-        # Final commit for all changes in the transaction
-        await run_in_threadpool(db.commit)
+        # Performance Boost: RETURNING yields the fields needed for the
+        # auto-verification threshold from the update itself
+        # Buffered upvotes of this issue are written here too, so the threshold sees them
+        pending_upvotes = upvote_buffer.take(issue_id)
+        try:
+            updated_issue = (await db.execute(
+                update(Issue).where(Issue.id == issue_id)
+                .values(upvotes=func.coalesce(Issue.upvotes, 0) + 2 + pending_upvotes)
+                .returning(Issue.upvotes, Issue.status)
+                .execution_options(synchronize_session=False)
+            )).first()
+
+            final_status = updated_issue.status if updated_issue else "open"
+            final_upvotes = updated_issue.upvotes if updated_issue else 0
+
+            if updated_issue and updated_issue.upvotes >= 5 and updated_issue.status == "open":
+                await db.execute(
+                    update(Issue).where(Issue.id == issue_id)
+                    .values(status="verified", verified_at=datetime.now(timezone.utc))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.run_sync(record_status_change, "open", "verified")
+                logger.info(f"Issue {issue_id} automatically verified due to {updated_issue.upvotes} upvotes")
+                final_status = "verified"
+
+            # Final commit for all changes in the transaction
+            await db.commit()
+        except Exception:
+            upvote_buffer.restore({issue_id: pending_upvotes})
+            raise
+        if final_status == "open":
+            open_issue_index.add_upvotes(issue_id, 2 + pending_upvotes)
+        else:
+            open_issue_index.discard(issue_id)
+            await recent_issues_cache.invalidate_tags_async(TAG_ISSUES_STATS)
+        await recent_issues_cache.invalidate_tags_async(issue_tag(issue_id))
+        await _invalidate_nearby_cache_async(issue_data.latitude, issue_data.longitude)
 
         return VoteResponse(
             id=issue_id,
@@ -477,6 +581,10 @@ def update_issue_status(
 ):
     """Update issue status via secure reference ID (for government portals)"""
     issue = db.query(Issue).filter(Issue.reference_id == request.reference_id).first()
+    restored = not issue and restore_issue(db, reference_id=request.reference_id)
+    if restored:
+        # Archived issue: moved back to the hot table (committed with the update)
+        issue = db.query(Issue).filter(Issue.reference_id == request.reference_id).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
@@ -512,6 +620,8 @@ def update_issue_status(
 
     db.commit()
     db.refresh(issue)
+    recent_issues_cache.invalidate_tags(issue_tag(issue.id), TAG_ISSUES_STATS, *([TAG_ISSUES_RECENT] if restored else []))
+    _invalidate_nearby_cache(issue.latitude, issue.longitude)
 
     # Send notification to citizen
     background_tasks.add_task(send_status_notification, issue.id, old_status, request.status.value, request.notes)
@@ -566,16 +676,18 @@ def subscribe_push_notifications(
 
 @router.get("/api/issues/user", response_model=List[IssueSummaryResponse])
 def get_user_issues(
+    response: Response,
     user_email: str = Query(..., description="Email of the user"),
     limit: int = Query(10, ge=1, le=50, description="Number of issues to return"),
     offset: int = Query(0, ge=0, description="Number of issues to skip"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db)
 ):
     """
     Get issues reported by a specific user (identified by email).
     Optimized: Uses column projection to avoid loading full model instances and large fields.
     """
-    results = db.query(
+    query = db.query(
         Issue.id,
         Issue.category,
         Issue.description,
@@ -586,9 +698,10 @@ def get_user_issues(
         Issue.location,
         Issue.latitude,
         Issue.longitude
-    ).filter(Issue.user_email == user_email)\
-        .order_by(Issue.created_at.desc())\
-        .offset(offset).limit(limit).all()
+    ).filter(Issue.user_email == user_email)
+    # Performance Boost: Keyset pagination on (created_at, id); deep pages are an index range scan
+    results = paginate(query, ISSUE_PAGE_KEY, ISSUE_CURSOR_PARSERS, limit, offset, cursor).all()
+    set_next_cursor(response, next_cursor(results, limit, lambda row: (row.created_at, row.id)))
 
     # Convert results to dictionaries for faster serialization and schema compliance
     data = []
@@ -611,33 +724,54 @@ def get_user_issues(
 
     return data
 
+@router.get("/api/issues/{issue_id}/action-plan", response_model=IssueActionPlanResponse)
+async def get_issue_action_plan(issue_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Action plan of an issue (messaging drafts and relevant rule).
+    Poll this after reporting: action_plan stays null until generation finishes.
+    """
+    record = (await db.execute(
+        select(IssueActionPlan.plan, IssueActionPlan.updated_at).where(IssueActionPlan.issue_id == issue_id)
+    )).first()
+    if record is None:
+        exists = (await db.execute(select(Issue.id).where(Issue.id == issue_id))).first()
+        if not exists:
+            # Archived issues carry their plan in the archive row
+            archived = (await db.execute(
+                select(IssueArchive.action_plan, IssueArchive.archived_at).where(IssueArchive.id == issue_id)
+            )).first()
+            if archived is None:
+                raise HTTPException(status_code=404, detail="Issue not found")
+            return IssueActionPlanResponse(issue_id=issue_id, action_plan=archived.action_plan,
+                                           updated_at=archived.archived_at if archived.action_plan else None)
+        return IssueActionPlanResponse(issue_id=issue_id)
+    return IssueActionPlanResponse(issue_id=issue_id, action_plan=record.plan, updated_at=record.updated_at)
+
 @router.get("/api/issues/{issue_id}/blockchain-verify", response_model=BlockchainVerificationResponse)
 async def verify_blockchain_integrity(issue_id: int, db: Session = Depends(get_db)):
     """
     Verify the cryptographic integrity of a report using the blockchain-style chaining.
     Optimized: Uses column projection to fetch only needed data.
     """
-    # Fetch current issue data
+    # Fetch current issue data (archived issues are verified too)
     current_issue = await run_in_threadpool(
-        lambda: db.query(
-            Issue.id, Issue.description, Issue.category, Issue.integrity_hash
-        ).filter(Issue.id == issue_id).first()
+        find_issue_row, db, ["id", "description", "category", "integrity_hash", "prev_hash"], issue_id=issue_id
     )
 
     if not current_issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    # Fetch previous issue's integrity hash to verify the chain
-    prev_issue_hash = await run_in_threadpool(
-        lambda: db.query(Issue.integrity_hash).filter(Issue.id < issue_id).order_by(Issue.id.desc()).first()
-    )
-
-    prev_hash = prev_issue_hash[0] if prev_issue_hash and prev_issue_hash[0] else ""
+    prev_hash = current_issue.prev_hash
+    if prev_hash is None:
+        # Sealed before chain links were stored: the predecessor is the previous row
+        prev_issue = await run_in_threadpool(
+            issue_rows, db, ["id", "integrity_hash"], max_id=issue_id - 1, descending=True, limit=1
+        )
+        prev_hash = prev_issue[0].integrity_hash if prev_issue and prev_issue[0].integrity_hash else ""
 
     # Recompute hash based on current data and previous hash
     # Chaining logic: hash(description|category|prev_hash)
-    hash_content = f"{current_issue.description}|{current_issue.category}|{prev_hash}"
-    computed_hash = hashlib.sha256(hash_content.encode()).hexdigest()
+    computed_hash = chain_hash(current_issue.description, current_issue.category, prev_hash)
 
     is_valid = (computed_hash == current_issue.integrity_hash)
 
@@ -653,20 +787,95 @@ async def verify_blockchain_integrity(issue_id: int, db: Session = Depends(get_d
         message=message
     )
 
+@router.get("/api/issues/chain/verify", response_model=ChainRangeVerificationResponse)
+def verify_blockchain_range(
+    start_id: int = Query(..., ge=1, description="First issue id to audit"),
+    end_id: int = Query(..., ge=1, description="Last issue id to audit (inclusive)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Audit a range of the integrity chain: every seal, every link and the Merkle
+    root of every checkpointed block inside the range.
+    Performance Boost: rows are streamed in keyset batches instead of one request (and two queries) per issue.
+    """
+    if end_id < start_id:
+        raise HTTPException(status_code=400, detail="end_id must not be smaller than start_id")
+    if end_id - start_id + 1 > CHAIN_VERIFY_MAX_RANGE:
+        raise HTTPException(status_code=400, detail=f"At most {CHAIN_VERIFY_MAX_RANGE} ids can be audited per request")
+    try:
+        return verify_range(db, start_id, end_id)
+    except Exception as e:
+        logger.error(f"Chain range verification failed for {start_id}..{end_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to verify the chain range")
+
+@router.get("/api/issues/{issue_id}/inclusion-proof", response_model=InclusionProofResponse)
+def get_inclusion_proof(issue_id: int, db: Session = Depends(get_db)):
+    """
+    Merkle inclusion proof of an issue against the latest chain checkpoint
+    (O(log n) sibling hashes; check it with backend.chain_audit.verify_inclusion_proof).
+    """
+    proof = prove_inclusion(db, issue_id)
+    if proof is None:
+        raise HTTPException(status_code=404, detail="Issue not found or not checkpointed yet")
+    return proof
+
 @router.get("/api/issues/recent", response_model=List[IssueSummaryResponse])
-def get_recent_issues(
+async def get_recent_issues(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Number of issues to return"),
     offset: int = Query(0, ge=0, description="Number of issues to skip"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    cache_key = f"recent_issues_{limit}_{offset}"
-    cached_data = recent_issues_cache.get(cache_key)
-    if cached_data:
-        return JSONResponse(content=cached_data)
+    # Performance Boost: Pages are cached as final JSON bytes (plus gzip); hits skip serialization
+    payload = await get_cached_recent_issues_async(db, limit, offset, cursor)
+    response = payload_response(payload, request)
+    set_next_cursor(response, next_cursor(payload.data, limit, lambda item: (item["created_at"], item["id"])))
+    return response
+
+def _recent_issues_tags(payload: EncodedPayload) -> List[str]:
+    return [TAG_ISSUES_RECENT] + [issue_tag(item["id"]) for item in payload.data]
+
+def get_cached_recent_issues(db: Session, limit: int = 10, offset: int = 0,
+                             cursor: Optional[str] = None) -> EncodedPayload:
+    """Encoded recent issues page served from recent_issues_cache (also used by the startup warmer)."""
+    cache_key = _recent_issues_key(limit, offset, cursor)
+    # Optimization: Concurrent cache misses share one computation (single-flight);
+    # pages are tagged so that writes to any listed issue drop them, and stale
+    # pages are served while a background refresh recomputes them
+    return recent_issues_cache.get_or_compute(
+        cache_key,
+        lambda: encode_payload(compute_recent_issues(db, limit, offset, cursor)),
+        tags=_recent_issues_tags,
+        stale_ttl=DASHBOARD_STALE_TTL,
+        refresh=lambda: encode_payload(run_with_session(compute_recent_issues, limit, offset, cursor))
+    )
+
+async def get_cached_recent_issues_async(db: AsyncSession, limit: int = 10, offset: int = 0,
+                                         cursor: Optional[str] = None) -> EncodedPayload:
+    """get_cached_recent_issues for an AsyncSession (same cache entries)."""
+    if cursor:
+        # Malformed cursors are rejected before anything is cached
+        decode_cursor(cursor, ISSUE_CURSOR_PARSERS)
+    return await recent_issues_cache.get_or_compute_async(
+        _recent_issues_key(limit, offset, cursor),
+        lambda: _encode_recent_issues(db, limit, offset, cursor),
+        tags=_recent_issues_tags,
+        stale_ttl=DASHBOARD_STALE_TTL,
+        refresh=lambda: run_with_async_session(_encode_recent_issues, limit, offset, cursor)
+    )
 
+def _recent_issues_key(limit: int, offset: int, cursor: Optional[str]) -> str:
+    return f"recent_issues_{limit}_{offset}" + (f"_{cursor}" if cursor else "")
+
+async def _encode_recent_issues(db: AsyncSession, limit: int, offset: int, cursor: Optional[str]) -> EncodedPayload:
+    return encode_payload(await db.run_sync(compute_recent_issues, limit, offset, cursor))
+
+def compute_recent_issues(db: Session, limit: int, offset: int, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Recent issue summaries (JSON-ready), newest first."""
     # Fetch issues with pagination
     # Optimized: Use column projection to fetch only needed fields
-    results = db.query(
+    query = db.query(
         Issue.id,
         Issue.category,
         Issue.description,
@@ -677,7 +886,9 @@ def get_recent_issues(
         Issue.location,
         Issue.latitude,
         Issue.longitude
-    ).order_by(Issue.created_at.desc()).offset(offset).limit(limit).all()
+    )
+    # Performance Boost: Keyset pagination on (created_at, id) when a cursor is given
+    results = paginate(query, ISSUE_PAGE_KEY, ISSUE_CURSOR_PARSERS, limit, offset, cursor).all()
 
     # Convert to Pydantic models for validation and serialization
     data = []
@@ -699,6 +910,4 @@ def get_recent_issues(
             "longitude": row.longitude
         })
 
-    # Thread-safe cache update
-    recent_issues_cache.set(data, cache_key)
     return data
@@ -1,17 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, union_all
 from datetime import datetime, timezone
 import logging
 
-from backend.database import get_db
-from backend.models import Issue
+from backend.database import get_db, run_with_session, get_engine_info
+from backend.response_cache import EncodedPayload, encode_payload, payload_response
+from backend.models import Issue, IssueArchive
+from backend.issue_counters import read_issue_counters, stats_from_counters
 from backend.schemas import (
     SuccessResponse, HealthResponse, StatsResponse, MLStatusResponse,
     ChatRequest, ChatResponse, LeaderboardResponse, LeaderboardEntry
 )
-from backend.cache import recent_issues_cache
+from backend.cache import recent_issues_cache, TAG_ISSUES_STATS, TAG_ISSUES_LEADERBOARD, DASHBOARD_STALE_TTL
 from backend.unified_detection_service import get_detection_status
 from backend.ai_service import chat_with_civic_assistant
 from backend.gemini_services import get_ai_services
@@ -37,42 +38,45 @@ def root():
 
 @router.get("/health", response_model=HealthResponse)
 def health():
+    status = "healthy"
+    database_status = "connected"
+    try:
+        database = get_engine_info()
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}", exc_info=True)
+        status, database_status, database = "degraded", "unavailable", None
+
     return HealthResponse(
-        status="healthy",
+        status=status,
         timestamp=datetime.now(timezone.utc),
         version="1.0.0",
         services={
-            "database": "connected",
+            "database": database_status,
             "ai_services": "initialized"
-        }
+        },
+        database=database
     )
 
-@router.get("/api/stats", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
-    cached_stats = recent_issues_cache.get("stats")
-    if cached_stats:
-        return JSONResponse(content=cached_stats)
-
-    total = db.query(func.count(Issue.id)).scalar()
-    resolved = db.query(func.count(Issue.id)).filter(Issue.status.in_(['resolved', 'verified'])).scalar()
-    # Pending is everything else
-    pending = total - resolved
-
-    # By category
-    cat_counts = db.query(Issue.category, func.count(Issue.id)).group_by(Issue.category).all()
-    issues_by_category = {cat: count for cat, count in cat_counts}
-
-    response = StatsResponse(
-        total_issues=total,
-        resolved_issues=resolved,
-        pending_issues=pending,
-        issues_by_category=issues_by_category
+def compute_stats(db: Session) -> dict:
+    """Aggregate issue counts for /api/stats (JSON-ready)."""
+    # Performance Boost: Read from the write-maintained issue_counters table
+    # (one row per status/category) instead of counting the issues table
+    response = StatsResponse(**stats_from_counters(read_issue_counters(db)))
+    return response.model_dump(mode='json')
+
+def get_cached_stats(db: Session) -> EncodedPayload:
+    """Encoded stats served from recent_issues_cache (also used by the startup warmer)."""
+    # Optimization: Concurrent cache misses share one computation (single-flight);
+    # stale entries are served while a background refresh recomputes them
+    return recent_issues_cache.get_or_compute(
+        "stats", lambda: encode_payload(compute_stats(db)), tags=[TAG_ISSUES_STATS],
+        stale_ttl=DASHBOARD_STALE_TTL, refresh=lambda: encode_payload(run_with_session(compute_stats))
     )
 
-    data = response.model_dump(mode='json')
-    recent_issues_cache.set(data, "stats")
-
-    return response
+@router.get("/api/stats", response_model=StatsResponse)
+def get_stats(request: Request, db: Session = Depends(get_db)):
+    # Performance Boost: Cached as final JSON bytes (plus gzip); hits skip serialization
+    return payload_response(get_cached_stats(db), request)
 
 @router.get("/api/ml-status", response_model=MLStatusResponse)
 async def ml_status():
@@ -96,24 +100,19 @@ async def chat_endpoint(request: ChatRequest):
         logger.error(f"Chat service error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Chat service temporarily unavailable")
 
-@router.get("/api/leaderboard", response_model=LeaderboardResponse)
-def get_leaderboard(db: Session = Depends(get_db)):
-    """Get top reporters leaderboard (cached)"""
-    cache_key = "leaderboard"
-    cached_data = recent_issues_cache.get(cache_key)
-    if cached_data:
-        return JSONResponse(content=cached_data)
-
-    # Group by user_email, count issues, sum upvotes
+def compute_leaderboard(db: Session) -> dict:
+    """Top reporters for /api/leaderboard (JSON-ready)."""
+    # Group by user_email, count issues, sum upvotes (archived issues count too)
     # Optimization: Only select needed columns and use aggregation
+    reports = union_all(*(
+        select(model.user_email, model.upvotes).where(model.user_email.isnot(None), model.user_email != "")
+        for model in (Issue, IssueArchive)
+    )).subquery()
     results = db.query(
-        Issue.user_email,
-        func.count(Issue.id).label('count'),
-        func.sum(Issue.upvotes).label('total_upvotes')
-    ).filter(
-        Issue.user_email.isnot(None),
-        Issue.user_email != ""
-    ).group_by(Issue.user_email).order_by(func.count(Issue.id).desc()).limit(10).all()
+        reports.c.user_email,
+        func.count().label('count'),
+        func.sum(reports.c.upvotes).label('total_upvotes')
+    ).group_by(reports.c.user_email).order_by(func.count().desc()).limit(10).all()
 
     leaderboard_data = []
     for idx, (email, count, upvotes) in enumerate(results):
@@ -134,11 +133,23 @@ def get_leaderboard(db: Session = Depends(get_db)):
             rank=idx + 1
         ).model_dump(mode='json'))
 
-    response_data = {"leaderboard": leaderboard_data}
+    return {"leaderboard": leaderboard_data}
+
+def get_cached_leaderboard(db: Session) -> EncodedPayload:
+    """Encoded leaderboard served from recent_issues_cache (also used by the startup warmer)."""
     # Cache for 5 minutes to reduce DB load on frequent hits
-    recent_issues_cache.set(response_data, cache_key)
+    # Optimization: Concurrent cache misses share one computation (single-flight);
+    # stale entries are served while a background refresh recomputes them
+    return recent_issues_cache.get_or_compute(
+        "leaderboard", lambda: encode_payload(compute_leaderboard(db)), tags=[TAG_ISSUES_LEADERBOARD],
+        stale_ttl=DASHBOARD_STALE_TTL, refresh=lambda: encode_payload(run_with_session(compute_leaderboard))
+    )
 
-    return response_data
+@router.get("/api/leaderboard", response_model=LeaderboardResponse)
+def get_leaderboard(request: Request, db: Session = Depends(get_db)):
+    """Get top reporters leaderboard (cached)"""
+    # Performance Boost: Cached as final JSON bytes (plus gzip); hits skip serialization
+    return payload_response(get_cached_leaderboard(db), request)
 
 
 @router.get("/api/mh/rep-contacts")
@@ -53,6 +53,14 @@ class IssueSummaryResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class IssueSearchResultResponse(IssueSummaryResponse):
+    rank: float = Field(..., description="Relevance of the match (bm25 on SQLite, ts_rank_cd on PostgreSQL)")
+
+class IssueActionPlanResponse(BaseModel):
+    issue_id: int = Field(..., description="Issue ID")
+    action_plan: Optional[Dict[str, Any]] = Field(None, description="Generated action plan (None while it is being generated)")
+    updated_at: Optional[datetime] = Field(None, description="When the plan was last written")
+
 class IssueResponse(IssueSummaryResponse):
     action_plan: Optional[Union[Dict[str, Any], Any]] = Field(None, description="Generated action plan")
 
@@ -124,6 +132,7 @@ class HealthResponse(BaseModel):
     timestamp: datetime = Field(..., description="Health check timestamp")
     version: Optional[str] = Field(None, description="API version")
     services: Optional[Dict[str, str]] = Field(None, description="Service status details")
+    database: Optional[Dict[str, Any]] = Field(None, description="Database engine settings in effect (pragmas, pool)")
 
 class MLStatusResponse(BaseModel):
     status: str = Field(..., description="ML service status")
@@ -164,6 +173,14 @@ class NearbyIssueResponse(BaseModel):
     status: str = Field(..., description="Issue status")
 
 
+class IssueClusterResponse(BaseModel):
+    cluster_id: Optional[int] = Field(None, description="Cluster ID (stable while the cluster exists)")
+    size: int = Field(..., description="Number of open issues in the cluster")
+    centroid_latitude: float = Field(..., description="Average latitude of the cluster")
+    centroid_longitude: float = Field(..., description="Average longitude of the cluster")
+    representative: NearbyIssueResponse = Field(..., description="Most upvoted (then oldest) issue; distance is from the centroid")
+
+
 class DeduplicationCheckResponse(BaseModel):
     has_nearby_issues: bool = Field(..., description="Whether nearby issues were found")
     nearby_issues: List[NearbyIssueResponse] = Field(default_factory=list, description="List of nearby issues")
@@ -279,6 +296,35 @@ class BlockchainVerificationResponse(BaseModel):
     computed_hash: str = Field(..., description="Hash computed from current issue data and previous issue's hash")
     message: str = Field(..., description="Verification result message")
 
+class ChainRangeVerificationResponse(BaseModel):
+    start_id: int = Field(..., description="First issue id of the audited range")
+    end_id: int = Field(..., description="Last issue id of the audited range")
+    is_valid: bool = Field(..., description="Whether every seal, link and checkpoint in the range verified")
+    checked: int = Field(..., description="Issues read in the range")
+    sealed: int = Field(..., description="Issues in the range carrying an integrity hash")
+    invalid_count: int = Field(..., description="Seals that do not match the recomputed hash")
+    invalid_hashes: List[int] = Field(..., description="Ids of mismatching seals (first 100)")
+    broken_link_count: int = Field(..., description="Issues whose prev_hash is not the previous seal")
+    broken_links: List[int] = Field(..., description="Ids of broken links (first 100)")
+    checkpoints_checked: int = Field(..., description="Checkpointed blocks fully inside the range")
+    checkpoint_mismatches: List[int] = Field(..., description="Checkpoints whose Merkle root no longer matches")
+
+class MerkleProofStep(BaseModel):
+    position: str = Field(..., description="Side of the sibling: 'left' or 'right'")
+    hash: str = Field(..., description="Sibling hash")
+
+class InclusionProofResponse(BaseModel):
+    issue_id: int
+    integrity_hash: Optional[str] = Field(None, description="Seal of the issue")
+    leaf_hash: str = Field(..., description="sha256(0x00 || f'{issue_id}|{integrity_hash}')")
+    checkpoint_id: int = Field(..., description="Checkpoint whose block contains the issue")
+    block_index: int = Field(..., description="Position of that block among all checkpoints")
+    block_proof: List[MerkleProofStep] = Field(..., description="Path from the leaf to the block root")
+    block_root: str = Field(..., description="Merkle root stored for the block")
+    root_proof: List[MerkleProofStep] = Field(..., description="Path from the block root to the latest root")
+    root: str = Field(..., description="Root of the latest checkpoint")
+    root_checkpoint_id: int = Field(..., description="Latest checkpoint")
+
 # Auth Schemas
 class UserBase(BaseModel):
     email: str = Field(..., description="User email")
@@ -0,0 +1,643 @@
+"""
+Process-local spatial index of open issues.
+
+Spatial deduplication runs on every report, and bursts of reports from one
+event hit the same few rows over and over. This module keeps compact records
+of all *open* issues in a grid of cells sized to the dedup radius, so nearby
+lookups are answered from memory without a database round trip.
+
+The index is built at startup and kept up to date by SQLAlchemy session hooks
+(ORM inserts, status changes and deletes are applied on commit). Bulk
+query.update() writes are not visible to session hooks, so the routers call
+discard()/add_upvotes() explicitly after those commits.
+
+Other worker processes write to the same database without going through this
+process's hooks. Their writes reach the index incrementally:
+- catch_up() loads issues with ids above the highest one seen so far. It runs
+  before every lookup served from the index (dedup in create_issue, nearby
+  cache fills), so a report made in another worker is seen at once.
+- refresh() runs every OPEN_ISSUE_INDEX_REFRESH_SECONDS (see main.py). It
+  publishes the ids this process changed since the last run as one event on
+  the shared cache backend's event log (see cache_backend.py), and reloads by
+  primary key only the ids that other workers published. Without a shared
+  backend there is no such log and refresh() only catches up.
+Neither overwrites an issue this process changed after its snapshot was read.
+
+The full comparison with the database (check_consistency(), rebuild on drift)
+runs every OPEN_ISSUE_INDEX_CHECK_SECONDS, on demand from the admin API, and
+whenever events were dropped from the log before this worker read them.
+
+Derived structures (e.g. issue clusters) subscribe with add_listener() and
+receive every change while the index lock is held, so they never observe
+updates out of order.
+"""
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from backend.cache import shared_cache_backend
+from backend.cache_backend import CacheBackend
+from backend.database import SessionLocal, engine, async_engine
+from backend.models import Issue
+from backend.spatial_utils import (
+    grid_cell, grid_cells_in_radius, find_nearby_issues, query_open_issues_near,
+    equirectangular_distance, haversine_distance
+)
+
+logger = logging.getLogger(__name__)
+
+# Dedup radius used by create_issue; also the grid cell size of the index
+DEDUP_RADIUS_METERS = 50.0
+
+# Upper bound for k-nearest searches; beyond this the search gives up
+MAX_NEAREST_RADIUS_METERS = 50000.0
+
+# Exchange of changed issue ids with other worker processes (see refresh)
+OPEN_ISSUE_INDEX_REFRESH_SECONDS = float(os.environ.get("OPEN_ISSUE_INDEX_REFRESH_SECONDS", "10"))
+# Full comparison with the open issues in the database (see check_consistency)
+OPEN_ISSUE_INDEX_CHECK_SECONDS = float(os.environ.get("OPEN_ISSUE_INDEX_CHECK_SECONDS", "3600"))
+
+# Event log namespace of the changed issue ids
+INDEX_EVENT_NAMESPACE = "open_issue_index"
+# Ids per primary key lookup when reloading issues changed elsewhere
+REFRESH_BATCH_SIZE = 500
+
+# Columns needed to build NearbyIssueResponse objects
+NEARBY_ISSUE_COLUMNS = (
+    Issue.id,
+    Issue.description,
+    Issue.category,
+    Issue.latitude,
+    Issue.longitude,
+    Issue.upvotes,
+    Issue.created_at,
+    Issue.status
+)
+
+
+class OpenIssueRecord(NamedTuple):
+    """Compact in-memory representation of an open issue."""
+    id: int
+    latitude: float
+    longitude: float
+    upvotes: int
+    created_at: Optional[datetime]
+
+
+class OpenIssueIndex:
+    """
+    Thread-safe grid index of open issues.
+    Cells are roughly cell_size_meters square (see spatial_utils.grid_cell).
+    """
+
+    def __init__(self, cell_size_meters: float = DEDUP_RADIUS_METERS, backend: Optional[CacheBackend] = None):
+        self._cell_size = cell_size_meters
+        self._cells: Dict[Tuple[int, int], Dict[int, OpenIssueRecord]] = {}
+        self._records: Dict[int, OpenIssueRecord] = {}
+        self._lock = threading.RLock()
+        self._engine = None
+        self._ready = False
+        self._last_rebuild: Optional[datetime] = None
+        self._listeners: List[Any] = []
+        # Incremental refreshes: highest issue id seen in the database, and the
+        # sequence number of this process's latest change per issue id
+        self._refresh_lock = threading.Lock()
+        self._max_seen_id = 0
+        self._change_seq = 0
+        self._changed_at: Dict[int, int] = {}
+        self._last_refresh: Optional[datetime] = None
+        self._refreshed = {"new": 0, "published": 0, "updated": 0, "closed": 0}
+        # Changed ids exchanged with other workers through the backend's event log
+        self._backend = backend
+        self._origin = f"{os.getpid()}:{id(self)}"
+        self._unpublished: Set[int] = set()
+        self._seen_seq = 0
+
+    def add_listener(self, listener: Any) -> None:
+        """
+        Subscribe to changes. Listeners implement reset(records), upsert(record)
+        and discard(issue_id); they are called with the index lock held.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            if self._ready:
+                listener.reset(list(self._records.values()))
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Built once but marked stale since (see mark_stale)."""
+        return self._engine is not None and not self._ready
+
+    def tracks(self, session: Session) -> bool:
+        """Whether writes made through this session belong to the indexed database."""
+        if self._engine is None:
+            return False
+        try:
+            bind = session.get_bind().engine
+        except Exception:
+            return False
+        # The app's async engine (AsyncSession writes) shares the sync engine's database
+        return bind is self._engine or (
+            self._engine is engine and async_engine is not None and bind is async_engine.sync_engine
+        )
+
+    def rebuild(self, db: Session) -> int:
+        """Reload all open issues from the database. Returns the number indexed."""
+        # Events published from here on are replayed by the next refresh
+        seen_seq = self._backend_call("latest_seq")
+        rows = db.query(
+            Issue.id, Issue.latitude, Issue.longitude, Issue.upvotes, Issue.created_at
+        ).filter(
+            Issue.status == "open",
+            Issue.latitude.isnot(None),
+            Issue.longitude.isnot(None)
+        ).all()
+
+        cells: Dict[Tuple[int, int], Dict[int, OpenIssueRecord]] = {}
+        records: Dict[int, OpenIssueRecord] = {}
+        for row in rows:
+            record = OpenIssueRecord(row.id, row.latitude, row.longitude, row.upvotes or 0, row.created_at)
+            records[record.id] = record
+            cells.setdefault(grid_cell(record.latitude, record.longitude, self._cell_size), {})[record.id] = record
+
+        max_id = db.query(func.max(Issue.id)).scalar() or 0
+
+        bind = db.get_bind().engine
+        if async_engine is not None and bind is async_engine.sync_engine:
+            # Rebuilt through an AsyncSession: track the app database by its sync engine
+            bind = engine
+
+        with self._lock:
+            self._cells = cells
+            self._records = records
+            self._engine = bind
+            self._ready = True
+            self._last_rebuild = datetime.now()
+            self._max_seen_id = max_id
+            self._changed_at.clear()
+            if seen_seq is not None:
+                self._seen_seq = seen_seq
+            for listener in self._listeners:
+                listener.reset(list(records.values()))
+
+        logger.info(f"Open issue index rebuilt with {len(records)} issues")
+        return len(records)
+
+    def mark_stale(self) -> None:
+        """Stop serving lookups until the next rebuild."""
+        with self._lock:
+            self._ready = False
+
+    def upsert(self, record: OpenIssueRecord) -> None:
+        with self._lock:
+            self._record_change_locked(record.id)
+            self._upsert_locked(record)
+
+    def discard(self, issue_id: int) -> None:
+        with self._lock:
+            self._record_change_locked(issue_id)
+            self._remove_locked(issue_id)
+
+    def add_upvotes(self, issue_id: int, delta: int) -> Optional[OpenIssueRecord]:
+        """Add delta to an indexed issue's upvotes; returns its updated record (None if not indexed)."""
+        with self._lock:
+            self._record_change_locked(issue_id)
+            record = self._records.get(issue_id)
+            if record is None:
+                return None
+            updated = record._replace(upvotes=(record.upvotes or 0) + delta)
+            self._records[issue_id] = updated
+            self._cells[grid_cell(record.latitude, record.longitude, self._cell_size)][issue_id] = updated
+            for listener in self._listeners:
+                listener.upsert(updated)
+            return updated
+
+    def apply(self, issue_id: int, status: Optional[str], latitude: Optional[float],
+              longitude: Optional[float], upvotes: Optional[int], created_at: Optional[datetime]) -> None:
+        """Insert, update or remove an issue depending on its current state."""
+        if status == "open" and latitude is not None and longitude is not None:
+            self.upsert(OpenIssueRecord(issue_id, latitude, longitude, upvotes or 0, created_at))
+        else:
+            self.discard(issue_id)
+
+    def catch_up(self, db: Session) -> int:
+        """
+        Apply issues inserted since the highest id seen (by other processes too).
+        Returns the number of open issues added. A single primary key range
+        query that finds nothing in the common case.
+        """
+        if not self._ready:
+            return 0
+        with self._refresh_lock:
+            with self._lock:
+                since_seq, after_id = self._change_seq, self._max_seen_id
+            added = self._catch_up_locked(db, since_seq, after_id)
+            with self._lock:
+                self._forget_changes_locked(since_seq)
+                self._refreshed["new"] += added
+        return added
+
+    def refresh(self, db: Session) -> Dict[str, int]:
+        """
+        catch_up(), then exchange changed issue ids with other worker processes:
+        publish the ids changed here since the last refresh, and reload the ids
+        published elsewhere by primary key. Returns the changes applied.
+        """
+        if not self.tracks(db):
+            return {}
+        if self.needs_rebuild:
+            self.rebuild(db)
+            return {}
+
+        with self._refresh_lock:
+            with self._lock:
+                since_seq, after_id = self._change_seq, self._max_seen_id
+                published, self._unpublished = self._unpublished, set()
+            changes = {"new": self._catch_up_locked(db, since_seq, after_id), "published": 0, "updated": 0, "closed": 0}
+
+            if published:
+                if self._backend_call("publish", self._origin, INDEX_EVENT_NAMESPACE, "issues",
+                                      tuple(str(issue_id) for issue_id in sorted(published))) is None:
+                    with self._lock:
+                        self._unpublished |= published  # retried by the next refresh
+                else:
+                    changes["published"] = len(published)
+
+            events = self._backend_call("poll", self._seen_seq) or []
+            if events and events[0].seq > self._seen_seq + 1:
+                # Events expired before this worker read them: compare everything instead
+                logger.warning("Open issue index missed change events of other workers; checking consistency")
+                self._seen_seq = events[-1].seq
+                self.check_consistency(db, repair=True)
+            else:
+                changed = set()
+                for event in events:
+                    self._seen_seq = event.seq
+                    if event.origin != self._origin and event.namespace == INDEX_EVENT_NAMESPACE:
+                        changed.update(int(target) for target in event.targets)
+                for issue_id, indexed in self._reload_locked(db, sorted(changed), since_seq).items():
+                    changes["updated" if indexed else "closed"] += 1
+
+            with self._lock:
+                self._forget_changes_locked(since_seq)
+                self._last_refresh = datetime.now()
+                for name, count in changes.items():
+                    self._refreshed[name] += count
+
+        if changes["new"] or changes["updated"] or changes["closed"]:
+            logger.info(f"Open issue index refreshed: {changes}")
+        return changes
+
+    def _reload_locked(self, db: Session, issue_ids: List[int], since_seq: int) -> Dict[int, bool]:
+        """
+        Re-read issue_ids (refresh lock held) and index or drop each one.
+        Returns {issue_id: indexed} for the issues whose entry changed.
+        """
+        applied: Dict[int, bool] = {}
+        for start in range(0, len(issue_ids), REFRESH_BATCH_SIZE):
+            batch = issue_ids[start:start + REFRESH_BATCH_SIZE]
+            rows = {
+                row.id: row for row in db.query(
+                    Issue.id, Issue.status, Issue.latitude, Issue.longitude, Issue.upvotes, Issue.created_at
+                ).filter(Issue.id.in_(batch))
+            }
+            with self._lock:
+                for issue_id in batch:
+                    if not self._unchanged_since_locked(issue_id, since_seq):
+                        continue  # This process changed it after the snapshot
+                    row = rows.get(issue_id)
+                    if row is not None and row.status == "open" and row.latitude is not None and row.longitude is not None:
+                        record = OpenIssueRecord(row.id, row.latitude, row.longitude, row.upvotes or 0, row.created_at)
+                        if self._records.get(issue_id) != record:
+                            self._upsert_locked(record)
+                            applied[issue_id] = True
+                    elif issue_id in self._records:
+                        self._remove_locked(issue_id)
+                        applied[issue_id] = False
+        return applied
+
+    def _catch_up_locked(self, db: Session, since_seq: int, after_id: int) -> int:
+        """Apply rows with id > after_id (refresh lock held). Returns the open issues added."""
+        rows = db.query(
+            Issue.id, Issue.status, Issue.latitude, Issue.longitude, Issue.upvotes, Issue.created_at
+        ).filter(Issue.id > after_id).order_by(Issue.id).all()
+        if not rows:
+            return 0
+
+        added = 0
+        with self._lock:
+            for row in rows:
+                if not self._unchanged_since_locked(row.id, since_seq):
+                    continue  # Already applied by this process's own hooks
+                if row.status == "open" and row.latitude is not None and row.longitude is not None:
+                    self._upsert_locked(OpenIssueRecord(
+                        row.id, row.latitude, row.longitude, row.upvotes or 0, row.created_at
+                    ))
+                    added += 1
+            self._max_seen_id = max(self._max_seen_id, rows[-1].id)
+        return added
+
+    def candidates_near(self, lat: float, lon: float, radius_meters: float) -> List[OpenIssueRecord]:
+        """Records in all grid cells intersecting the radius (needs an exact distance check)."""
+        with self._lock:
+            candidates = []
+            for cell in grid_cells_in_radius(lat, lon, radius_meters, self._cell_size):
+                bucket = self._cells.get(cell)
+                if bucket:
+                    candidates.extend(bucket.values())
+            return candidates
+
+    def nearby(self, lat: float, lon: float, radius_meters: float,
+               limit: Optional[int] = None) -> List[Tuple[OpenIssueRecord, float]]:
+        """Open issues within radius_meters, closest first (at most `limit`)."""
+        return find_nearby_issues(self.candidates_near(lat, lon, radius_meters), lat, lon, radius_meters, limit=limit)
+
+    def nearest(self, lat: float, lon: float, k: int,
+                max_radius_meters: float = MAX_NEAREST_RADIUS_METERS) -> List[Tuple[OpenIssueRecord, float]]:
+        """
+        The k open issues closest to (lat, lon), closest first, searching outward.
+
+        The search radius starts at one cell and doubles; each round only scans
+        cells not seen before. Results within the current radius are final
+        (anything unseen is farther away), so the search stops as soon as k of
+        them are confirmed and cost tracks k rather than local density.
+        """
+        use_precise = max_radius_meters > 10000
+        distance_func = haversine_distance if use_precise else equirectangular_distance
+
+        visited = set()
+        scanned: List[Tuple[OpenIssueRecord, float]] = []
+        radius = self._cell_size
+
+        while True:
+            radius = min(radius, max_radius_meters)
+            with self._lock:
+                # In sparse areas the ring covers more cells than there are
+                # occupied ones: a single pass over all records is cheaper.
+                if (2 * radius / self._cell_size + 1) ** 2 > len(self._cells):
+                    return self._nearest_brute_force_locked(lat, lon, k, max_radius_meters)
+
+                for cell in grid_cells_in_radius(lat, lon, radius, self._cell_size):
+                    if cell in visited:
+                        continue
+                    visited.add(cell)
+                    bucket = self._cells.get(cell)
+                    if bucket:
+                        scanned.extend(
+                            (record, distance_func(lat, lon, record.latitude, record.longitude))
+                            for record in bucket.values()
+                        )
+                total_indexed = len(self._records)
+
+            confirmed = [item for item in scanned if item[1] <= radius]
+            if len(confirmed) >= k or radius >= max_radius_meters or len(scanned) >= total_indexed:
+                confirmed.sort(key=lambda item: item[1])
+                return confirmed[:k]
+            radius *= 2
+
+    def _nearest_brute_force_locked(self, lat, lon, k, max_radius_meters):
+        return find_nearby_issues(list(self._records.values()), lat, lon, max_radius_meters, limit=k)
+
+    def check_consistency(self, db: Session, repair: bool = False) -> Dict[str, Any]:
+        """
+        Compare the index with the open issues in the database.
+        Rebuilds the index when drift is found and repair is True.
+        """
+        rows = db.query(Issue.id, Issue.upvotes).filter(
+            Issue.status == "open",
+            Issue.latitude.isnot(None),
+            Issue.longitude.isnot(None)
+        ).all()
+        db_upvotes = {row.id: row.upvotes or 0 for row in rows}
+
+        with self._lock:
+            indexed = {issue_id: record.upvotes for issue_id, record in self._records.items()}
+
+        missing = sorted(set(db_upvotes) - set(indexed))
+        extra = sorted(set(indexed) - set(db_upvotes))
+        stale_upvotes = sorted(
+            issue_id for issue_id in set(db_upvotes) & set(indexed)
+            if db_upvotes[issue_id] != indexed[issue_id]
+        )
+        consistent = not (missing or extra or stale_upvotes)
+
+        report = {
+            "consistent": consistent,
+            "indexed": len(indexed),
+            "in_database": len(db_upvotes),
+            "missing": missing[:50],
+            "extra": extra[:50],
+            "stale_upvotes": stale_upvotes[:50],
+            "rebuilt": False,
+        }
+
+        if not consistent:
+            logger.warning(
+                f"Open issue index drift: {len(missing)} missing, {len(extra)} extra, "
+                f"{len(stale_upvotes)} stale upvote counts"
+            )
+            if repair:
+                self.rebuild(db)
+                report["rebuilt"] = True
+
+        return report
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "indexed_issues": len(self._records),
+                "cells": len(self._cells),
+                "cell_size_meters": self._cell_size,
+                "last_rebuild": self._last_rebuild.isoformat() if self._last_rebuild else None,
+                "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None,
+                "max_seen_id": self._max_seen_id,
+                "refreshed": dict(self._refreshed),
+            }
+
+    def _record_change_locked(self, issue_id: int) -> None:
+        self._change_seq += 1
+        self._changed_at[issue_id] = self._change_seq
+        if self._backend is not None:
+            self._unpublished.add(issue_id)
+
+    def _backend_call(self, method: str, *args: Any) -> Any:
+        """Call the shared backend; failures are logged and the index carries on locally."""
+        if self._backend is None:
+            return None
+        try:
+            return getattr(self._backend, method)(*args)
+        except Exception as e:
+            logger.warning(f"Shared cache backend {method} failed for the open issue index: {e}")
+            return None
+
+    def _unchanged_since_locked(self, issue_id: int, seq: int) -> bool:
+        """Whether this process left issue_id alone since seq (so a database snapshot read after seq is newer)."""
+        return self._changed_at.get(issue_id, 0) <= seq
+
+    def _forget_changes_locked(self, seq: int) -> None:
+        # Changes up to seq are older than any snapshot a later refresh reads
+        self._changed_at = {issue_id: change for issue_id, change in self._changed_at.items() if change > seq}
+
+    def _upsert_locked(self, record: OpenIssueRecord) -> None:
+        self._remove_locked(record.id, notify=False)
+        self._records[record.id] = record
+        self._cells.setdefault(grid_cell(record.latitude, record.longitude, self._cell_size), {})[record.id] = record
+        for listener in self._listeners:
+            listener.upsert(record)
+
+    def _remove_locked(self, issue_id: int, notify: bool = True) -> None:
+        record = self._records.pop(issue_id, None)
+        if record is None:
+            return
+        if notify:
+            for listener in self._listeners:
+                listener.discard(issue_id)
+        cell = grid_cell(record.latitude, record.longitude, self._cell_size)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(issue_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+
+# Global instance shared by the issue routers
+open_issue_index = OpenIssueIndex(backend=shared_cache_backend)
+
+
+def build_open_issue_index() -> int:
+    """Build the global index from the database (run at startup)."""
+    db = SessionLocal()
+    try:
+        return open_issue_index.rebuild(db)
+    finally:
+        db.close()
+
+
+def check_open_issue_index(db: Session) -> Dict[str, Any]:
+    """Compare the global index with the database and rebuild it on drift (periodic job)."""
+    if not open_issue_index.tracks(db):
+        return {}
+    return open_issue_index.check_consistency(db, repair=True)
+
+
+def find_nearby_open_issues(db: Session, lat: float, lon: float, radius_meters: float,
+                            limit: Optional[int]) -> List[Tuple[Any, float]]:
+    """
+    Find up to `limit` (None for all) open issues within radius_meters, closest first.
+    Returns (row, distance) tuples where rows carry NEARBY_ISSUE_COLUMNS.
+
+    Served from the in-memory index when it is ready: only the matched ids are
+    loaded from the database (and nothing at all when there is no match).
+    Falls back to a spatial-index query otherwise.
+    """
+    if open_issue_index.needs_rebuild and open_issue_index.tracks(db):
+        open_issue_index.rebuild(db)
+
+    if not open_issue_index.is_ready:
+        open_issues = query_open_issues_near(db, NEARBY_ISSUE_COLUMNS, lat, lon, radius_meters).all()
+        return find_nearby_issues(open_issues, lat, lon, radius_meters, limit=limit)
+
+    if open_issue_index.tracks(db):
+        # Reports made in other worker processes since the last lookup
+        open_issue_index.catch_up(db)
+    matches = open_issue_index.nearby(lat, lon, radius_meters, limit=limit)
+    return _load_nearby_rows(db, matches)
+
+
+def find_nearest_open_issues(db: Session, lat: float, lon: float, k: int,
+                             max_radius_meters: float = MAX_NEAREST_RADIUS_METERS) -> List[Tuple[Any, float]]:
+    """
+    Find the k closest open issues within max_radius_meters, closest first.
+    Returns (row, distance) tuples where rows carry NEARBY_ISSUE_COLUMNS.
+
+    Uses the in-memory index when it is ready; otherwise runs expanding-radius
+    spatial-index queries, doubling the radius until k issues are confirmed.
+    """
+    if open_issue_index.needs_rebuild and open_issue_index.tracks(db):
+        open_issue_index.rebuild(db)
+
+    if not open_issue_index.is_ready:
+        radius = 2 * DEDUP_RADIUS_METERS
+        while True:
+            radius = min(radius, max_radius_meters)
+            open_issues = query_open_issues_near(db, NEARBY_ISSUE_COLUMNS, lat, lon, radius).all()
+            nearby = find_nearby_issues(open_issues, lat, lon, radius, limit=k)
+            if len(nearby) >= k or radius >= max_radius_meters:
+                return nearby
+            radius *= 2
+
+    if open_issue_index.tracks(db):
+        open_issue_index.catch_up(db)
+    matches = open_issue_index.nearest(lat, lon, k, max_radius_meters)
+    return _load_nearby_rows(db, matches)
+
+
+def _load_nearby_rows(db: Session, matches: List[Tuple[OpenIssueRecord, float]]) -> List[Tuple[Any, float]]:
+    """Load NEARBY_ISSUE_COLUMNS for index matches, preserving their order."""
+    if not matches:
+        return []
+
+    rows = db.query(*NEARBY_ISSUE_COLUMNS).filter(
+        Issue.id.in_([record.id for record, _ in matches]),
+        Issue.status == "open"
+    ).all()
+    rows_by_id = {row.id: row for row in rows}
+
+    # Ids missing from the result were closed by another process; drop them
+    return [(rows_by_id[record.id], distance) for record, distance in matches if record.id in rows_by_id]
+
+
+# --- Session hooks keeping the index in sync with ORM writes ---
+
+_PENDING_KEY = "open_issue_index_pending"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_issue_changes(session, flush_context):
+    if not open_issue_index.tracks(session):
+        return
+
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for obj in session.new:
+        if isinstance(obj, Issue):
+            pending[obj.id] = (obj.status, obj.latitude, obj.longitude, obj.upvotes, obj.created_at)
+    for obj in session.dirty:
+        if isinstance(obj, Issue) and session.is_modified(obj):
+            pending[obj.id] = (obj.status, obj.latitude, obj.longitude, obj.upvotes, obj.created_at)
+    for obj in session.deleted:
+        if isinstance(obj, Issue):
+            pending[obj.id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_issue_changes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for issue_id, state in pending.items():
+        if state is None:
+            open_issue_index.discard(issue_id)
+        else:
+            open_issue_index.apply(issue_id, *state)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_issue_changes(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Session, "after_bulk_delete")
+def _bulk_delete_issues(delete_context):
+    # Deleted ids are not known here; stop serving from memory until rebuilt
+    if delete_context.mapper.class_ is Issue and open_issue_index.tracks(delete_context.session):
+        open_issue_index.mark_stale()
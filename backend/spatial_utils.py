@@ -5,19 +5,137 @@ import math
 from typing import List, Tuple, Optional
 import logging
 
+from sqlalchemy import event, text, select, table, column
+
 try:
-    from sklearn.cluster import DBSCAN
     import numpy as np
-    HAS_SKLEARN = True
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    from sklearn.cluster import DBSCAN
+    HAS_SKLEARN = HAS_NUMPY
 except ImportError:
     HAS_SKLEARN = False
     DBSCAN = None
-    np = None
 
 from backend.models import Issue
 
 logger = logging.getLogger(__name__)
 
+# SQLite R*Tree virtual table mirroring the coordinates of *open* issues.
+# Kept in sync by triggers on the issues table so that ORM writes, bulk
+# query.update() calls and raw SQL all maintain it.
+SPATIAL_INDEX_TABLE = "issues_rtree"
+SPATIAL_INDEX_TRIGGERS = ("issues_rtree_insert", "issues_rtree_update", "issues_rtree_delete")
+
+_issues_rtree = table(
+    SPATIAL_INDEX_TABLE,
+    column("id"),
+    column("min_lat"),
+    column("max_lat"),
+    column("min_lon"),
+    column("max_lon"),
+)
+
+_SPATIAL_INDEX_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SPATIAL_INDEX_TABLE}
+        USING rtree(id, min_lat, max_lat, min_lon, max_lon)""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_rtree_insert AFTER INSERT ON issues
+        WHEN NEW.status = 'open' AND NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO {SPATIAL_INDEX_TABLE} (id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_rtree_update AFTER UPDATE OF status, latitude, longitude ON issues
+        BEGIN
+            DELETE FROM {SPATIAL_INDEX_TABLE} WHERE id = OLD.id;
+            INSERT INTO {SPATIAL_INDEX_TABLE} (id, min_lat, max_lat, min_lon, max_lon)
+            SELECT NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+            WHERE NEW.status = 'open' AND NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS issues_rtree_delete AFTER DELETE ON issues
+        BEGIN
+            DELETE FROM {SPATIAL_INDEX_TABLE} WHERE id = OLD.id;
+        END""",
+]
+
+_SPATIAL_INDEX_BACKFILL = f"""
+    INSERT OR REPLACE INTO {SPATIAL_INDEX_TABLE} (id, min_lat, max_lat, min_lon, max_lon)
+    SELECT id, latitude, latitude, longitude, longitude FROM issues
+    WHERE status = 'open' AND latitude IS NOT NULL AND longitude IS NOT NULL
+"""
+
+# Per-engine cache of whether the R*Tree index is installed, so the check
+# costs one sqlite_master query per process instead of one per request.
+_spatial_index_available = {}
+
+
+def _spatial_index_installed(conn) -> bool:
+    names = {
+        row[0] for row in conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        )
+    }
+    return SPATIAL_INDEX_TABLE in names and all(t in names for t in SPATIAL_INDEX_TRIGGERS)
+
+
+def ensure_spatial_index(conn) -> bool:
+    """
+    Create (or repair) the R*Tree spatial index for open issues and backfill it.
+    No-op on databases other than SQLite.
+
+    Returns True if the index is available after the call.
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+
+    try:
+        if _spatial_index_installed(conn):
+            _spatial_index_available[conn.engine] = True
+            return True
+
+        # Triggers may be missing if the issues table was recreated, in which
+        # case the R*Tree contents are stale: rebuild from scratch.
+        conn.execute(text(f"DROP TABLE IF EXISTS {SPATIAL_INDEX_TABLE}"))
+        for statement in _SPATIAL_INDEX_DDL:
+            conn.execute(text(statement))
+        conn.execute(text(_SPATIAL_INDEX_BACKFILL))
+        _spatial_index_available[conn.engine] = True
+        logger.info("Spatial index: created R*Tree index for open issues.")
+        return True
+    except Exception as e:
+        # SQLite builds without the rtree module fall back to B-tree range scans
+        logger.warning(f"Spatial index unavailable, using B-tree range scans: {e}")
+        _spatial_index_available[conn.engine] = False
+        return False
+
+
+def has_spatial_index(db) -> bool:
+    """Check (once per engine) whether the R*Tree index can be used for this session."""
+    engine = db.get_bind().engine
+    if engine not in _spatial_index_available:
+        if engine.dialect.name != "sqlite":
+            _spatial_index_available[engine] = False
+        else:
+            with engine.connect() as conn:
+                _spatial_index_available[engine] = _spatial_index_installed(conn)
+    return _spatial_index_available[engine]
+
+
+@event.listens_for(Issue.__table__, "after_create")
+def _create_spatial_index(target, connection, **kw):
+    ensure_spatial_index(connection)
+
+
+@event.listens_for(Issue.__table__, "after_drop")
+def _drop_spatial_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SPATIAL_INDEX_TABLE}"))
+        _spatial_index_available.pop(connection.engine, None)
+
 def get_bounding_box(lat: float, lon: float, radius_meters: float) -> Tuple[float, float, float, float]:
     """
     Calculate the bounding box coordinates for a given radius.
@@ -44,6 +162,84 @@ def get_bounding_box(lat: float, lon: float, radius_meters: float) -> Tuple[floa
     return min_lat, max_lat, min_lon, max_lon
 
 
+# Approximate length of one degree of latitude, used to size grid cells
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def _grid_cell_degrees(cell_size_meters: float) -> float:
+    return cell_size_meters / METERS_PER_DEGREE_LAT
+
+
+def _grid_row_scale(row: int, cell_deg: float) -> float:
+    """Longitude scale for a grid row so cells stay roughly square in meters."""
+    row_lat = min(abs((row + 0.5) * cell_deg), 89.9)
+    return math.cos(math.radians(row_lat))
+
+
+def grid_cell(lat: float, lon: float, cell_size_meters: float) -> Tuple[int, int]:
+    """
+    Map a coordinate to the (row, col) of an equal-area-ish grid with
+    cells of roughly cell_size_meters on each side.
+    """
+    cell_deg = _grid_cell_degrees(cell_size_meters)
+    row = math.floor(lat / cell_deg)
+    col = math.floor(lon * _grid_row_scale(row, cell_deg) / cell_deg)
+    return row, col
+
+
+def grid_cell_center(row: int, col: int, cell_size_meters: float) -> Tuple[float, float]:
+    """Coordinate of the middle of a grid cell (inverse of grid_cell)."""
+    cell_deg = _grid_cell_degrees(cell_size_meters)
+    return (row + 0.5) * cell_deg, (col + 0.5) * cell_deg / _grid_row_scale(row, cell_deg)
+
+
+def grid_cells_in_radius(lat: float, lon: float, radius_meters: float, cell_size_meters: float) -> List[Tuple[int, int]]:
+    """
+    List every grid cell (see grid_cell) that intersects the bounding box of
+    the given radius. Any point within the radius lies in one of these cells.
+    """
+    cell_deg = _grid_cell_degrees(cell_size_meters)
+    min_lat, max_lat, min_lon, max_lon = get_bounding_box(lat, lon, radius_meters)
+
+    cells = []
+    for row in range(math.floor(min_lat / cell_deg), math.floor(max_lat / cell_deg) + 1):
+        scale = _grid_row_scale(row, cell_deg)
+        first_col = math.floor(min_lon * scale / cell_deg)
+        last_col = math.floor(max_lon * scale / cell_deg)
+        cells.extend((row, col) for col in range(first_col, last_col + 1))
+    return cells
+
+
+def query_open_issues_near(db, columns, lat: float, lon: float, radius_meters: float):
+    """
+    Build a query selecting `columns` for open issues inside the bounding box
+    of the given radius.
+
+    Uses the R*Tree index when available (a true 2-D lookup), otherwise falls
+    back to a range scan on ix_issues_status_lat_lon. Candidates still need an
+    exact distance check with find_nearby_issues.
+    """
+    min_lat, max_lat, min_lon, max_lon = get_bounding_box(lat, lon, radius_meters)
+
+    query = db.query(*columns).filter(Issue.status == "open")
+
+    if has_spatial_index(db):
+        candidate_ids = select(_issues_rtree.c.id).where(
+            _issues_rtree.c.min_lat <= max_lat,
+            _issues_rtree.c.max_lat >= min_lat,
+            _issues_rtree.c.min_lon <= max_lon,
+            _issues_rtree.c.max_lon >= min_lon,
+        )
+        return query.filter(Issue.id.in_(candidate_ids))
+
+    return query.filter(
+        Issue.latitude >= min_lat,
+        Issue.latitude <= max_lat,
+        Issue.longitude >= min_lon,
+        Issue.longitude <= max_lon
+    )
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points
@@ -92,11 +288,86 @@ def equirectangular_distance(lat1: float, lon1: float, lat2: float, lon2: float)
     return R * math.sqrt(x*x + y*y)
 
 
+# Below this many candidates the NumPy setup cost outweighs the per-row savings
+VECTORIZE_MIN_CANDIDATES = 64
+
+EARTH_RADIUS_METERS = 6371000.0
+
+
+def batch_haversine_distance(lat: float, lon: float, lats, lons):
+    """
+    Vectorized haversine_distance from one point to arrays of coordinates.
+    Returns a NumPy array of distances in meters.
+    """
+    phi1 = np.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons) - np.radians(lon)
+
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def batch_equirectangular_distance(lat: float, lon: float, lats, lons):
+    """
+    Vectorized equirectangular_distance from one point to arrays of coordinates
+    (including dateline wrapping). Returns a NumPy array of distances in meters.
+    """
+    lat_rad = np.radians(lat)
+    lats_rad = np.radians(lats)
+
+    dlat = lats_rad - lat_rad
+    dlon = np.radians(lons) - np.radians(lon)
+    dlon = (dlon + np.pi) % (2 * np.pi) - np.pi
+
+    x = dlon * np.cos((lat_rad + lats_rad) / 2)
+    return EARTH_RADIUS_METERS * np.sqrt(x * x + dlat * dlat)
+
+
+def nearest_within_radius(
+    target_lat: float,
+    target_lon: float,
+    lats,
+    lons,
+    radius_meters: float,
+    k: Optional[int] = None
+):
+    """
+    Compute all distances in one vectorized pass and select those within radius.
+
+    Args:
+        target_lat, target_lon: Target location
+        lats, lons: Candidate coordinate arrays (same length)
+        radius_meters: Search radius in meters
+        k: Keep only the k closest (partial selection via argpartition)
+
+    Returns:
+        Tuple (indices, distances) into the candidate arrays, closest first
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    # Same kernel choice as find_nearby_issues
+    if radius_meters > 10000:
+        distances = batch_haversine_distance(target_lat, target_lon, lats, lons)
+    else:
+        distances = batch_equirectangular_distance(target_lat, target_lon, lats, lons)
+
+    within = np.flatnonzero(distances <= radius_meters)
+    if k is not None and len(within) > k:
+        # O(n) selection of the k closest instead of sorting every match
+        within = within[np.argpartition(distances[within], k - 1)[:k]]
+
+    order = within[np.argsort(distances[within], kind="stable")]
+    return order, distances[order]
+
+
 def find_nearby_issues(
     issues: List[Issue],
     target_lat: float,
     target_lon: float,
-    radius_meters: float = 50.0
+    radius_meters: float = 50.0,
+    limit: Optional[int] = None
 ) -> List[Tuple[Issue, float]]:
     """
     Find issues within a specified radius of a target location.
@@ -106,10 +377,35 @@ def find_nearby_issues(
         target_lat: Target latitude
         target_lon: Target longitude
         radius_meters: Search radius in meters (default 50m)
+        limit: Return only the closest `limit` issues (default: all)
 
     Returns:
         List of tuples (issue, distance_meters) for issues within radius
     """
+    valid_issues = [
+        issue for issue in issues
+        if issue.latitude is not None and issue.longitude is not None
+    ]
+
+    if not HAS_NUMPY or len(valid_issues) < VECTORIZE_MIN_CANDIDATES:
+        nearby_issues = _find_nearby_issues_scalar(valid_issues, target_lat, target_lon, radius_meters)
+        return nearby_issues[:limit] if limit is not None else nearby_issues
+
+    lats = np.fromiter((issue.latitude for issue in valid_issues), dtype=np.float64, count=len(valid_issues))
+    lons = np.fromiter((issue.longitude for issue in valid_issues), dtype=np.float64, count=len(valid_issues))
+
+    indices, distances = nearest_within_radius(target_lat, target_lon, lats, lons, radius_meters, k=limit)
+
+    return [(valid_issues[i], float(d)) for i, d in zip(indices.tolist(), distances.tolist())]
+
+
+def _find_nearby_issues_scalar(
+    issues: List[Issue],
+    target_lat: float,
+    target_lon: float,
+    radius_meters: float
+) -> List[Tuple[Issue, float]]:
+    """Per-row distance loop, used for small candidate sets or without NumPy."""
     nearby_issues = []
 
     # Determine which distance function to use based on radius
@@ -119,9 +415,6 @@ def find_nearby_issues(
     distance_func = haversine_distance if use_precise else equirectangular_distance
 
     for issue in issues:
-        if issue.latitude is None or issue.longitude is None:
-            continue
-
         distance = distance_func(
             target_lat, target_lon,
             issue.latitude, issue.longitude
@@ -167,14 +460,13 @@ def cluster_issues_dbscan(issues: List[Issue], eps_meters: float = 30.0) -> List
         [issue.latitude, issue.longitude] for issue in valid_issues
     ])
 
-    # Convert eps from meters to degrees (approximate)
-    # 1 degree latitude ≈ 111,000 meters
-    # 1 degree longitude ≈ 111,000 * cos(latitude) meters
-    eps_degrees = eps_meters / 111000  # Rough approximation
+    # The haversine metric works on radians and returns great-circle
+    # distances on the unit sphere, so eps is an angle: meters / earth radius
+    eps_radians = eps_meters / EARTH_RADIUS_METERS
 
     # Perform DBSCAN clustering
     try:
-        db = DBSCAN(eps=eps_degrees, min_samples=1, metric='haversine').fit(
+        db = DBSCAN(eps=eps_radians, min_samples=1, metric='haversine').fit(
             np.radians(coordinates)
         )
 
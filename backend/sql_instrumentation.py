@@ -0,0 +1,274 @@
+"""
+Per-request SQL instrumentation with N+1 detection.
+
+Cursor execution hooks on every Engine (sync engines and the sync side of the
+async ones) charge each statement to the QueryStats of the unit of work being
+served. That unit is found through a context variable, set for each HTTP
+request by SQLInstrumentationMiddleware and for each periodic job by
+track_queries(). Context variables follow the work into run_in_threadpool and
+into SQLAlchemy's async greenlets. Per unit, the stats hold the query count,
+the total time spent in the database and the slowest statement.
+
+- Debug mode (SQL_DEBUG_HEADERS, defaulting to DEBUG) adds them to the
+  response as X-DB-Query-Count, X-DB-Time-Ms, X-DB-Slowest-Ms and
+  X-DB-N-Plus-One.
+- sql_report keeps aggregates per route and the last SQL_REPORT_SIZE requests
+  (GET /admin/sql-report).
+- N+1 detection: each statement is reduced to its shape, with literals and IN
+  lists collapsed. A request that executes one shape more than
+  N_PLUS_ONE_THRESHOLD times is flagged in the report. A warning is logged the
+  first time each route and shape is flagged.
+
+Only SQL text is recorded, never bound parameters. Work done after the response
+(background tasks) is not charged to the request.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SQL_INSTRUMENTATION_ENABLED = os.environ.get("SQL_INSTRUMENTATION", "true").lower() == "true"
+SQL_DEBUG_HEADERS = os.environ.get("SQL_DEBUG_HEADERS", os.environ.get("DEBUG", "false")).lower() == "true"
+# K: executions of one statement shape within a request above which it is flagged
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", "10"))
+SQL_REPORT_SIZE = int(os.environ.get("SQL_REPORT_SIZE", "500"))
+
+SQL_DEBUG_HEADER_NAMES = ("X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Slowest-Ms", "X-DB-N-Plus-One")
+
+# Longest SQL text kept for the slowest statement and flagged shapes
+MAX_STATEMENT_CHARS = 500
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"\?|%\(\w+\)s|%s|:\w+|\$\d+")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def statement_shape(statement: str) -> str:
+    """
+    Statement with literals and bound parameters replaced by ? and parameter
+    lists collapsed to (?), so that "the same query for another row" compares equal.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PARAMETER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()[:MAX_STATEMENT_CHARS]
+
+
+class QueryStats:
+    """Statements executed by one request (or periodic job)."""
+
+    __slots__ = ("label", "count", "seconds", "slowest_seconds", "slowest_statement", "shapes", "closed")
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+        self.closed = False
+
+    def record(self, statement: str, seconds: float) -> None:
+        if self.closed:
+            return
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def repeated_shapes(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """(shape, executions) of the shapes executed more than threshold times: likely N+1 queries."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def headers(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[bytes, bytes]]:
+        values = (
+            self.count, f"{self.seconds * 1000:.2f}", f"{self.slowest_seconds * 1000:.2f}",
+            len(self.repeated_shapes(threshold)),
+        )
+        return [(name.lower().encode(), str(value).encode()) for name, value in zip(SQL_DEBUG_HEADER_NAMES, values)]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+class SQLReport:
+    """Rolling per-route query statistics and N+1 findings."""
+
+    def __init__(self, size: int = SQL_REPORT_SIZE, threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._recent: deque = deque(maxlen=size)
+        self._routes: Dict[str, dict] = {}
+        self._flagged: Dict[Tuple[str, str], dict] = {}
+
+    def add(self, stats: QueryStats) -> None:
+        label = stats.label or "unknown"
+        repeated = stats.repeated_shapes(self.threshold)
+        with self._lock:
+            route = self._routes.get(label)
+            if route is None:
+                route = self._routes[label] = {
+                    "requests": 0, "queries": 0, "db_seconds": 0.0, "max_queries": 0,
+                    "slowest_ms": 0.0, "slowest_statement": None, "n_plus_one_requests": 0,
+                }
+            route["requests"] += 1
+            route["queries"] += stats.count
+            route["db_seconds"] += stats.seconds
+            route["max_queries"] = max(route["max_queries"], stats.count)
+            if stats.slowest_seconds * 1000 > route["slowest_ms"]:
+                route["slowest_ms"] = stats.slowest_seconds * 1000
+                route["slowest_statement"] = (stats.slowest_statement or "")[:MAX_STATEMENT_CHARS]
+            if repeated:
+                route["n_plus_one_requests"] += 1
+
+            for shape, count in repeated:
+                finding = self._flagged.get((label, shape))
+                if finding is None:
+                    finding = self._flagged[(label, shape)] = {"requests": 0, "max_executions": 0}
+                    logger.warning(f"Possible N+1 query in {label}: {count} executions of: {shape}")
+                finding["requests"] += 1
+                finding["max_executions"] = max(finding["max_executions"], count)
+
+            self._recent.append({
+                "route": label,
+                "queries": stats.count,
+                "db_ms": round(stats.seconds * 1000, 2),
+                "slowest_ms": round(stats.slowest_seconds * 1000, 2),
+                "n_plus_one": [{"shape": shape, "executions": count} for shape, count in repeated],
+            })
+
+    def get_report(self) -> dict:
+        with self._lock:
+            routes = [
+                {
+                    "route": label,
+                    "requests": route["requests"],
+                    "avg_queries": round(route["queries"] / route["requests"], 2),
+                    "max_queries": route["max_queries"],
+                    "total_db_ms": round(route["db_seconds"] * 1000, 2),
+                    "avg_db_ms": round(route["db_seconds"] * 1000 / route["requests"], 2),
+                    "slowest_ms": round(route["slowest_ms"], 2),
+                    "slowest_statement": route["slowest_statement"],
+                    "n_plus_one_requests": route["n_plus_one_requests"],
+                }
+                for label, route in self._routes.items()
+            ]
+            n_plus_one = [
+                {"route": label, "shape": shape, **finding}
+                for (label, shape), finding in self._flagged.items()
+            ]
+            recent = list(self._recent)
+        routes.sort(key=lambda route: route["total_db_ms"], reverse=True)
+        n_plus_one.sort(key=lambda finding: finding["max_executions"], reverse=True)
+        return {"threshold": self.threshold, "routes": routes, "n_plus_one": n_plus_one, "recent": recent}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._routes.clear()
+            self._flagged.clear()
+
+
+# Global report shared by the middleware, the periodic jobs and /admin/sql-report
+sql_report = SQLReport()
+
+
+@contextmanager
+def track_queries(label: str, report: Optional[SQLReport] = None):
+    """Charge the statements executed inside the block to a new QueryStats, added to the report at exit."""
+    stats = QueryStats(label)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        stats.closed = True
+        (report or sql_report).add(stats)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("sql_instrumentation_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    started = conn.info.get("sql_instrumentation_started")
+    if started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_statement_timer(exception_context):
+    # The failed statement never reaches after_cursor_execute
+    if exception_context.connection is not None and _current_stats.get() is not None:
+        started = exception_context.connection.info.get("sql_instrumentation_started")
+        if started:
+            started.pop()
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    # Route templates only: raw paths of unmatched requests would grow the report without bound
+    return f"{scope['method']} {getattr(route, 'path', None) or '<unmatched>'}"
+
+
+class SQLInstrumentationMiddleware:
+    """ASGI middleware giving each HTTP request its own QueryStats."""
+
+    def __init__(self, app, report: Optional[SQLReport] = None, debug_headers: bool = SQL_DEBUG_HEADERS,
+                 enabled: bool = SQL_INSTRUMENTATION_ENABLED):
+        self.app = app
+        self.report = report
+        self.debug_headers = debug_headers
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        report = self.report or sql_report
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        def finish():
+            if not stats.closed:
+                stats.closed = True
+                stats.label = _route_label(scope)
+                report.add(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.debug_headers:
+                message = {**message, "headers": [*message.get("headers", []), *stats.headers(report.threshold)]}
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Response complete: background tasks that run next are not this request's queries
+                finish()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            finish()
@@ -3,8 +3,8 @@ import json
 import os
 from pywebpush import webpush, WebPushException
 from backend.database import SessionLocal
-from backend.models import Issue, PushSubscription
-from backend.cache import recent_issues_cache
+from backend.models import Issue, IssueActionPlan, PushSubscription
+from backend.cache import recent_issues_cache, issue_tag
 from backend.ai_service import generate_action_plan, build_x_post
 from backend.grievance_service import GrievanceService
 from backend.schemas import IssueSummaryResponse
@@ -17,15 +17,17 @@ async def process_action_plan_background(issue_id: int, description: str, catego
         # Generate Action Plan (AI)
         action_plan = await generate_action_plan(description, category, language, image_path)
 
-        # Update issue in DB
-        issue = db.query(Issue).filter(Issue.id == issue_id).first()
-        if issue:
-            current_plan = issue.action_plan or {}
-            issue.action_plan = {**current_plan, **action_plan}
+        # Merge into the issue's action plan row (the issue row itself is not loaded)
+        record = db.get(IssueActionPlan, issue_id)
+        if record is None and db.query(Issue.id).filter(Issue.id == issue_id).first():
+            record = IssueActionPlan(issue_id=issue_id, plan={})
+            db.add(record)
+        if record is not None:
+            record.plan = {**(record.plan or {}), **action_plan}
             db.commit()
 
-            # Invalidate cache to ensure users get the updated action plan
-            recent_issues_cache.clear()
+            # Invalidate only entries embedding this issue (listings do not include the plan)
+            await recent_issues_cache.invalidate_tags_async(issue_tag(issue_id))
     except Exception as e:
         logger.error(f"Background action plan generation failed for issue {issue_id}: {e}", exc_info=True)
     finally:
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+
+
+@pytest.fixture
+def db_engine():
+    """A fresh in-memory SQLite database with every table."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """A session on db_engine. Modules seed it by overriding db_session(db_session)."""
+    session = sessionmaker(bind=db_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def threaded_db_session():
+    """db_session for code that runs in other threads: every thread shares one connection (StaticPool)."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """
+    (url, sessionmaker) of a SQLite file database with every table, for tests
+    that need several real connections (concurrent writers, async engines).
+    """
+    url = f"sqlite:///{tmp_path}/test.db"
+    engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 30})
+    Base.metadata.create_all(bind=engine)
+    yield url, sessionmaker(bind=engine)
+    engine.dispose()
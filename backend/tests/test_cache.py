@@ -0,0 +1,284 @@
+from backend.cache import ThreadSafeCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = ThreadSafeCache(ttl=60, max_size=3)
+    for key in ("a", "b", "c"):
+        cache.set(key.upper(), key)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == "A"
+    cache.set("D", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_default_and_per_key_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("backend.cache.time.monotonic", clock)
+
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    cache.set("short", "a", ttl=5)
+    cache.set("long", "b")
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert cache.get("b") == "long"
+
+    clock.now += 60
+    assert cache.get("b") is None
+    stats = cache.get_stats()
+    assert stats["expirations"] == 2
+    assert stats["total_entries"] == 0
+
+
+def test_expired_entries_are_purged_lazily_on_set(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("backend.cache.time.monotonic", clock)
+
+    cache = ThreadSafeCache(ttl=10, max_size=100)
+    for i in range(50):
+        cache.set(i, f"old{i}")
+    # Rewriting a key leaves a stale heap entry that must not expire the new value
+    cache.set("fresh", "old0", ttl=100)
+
+    clock.now += 20
+    cache.set("new", "new")
+
+    stats = cache.get_stats()
+    assert stats["total_entries"] == 2
+    assert stats["expirations"] == 49
+    assert cache.get("old0") == "fresh"
+
+
+def test_invalidate_clear_and_counters():
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    cache.set(1, "a")
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    cache.set(2, "b")
+    cache.clear()
+    assert cache.get("b") is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert stats["hit_rate"] == 0.25
+
+
+def test_striped_cache_keeps_api():
+    cache = ThreadSafeCache(ttl=60, max_size=64, stripes=8)
+    for i in range(64):
+        cache.set(i, f"key{i}")
+
+    assert cache.get_stats()["stripes"] == 8
+    assert cache.get_stats()["total_entries"] <= 64
+    hits = sum(cache.get(f"key{i}") == i for i in range(64))
+    assert hits == cache.get_stats()["total_entries"]
+
+    cache.clear()
+    assert cache.get_stats()["total_entries"] == 0
+
+
+def test_invalidate_tags_drops_only_tagged_entries():
+    from backend.cache import issue_tag, TAG_ISSUES_RECENT, TAG_ISSUES_STATS
+
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    cache.set(["page"], "recent_10_0", tags=[TAG_ISSUES_RECENT, issue_tag(1), issue_tag(2)])
+    cache.set({"total": 2}, "stats", tags=[TAG_ISSUES_STATS])
+    cache.set("untagged", "other")
+
+    # A write to an issue that is not listed touches nothing
+    assert cache.invalidate_tags(issue_tag(3)) == 0
+    assert cache.invalidate_tags(issue_tag(2)) == 1
+    assert cache.get("recent_10_0") is None
+    assert cache.get("stats") == {"total": 2}
+
+    # Re-setting a key replaces its tags
+    cache.set(["page"], "recent_10_0", tags=[TAG_ISSUES_RECENT, issue_tag(4)])
+    assert cache.invalidate_tags(issue_tag(1)) == 0
+    assert cache.invalidate_tags(TAG_ISSUES_RECENT, TAG_ISSUES_STATS) == 2
+    assert cache.get("stats") is None
+    assert cache.get("other") == "untagged"
+    assert cache.get_stats()["tags"] == 0
+
+
+def test_evicted_and_expired_entries_release_their_tags(monkeypatch):
+    from backend.cache import issue_tag, TAG_ISSUES_RECENT
+
+    clock = FakeClock()
+    monkeypatch.setattr("backend.cache.time.monotonic", clock)
+    cache = ThreadSafeCache(ttl=60, max_size=3)
+
+    # Pages keyed per offset, each listing other issues: only the 3 cached ones stay registered
+    for page in range(20):
+        cache.set(["page"], f"recent_10_{page * 10}", tags=[TAG_ISSUES_RECENT, issue_tag(page), issue_tag(page + 100)])
+    assert cache.get_stats()["tags"] == 1 + 3 * 2
+    assert cache.invalidate_tags(issue_tag(0)) == 0
+
+    # Expired entries release theirs too, whether purged by get or by a later set
+    cache.set("detail", "issue_500", ttl=5, tags=[issue_tag(500)])
+    clock.now += 120
+    assert cache.get("recent_10_190") is None
+    cache.set("fresh", "other")
+    assert cache.get_stats()["tags"] == 0
+
+
+def test_single_flight_collapses_concurrent_misses():
+    import threading
+    import time as real_time
+
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    calls = []
+    start = threading.Barrier(8)
+
+    def compute():
+        calls.append(1)
+        real_time.sleep(0.1)
+        return {"total": 42}
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_compute("stats", compute, tags=["issues:stats"]))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"total": 42}] * 8
+    flight = cache.get_stats()["single_flight"]
+    assert flight["executions"] == 1
+    assert flight["collapsed"] == 7
+
+    # Stored with its tags
+    assert cache.invalidate_tags("issues:stats") == 1
+
+
+def test_single_flight_shares_errors_and_recovers():
+    from backend.cache import SingleFlight
+
+    flight = SingleFlight()
+
+    def failing():
+        raise RuntimeError("db down")
+
+    try:
+        flight.do("k", failing)
+        assert False, "expected the error to propagate"
+    except RuntimeError:
+        pass
+
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.get_stats()["in_flight"] == 0
+
+
+def test_single_flight_async_callers():
+    import asyncio
+
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [1, 2, 3]
+
+    async def run():
+        return await asyncio.gather(*(
+            cache.get_or_compute_async("recent", compute, tags=lambda data: [f"issue:{i}" for i in data])
+            for _ in range(5)
+        ))
+
+    results = asyncio.run(run())
+    assert results == [[1, 2, 3]] * 5
+    assert len(calls) == 1
+    assert cache.get_stats()["single_flight"]["collapsed"] == 4
+    assert cache.invalidate_tags("issue:2") == 1
+
+
+def test_single_flight_async_leader_cancellation_does_not_fail_waiters():
+    import asyncio
+    from backend.cache import SingleFlight
+
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "page"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do_async("recent", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do_async("recent", compute))
+        await asyncio.sleep(0)
+        leader.cancel()  # e.g. the first client disconnected
+        result = await waiter
+        return leader.cancelled(), result
+
+    assert asyncio.run(run()) == (True, "page")
+    assert flight.get_stats() == {"executions": 1, "collapsed": 1, "in_flight": 0}
+
+
+def test_stale_while_revalidate_serves_stale_and_refreshes(monkeypatch):
+    import threading
+
+    clock = FakeClock()
+    monkeypatch.setattr("backend.cache.time.monotonic", clock)
+
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+    assert cache.get_or_compute("stats", lambda: "v1", stale_ttl=30) == "v1"
+
+    refreshed = threading.Event()
+
+    def refresh():
+        refreshed.set()
+        return "v2"
+
+    # Past the TTL but inside the grace window: stale value now, refresh in background
+    clock.now += 70
+    assert cache.get("stats") is None
+    assert cache.get_or_compute("stats", lambda: "foreground", stale_ttl=30, refresh=refresh) == "v1"
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.get("stats") == "v2":
+            break
+        threading.Event().wait(0.01)
+    assert cache.get("stats") == "v2"
+    assert cache.get_stats()["stale_hits"] == 1
+    assert cache.get_stats()["background_refreshes"] == 1
+
+    # Past the grace window the value is recomputed in the foreground
+    clock.now += 100
+    assert cache.get_or_compute("stats", lambda: "v3", stale_ttl=30) == "v3"
+
+
+def test_result_computed_across_an_invalidation_is_not_stored():
+    cache = ThreadSafeCache(ttl=60, max_size=10)
+
+    def compute():
+        # A write lands while the old value is being computed
+        cache.invalidate_tags("issues:stats")
+        return "outdated"
+
+    assert cache.get_or_compute("stats", compute, tags=["issues:stats"]) == "outdated"
+    assert cache.get("stats") is None
+    assert cache.get_or_compute("stats", lambda: "fresh", tags=["issues:stats"]) == "fresh"
+    assert cache.get("stats") == "fresh"
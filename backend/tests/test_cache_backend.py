@@ -0,0 +1,160 @@
+import asyncio
+import pickle
+import sqlite3
+import threading
+
+import pytest
+
+from backend.cache import ThreadSafeCache
+from backend.cache_backend import (
+    InProcessCacheBackend, SQLiteCacheBackend, create_cache_backend, decode_value, encode_value
+)
+from backend.nearby_cache import EncodedNearbyIssue
+from backend.response_cache import encode_payload
+
+
+def _workers(backend, name="recent_issues"):
+    # Two caches of the same name on one backend behave like two worker processes
+    return (
+        ThreadSafeCache(ttl=60, max_size=10, backend=backend, name=name, sync_interval=0),
+        ThreadSafeCache(ttl=60, max_size=10, backend=backend, name=name, sync_interval=0),
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend_factory(request, tmp_path):
+    if request.param == "memory":
+        shared = InProcessCacheBackend()
+        return lambda: shared
+    path = str(tmp_path / "cache.db")
+    return lambda: SQLiteCacheBackend(path)
+
+
+def test_local_misses_are_filled_from_the_shared_tier(backend_factory):
+    first = ThreadSafeCache(ttl=60, backend=backend_factory(), name="stats", sync_interval=0)
+    second = ThreadSafeCache(ttl=60, backend=backend_factory(), name="stats", sync_interval=0)
+
+    first.set({"total": 3}, "stats")
+    assert second.get("stats") == {"total": 3}
+    assert second.get_stats()["shared_hits"] == 1
+    # Now served from the local tier
+    assert second.get("stats") == {"total": 3}
+    assert second.get_stats()["hits"] == 1
+
+
+def test_invalidations_are_broadcast(backend_factory):
+    first = ThreadSafeCache(ttl=60, backend=backend_factory(), name="recent", sync_interval=0)
+    second = ThreadSafeCache(ttl=60, backend=backend_factory(), name="recent", sync_interval=0)
+
+    first.set("page", "recent_10_0", tags=["issues:recent"])
+    first.set("detail", "issue_5", tags=["issue:5"])
+    assert second.get("recent_10_0") == "page"
+    assert second.get("issue_5") == "detail"
+
+    first.invalidate_tags("issues:recent")
+    assert second.get("recent_10_0") is None
+    assert second.get("issue_5") == "detail"
+
+    first.invalidate("issue_5")
+    assert second.get("issue_5") is None
+    assert second.get_stats()["shared"]["remote_invalidations"] == 2
+
+    second.set("x", "k")
+    second.clear()
+    assert first.get("k") is None
+
+
+def test_namespaces_are_isolated():
+    backend = InProcessCacheBackend()
+    recent = ThreadSafeCache(ttl=60, backend=backend, name="recent", sync_interval=0)
+    nearby = ThreadSafeCache(ttl=60, backend=backend, name="nearby", sync_interval=0)
+
+    recent.set("a", "key")
+    nearby.set("b", "key")
+    nearby.clear()
+    assert recent.get("key") == "a"
+
+
+def test_result_computed_before_a_remote_invalidation_is_not_stored():
+    first, second = _workers(InProcessCacheBackend())
+
+    def compute():
+        # Another worker writes while this one is still computing
+        first.invalidate_tags("issues:stats")
+        return "outdated"
+
+    assert second.get_or_compute("stats", compute, tags=["issues:stats"]) == "outdated"
+    assert second.get("stats") is None
+    assert first.get("stats") is None
+
+
+def test_backend_failures_fall_back_to_the_local_tier():
+    class BrokenBackend(InProcessCacheBackend):
+        def get(self, key):
+            raise RuntimeError("disk full")
+
+        def set(self, key, entry):
+            raise RuntimeError("disk full")
+
+    cache = ThreadSafeCache(ttl=60, backend=BrokenBackend(), name="stats", sync_interval=0)
+    cache.set("value", "k")
+    assert cache.get("k") == "value"
+    assert cache.get("missing") is None
+    assert cache.get_stats()["shared"]["backend_errors"] == 2
+
+
+def test_create_cache_backend(tmp_path):
+    assert create_cache_backend("memory://") is None
+    assert isinstance(create_cache_backend(f"sqlite:///{tmp_path}/cache.db"), SQLiteCacheBackend)
+
+
+def test_values_are_stored_as_json_not_pickle(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = ThreadSafeCache(ttl=60, backend=SQLiteCacheBackend(path), name="recent", sync_interval=0)
+    second = ThreadSafeCache(ttl=60, backend=SQLiteCacheBackend(path), name="recent", sync_interval=0)
+
+    payload = encode_payload([{"id": 1, "description": "Pothole"}] * 50)
+    first.set(payload, "page")
+    first.set([EncodedNearbyIssue(1, 18.5, 73.8, b'{"id":1', b"}")], "cell")
+    assert second.get("page") == payload
+    assert second.get("cell") == [EncodedNearbyIssue(1, 18.5, 73.8, b'{"id":1', b"}")]
+    assert decode_value(encode_value({"nested": (1, b"\x00")})) == {"nested": [1, b"\x00"]}
+
+    # Arbitrary objects are never written to the shared file...
+    first.set(threading.Lock(), "lock")
+    assert first.get_stats()["shared"]["backend_errors"] == 1
+    assert second.get("lock") is None
+
+    # ...and rows written by someone else are not unpickled
+    class Exploit:
+        def __reduce__(self):
+            return (pytest.fail, ("pickle payload executed",))
+
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE cache_entries SET value = ? WHERE key = 'recent:cell'", (pickle.dumps(Exploit()),))
+    conn.commit()
+    conn.close()
+    assert ThreadSafeCache(ttl=60, backend=SQLiteCacheBackend(path), name="recent", sync_interval=0).get("cell") is None
+
+
+def test_async_methods_keep_blocking_backend_calls_off_the_event_loop(tmp_path):
+    calls = []
+
+    class RecordingBackend(SQLiteCacheBackend):
+        def __getattribute__(self, name):
+            if name in ("get", "set", "poll", "delete_tags", "publish"):
+                calls.append((name, threading.get_ident()))
+            return super().__getattribute__(name)
+
+    cache = ThreadSafeCache(ttl=60, backend=RecordingBackend(str(tmp_path / "cache.db")), name="recent", sync_interval=0)
+
+    async def run():
+        value = await cache.get_or_compute_async("page", lambda: {"issues": []}, tags=["issues:recent"])
+        await cache.invalidate_tags_async("issues:recent")
+        return value, threading.get_ident()
+
+    calls.clear()
+    value, loop_thread = asyncio.run(run())
+    assert value == {"issues": []}
+    assert {name for name, _ in calls} >= {"get", "set", "delete_tags", "publish"}
+    assert all(thread != loop_thread for _, thread in calls)
@@ -0,0 +1,94 @@
+import math
+
+import pytest
+from sqlalchemy import update
+
+from backend.models import ChainCheckpoint, Issue
+from backend.integrity_chain import IntegrityChain, chain_hash
+from backend.merkle import inclusion_proof, leaf_hash, merkle_root, verify_inclusion
+from backend.chain_audit import create_checkpoints, prove_inclusion, verify_inclusion_proof, verify_range
+
+BLOCK = 8
+
+
+@pytest.fixture
+def db_session(db_session):
+    IntegrityChain().append(db_session, [Issue(description=f"issue {i}", category="Road") for i in range(1, 31)])
+    return db_session
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 13])
+def test_every_leaf_proves_against_the_root(size):
+    leaves = [leaf_hash(str(i)) for i in range(size)]
+    root = merkle_root(leaves)
+    for index, leaf in enumerate(leaves):
+        proof = inclusion_proof(leaves, index)
+        assert len(proof) <= math.ceil(math.log2(size))
+        assert verify_inclusion(leaf, proof, root)
+    assert not verify_inclusion(leaf_hash("other"), inclusion_proof(leaves, 0), root)
+
+
+def test_checkpoints_cover_complete_blocks_only(db_session):
+    assert create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0) == 3
+    assert create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0) == 0
+
+    checkpoints = db_session.query(ChainCheckpoint).order_by(ChainCheckpoint.start_issue_id).all()
+    assert [(cp.start_issue_id, cp.end_issue_id) for cp in checkpoints] == [(1, 8), (9, 16), (17, 24)]
+    # Each root commits to all blocks so far
+    assert checkpoints[-1].root == merkle_root([cp.block_root for cp in checkpoints])
+
+
+def test_recent_issues_wait_for_the_settle_window(db_session):
+    assert create_checkpoints(db_session, block_size=BLOCK, settle_seconds=3600) == 0
+
+
+def test_verify_range_of_an_intact_chain(db_session):
+    create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0)
+    report = verify_range(db_session, 5, 30, batch_size=7)
+    assert report["is_valid"]
+    assert report["checked"] == report["sealed"] == 26
+    assert report["checkpoints_checked"] == 2  # blocks 9-16 and 17-24
+
+
+def test_verify_range_detects_tampering(db_session):
+    create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0)
+
+    # Edited text: the seal no longer matches
+    db_session.execute(update(Issue).where(Issue.id == 3).values(description="edited"))
+    # Rewritten with a self-consistent seal: only the checkpoint notices
+    db_session.execute(update(Issue).where(Issue.id == 12).values(
+        description="forged", integrity_hash=chain_hash("forged", "Road", db_session.get(Issue, 12).prev_hash)))
+    db_session.commit()
+
+    report = verify_range(db_session, 1, 30)
+    assert not report["is_valid"]
+    assert report["invalid_hashes"] == [3]
+    assert report["broken_links"] == [13]  # issue 13 still links to the original seal of 12
+    assert report["checkpoint_mismatches"] == [2]
+
+
+def test_verify_range_detects_deleted_block_start(db_session):
+    create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0)
+    db_session.query(Issue).filter(Issue.id == 9).delete()
+    db_session.commit()
+
+    report = verify_range(db_session, 1, 30)
+    assert report["checkpoint_mismatches"] == [2]
+    assert report["broken_links"] == [10]
+
+
+def test_inclusion_proof(db_session):
+    create_checkpoints(db_session, block_size=BLOCK, settle_seconds=0)
+
+    proof = prove_inclusion(db_session, 11)
+    assert proof["checkpoint_id"] == 2 and proof["block_index"] == 1
+    assert len(proof["block_proof"]) + len(proof["root_proof"]) <= math.ceil(math.log2(24)) + 1
+    assert verify_inclusion_proof(proof)
+
+    # Not checkpointed yet, or missing
+    assert prove_inclusion(db_session, 27) is None
+    assert prove_inclusion(db_session, 999) is None
+
+    db_session.execute(update(Issue).where(Issue.id == 11).values(integrity_hash="0" * 64))
+    db_session.commit()
+    assert not verify_inclusion_proof(prove_inclusion(db_session, 11))
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from backend.database import create_async_db_engine
+from backend.models import Issue
+from backend.integrity_chain import IntegrityChain, chain_hash
+
+
+def assert_linear_chain(SessionLocal, expected_length):
+    """Walk the chain from the genesis link: every issue is visited once, every hash verifies."""
+    with SessionLocal() as db:
+        rows = db.query(Issue.description, Issue.category, Issue.integrity_hash, Issue.prev_hash).all()
+    successors = {row.prev_hash: row for row in rows}
+    assert len(successors) == len(rows) == expected_length
+
+    head, visited = "", 0
+    while head in successors:
+        row = successors[head]
+        assert row.integrity_hash == chain_hash(row.description, row.category, head)
+        head, visited = row.integrity_hash, visited + 1
+    assert visited == expected_length
+
+
+def test_append_and_batch_append(db_file):
+    _, SessionLocal = db_file
+    chain = IntegrityChain()
+    with SessionLocal() as db:
+        first = Issue(description="first", category="Road")
+        chain.append(db, [first])
+        assert first.prev_hash == ""
+
+        batch = [Issue(description=f"bulk {i}", category="Water") for i in range(3)]
+        chain.append(db, batch)
+        assert batch[0].prev_hash == first.integrity_hash
+        assert [issue.prev_hash for issue in batch[1:]] == [issue.integrity_hash for issue in batch[:-1]]
+
+    assert chain.get_stats()["head"] == batch[-1].integrity_hash
+    assert_linear_chain(SessionLocal, 4)
+
+
+def test_concurrent_appends_do_not_fork(db_file):
+    _, SessionLocal = db_file
+    chain = IntegrityChain()
+
+    def worker(n):
+        with SessionLocal() as db:
+            for i in range(5):
+                chain.append(db, [Issue(description=f"worker {n} issue {i}", category="Road")])
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_linear_chain(SessionLocal, 20)
+
+
+def test_stale_head_from_another_process_is_retried(db_file):
+    _, SessionLocal = db_file
+    # Two workers, each with its own in-memory head
+    worker_a, worker_b = IntegrityChain(), IntegrityChain()
+    with SessionLocal() as db:
+        worker_a.append(db, [Issue(description="a1", category="Road")])
+        worker_b.append(db, [Issue(description="b1", category="Road")])
+        # worker_a's head is now stale: its first attempt hits the unique prev_hash index
+        worker_a.append(db, [Issue(description="a2", category="Road")])
+
+    assert worker_a.get_stats()["conflicts"] == 1
+    assert_linear_chain(SessionLocal, 3)
+
+
+def test_async_appends(db_file):
+    pytest.importorskip("aiosqlite")
+    url, SessionLocal = db_file
+    chain = IntegrityChain()
+
+    async def append_all():
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        engine = create_async_db_engine(url)
+        AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def one(i):
+            async with AsyncSessionLocal() as db:
+                await chain.append_async(db, [Issue(description=f"async {i}", category="Road")])
+
+        await asyncio.gather(*(one(i) for i in range(10)))
+        await engine.dispose()
+
+    asyncio.run(append_all())
+    assert chain.get_stats()["conflicts"] == 0
+    assert_linear_chain(SessionLocal, 10)
+
+
+def test_other_constraint_failures_are_not_retried(db_file):
+    _, SessionLocal = db_file
+    chain = IntegrityChain()
+    with SessionLocal() as db:
+        chain.append(db, [Issue(description="first", category="Road", reference_id="REF-1")])
+        with pytest.raises(IntegrityError):
+            chain.append(db, [Issue(description="clash", category="Road", reference_id="REF-1")])
+
+    assert chain.get_stats()["conflicts"] == 0
+    assert_linear_chain(SessionLocal, 1)
@@ -0,0 +1,62 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base
+from backend.models import Issue, IssueActionPlan
+from backend.tasks import process_action_plan_background
+
+
+@pytest.fixture
+def SessionLocal():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_issues_table_has_no_plan_column(SessionLocal):
+    columns = {c["name"] for c in inspect(SessionLocal.kw["bind"]).get_columns("issues")}
+    assert "action_plan" not in columns
+
+
+def test_plan_is_stored_aside_and_loaded_on_access(SessionLocal):
+    with SessionLocal() as db:
+        db.add(Issue(id=1, description="Pothole", category="Road", action_plan={"relevant_government_rule": "Rule 7"}))
+        db.add(Issue(id=2, description="No plan yet", category="Road"))
+        db.commit()
+
+    statements = []
+    event.listen(SessionLocal.kw["bind"], "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    with SessionLocal() as db:
+        issue = db.get(Issue, 1)
+        assert not any("issue_action_plans" in statement for statement in statements)
+        assert issue.action_plan == {"relevant_government_rule": "Rule 7"}
+        assert any("issue_action_plans" in statement for statement in statements)
+        assert db.get(Issue, 2).action_plan is None
+
+
+def test_background_generation_merges_into_the_plan(SessionLocal):
+    with SessionLocal() as db:
+        db.add(Issue(id=1, description="Pothole", category="Road", action_plan={"relevant_government_rule": "Rule 7"}))
+        db.add(Issue(id=2, description="Garbage", category="Garbage"))
+        db.commit()
+
+    generated = {"whatsapp": "Please fix", "x_post": "@mybmc"}
+    with patch("backend.tasks.SessionLocal", SessionLocal), \
+            patch("backend.tasks.generate_action_plan", AsyncMock(return_value=generated)):
+        for issue_id in (1, 2, 99):
+            asyncio.run(process_action_plan_background(issue_id, "d", "Road", "en", None))
+
+    with SessionLocal() as db:
+        assert db.get(Issue, 1).action_plan == {"relevant_government_rule": "Rule 7", **generated}
+        assert db.get(Issue, 2).action_plan == generated
+        assert db.get(IssueActionPlan, 99) is None  # unknown issue: nothing written
+
+        db.delete(db.get(Issue, 1))
+        db.commit()
+        assert db.get(IssueActionPlan, 1) is None
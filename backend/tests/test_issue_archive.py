@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from backend.models import Grievance, Issue, IssueActionPlan, IssueArchive
+from backend.integrity_chain import IntegrityChain
+from backend.chain_audit import create_checkpoints, prove_inclusion, verify_inclusion_proof, verify_range
+from backend.issue_archive import IssueArchiver, find_issue_row, issue_rows, restore_issue, table_sizes
+from backend.issue_counters import count_issues, reconcile_issue_counters
+from backend.upvote_buffer import UpvoteBuffer
+
+LONG_AGO = datetime.now(timezone.utc) - timedelta(days=200)
+RECENTLY = datetime.now(timezone.utc) - timedelta(days=5)
+
+
+@pytest.fixture
+def db_session(db_session):
+    chain = IntegrityChain()
+    chain.append(db_session, [
+        Issue(description=f"issue {i}", category="Road", reference_id=f"ref-{i}") for i in range(1, 21)
+    ])
+    # Odd ids: resolved long ago; 4: resolved recently; 6: verified long ago; 20 (chain head): resolved long ago
+    db_session.execute(update(Issue).where(Issue.id % 2 == 1).values(status="resolved", resolved_at=LONG_AGO))
+    db_session.execute(update(Issue).where(Issue.id == 4).values(status="resolved", resolved_at=RECENTLY))
+    db_session.execute(update(Issue).where(Issue.id == 6).values(status="verified", verified_at=LONG_AGO))
+    db_session.execute(update(Issue).where(Issue.id == 20).values(status="resolved", resolved_at=LONG_AGO))
+    db_session.add(IssueActionPlan(issue_id=3, plan={"whatsapp": "Fixed?"}))
+    db_session.add(Grievance(unique_id="G-1", category="Road", severity="LOW", current_jurisdiction_id=1,
+                             assigned_authority="PWD", sla_deadline=LONG_AGO, issue_id=5))
+    db_session.commit()
+    reconcile_issue_counters(db_session)
+    return db_session
+
+
+def archived_ids(db):
+    return sorted(row.id for row in db.query(IssueArchive.id))
+
+
+def test_archives_long_closed_issues_in_batches(db_session):
+    archiver = IssueArchiver(after_days=90, batch_size=3)
+    report = archiver.archive(db_session)
+
+    # Not 4 (recent), 5 (grievance), 20 (chain head) nor the open even ids
+    assert archived_ids(db_session) == [1, 3, 6, 7, 9, 11, 13, 15, 17, 19]
+    assert report["archived"] == 10 and report["batches"] == 4
+    assert table_sizes(db_session) == {"issues": 10, "issues_archive": 10}
+    assert archiver.get_stats()["archived"] == 10
+
+    # The action plan moved with its issue
+    assert db_session.get(IssueActionPlan, 3) is None
+    assert db_session.get(IssueArchive, 3).action_plan == {"whatsapp": "Fixed?"}
+
+    # Nothing left to do; counters still count archived issues
+    assert archiver.archive(db_session)["archived"] == 0
+    assert reconcile_issue_counters(db_session, repair=False)["consistent"]
+    assert count_issues(db_session)["total"] == 20
+
+
+def test_reads_fall_through_and_restore(db_session):
+    IssueArchiver(after_days=90).archive(db_session)
+
+    assert find_issue_row(db_session, ["id", "status"], issue_id=3).status == "resolved"
+    assert find_issue_row(db_session, ["id"], reference_id="ref-7").id == 7
+    assert find_issue_row(db_session, ["id"], issue_id=99) is None
+    assert [row.id for row in issue_rows(db_session, ["id"], min_id=5, max_id=9)] == [5, 6, 7, 8, 9]
+    assert [row.id for row in issue_rows(db_session, ["id"], max_id=12, descending=True, limit=2)] == [12, 11]
+
+    assert restore_issue(db_session, reference_id="ref-3")
+    db_session.commit()
+    assert db_session.get(IssueArchive, 3) is None
+    assert db_session.get(Issue, 3).action_plan == {"whatsapp": "Fixed?"}
+    assert not restore_issue(db_session, issue_id=3)
+
+
+def test_integrity_chain_spans_both_tables(db_session):
+    IssueArchiver(after_days=90).archive(db_session)
+
+    assert create_checkpoints(db_session, block_size=8, settle_seconds=0) == 2
+    assert verify_range(db_session, 1, 20, batch_size=3)["is_valid"]
+    proof = prove_inclusion(db_session, 7)  # archived issue
+    assert proof is not None and verify_inclusion_proof(proof)
+
+    # New issues chain onto the head, which stayed hot
+    IntegrityChain().append(db_session, [Issue(description="new", category="Road")])
+    report = verify_range(db_session, 1, 21)
+    assert report["is_valid"] and report["checked"] == 21
+
+
+def test_buffered_upvotes_move_with_archived_issues(db_session, monkeypatch):
+    buffer = UpvoteBuffer()
+    monkeypatch.setattr("backend.issue_archive.upvote_buffer", buffer)
+    buffer.add(3, 2)  # archived in this run
+    buffer.add(4)  # resolved recently: stays hot
+    IssueArchiver(after_days=90).archive(db_session)
+
+    assert db_session.get(IssueArchive, 3).upvotes == 2
+    assert buffer.pending(3) == 0 and buffer.pending(4) == 1
+    assert buffer.flush(db_session) == 1
+    assert buffer.get_stats()["dropped_votes"] == 0
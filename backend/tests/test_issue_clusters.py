@@ -0,0 +1,116 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+
+from backend.models import Issue
+from backend.spatial_index import OpenIssueIndex, OpenIssueRecord, open_issue_index
+from backend.spatial_utils import cluster_issues_dbscan
+from backend.issue_clusters import IssueClusterIndex, find_issue_clusters
+
+LAT, LON = 19.0760, 72.8777
+# ~20m and ~100m north
+STEP_20M = 0.00018
+STEP_100M = 0.0009
+
+
+def _record(issue_id, lat, lon=LON, upvotes=0):
+    return OpenIssueRecord(issue_id, lat, lon, upvotes, datetime(2024, 1, 1) + timedelta(minutes=issue_id))
+
+
+def _partition(clusters):
+    return sorted(sorted(issue.id for issue in cluster) for cluster in clusters)
+
+
+def test_bridge_issue_merges_and_removal_splits():
+    index = OpenIssueIndex()
+    clusters = IssueClusterIndex(eps_meters=30.0)
+    index.add_listener(clusters)
+
+    index.upsert(_record(1, LAT))
+    index.upsert(_record(2, LAT + 2 * STEP_20M))   # ~40m away: separate cluster
+    assert clusters.cluster_of(1) != clusters.cluster_of(2)
+
+    index.upsert(_record(3, LAT + STEP_20M))       # bridges 1 and 2
+    assert clusters.cluster_of(1) == clusters.cluster_of(2) == clusters.cluster_of(3)
+
+    index.discard(3)
+    assert clusters.cluster_of(1) != clusters.cluster_of(2)
+    assert clusters.get_stats()["clusters"] == 2
+
+
+def test_incremental_clusters_match_dbscan():
+    random.seed(7)
+    index = OpenIssueIndex()
+    clusters = IssueClusterIndex(eps_meters=30.0)
+    index.add_listener(clusters)
+
+    live = {}
+    for issue_id in range(1, 400):
+        record = _record(issue_id, LAT + random.uniform(0, 0.003), LON + random.uniform(0, 0.003))
+        index.upsert(record)
+        live[issue_id] = record
+        if issue_id % 3 == 0:
+            removed = random.choice(list(live))
+            index.discard(removed)
+            del live[removed]
+
+    expected = _partition(cluster_issues_dbscan(list(live.values()), eps_meters=30.0))
+    summaries = clusters.clusters_in_bbox(-90, -180, 90, 180)
+    assert sum(summary.size for summary in summaries) == len(live)
+
+    actual = {}
+    for issue_id in live:
+        actual.setdefault(clusters.cluster_of(issue_id), []).append(issue_id)
+    assert sorted(sorted(ids) for ids in actual.values()) == expected
+
+
+def test_summary_uses_centroid_and_representative():
+    index = OpenIssueIndex()
+    clusters = IssueClusterIndex()
+    index.add_listener(clusters)
+
+    index.upsert(_record(1, LAT))
+    index.upsert(_record(2, LAT + STEP_20M))
+    index.upsert(_record(3, LAT + 10 * STEP_100M))
+
+    summary = clusters.clusters_in_bbox(LAT - 0.001, LON - 0.001, LAT + 0.001, LON + 0.001)
+    assert len(summary) == 1
+    assert summary[0].size == 2
+    assert summary[0].centroid_latitude == pytest.approx(LAT + STEP_20M / 2)
+    # Oldest wins on a tie, until an upvote changes the representative
+    assert summary[0].representative.id == 1
+    index.add_upvotes(2, 3)
+    assert clusters.clusters_in_bbox(LAT - 0.001, LON - 0.001, LAT + 0.001, LON + 0.001)[0].representative.id == 2
+
+
+def test_find_issue_clusters_follows_session_writes(db_session):
+    open_issue_index.rebuild(db_session)
+
+    first = Issue(description="pothole", category="Road", status="open", latitude=LAT, longitude=LON)
+    second = Issue(description="same pothole", category="Road", status="open", latitude=LAT + STEP_20M, longitude=LON)
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    results = find_issue_clusters(db_session, LAT - 0.01, LON - 0.01, LAT + 0.01, LON + 0.01)
+    assert [summary.size for summary, _ in results] == [2]
+    assert results[0][1].id == first.id
+
+    first.status = "resolved"
+    db_session.commit()
+    results = find_issue_clusters(db_session, LAT - 0.01, LON - 0.01, LAT + 0.01, LON + 0.01)
+    assert [(summary.size, row.id) for summary, row in results] == [(1, second.id)]
+
+
+def test_find_issue_clusters_without_index(db_session, monkeypatch):
+    db_session.add_all([
+        Issue(id=1, description="a", category="Road", status="open", latitude=LAT, longitude=LON),
+        Issue(id=2, description="b", category="Road", status="open", latitude=LAT + STEP_20M, longitude=LON),
+        Issue(id=3, description="c", category="Road", status="open", latitude=LAT + STEP_100M, longitude=LON),
+    ])
+    db_session.commit()
+
+    monkeypatch.setattr("backend.issue_clusters.open_issue_index", OpenIssueIndex())
+
+    results = find_issue_clusters(db_session, LAT - 0.01, LON - 0.01, LAT + 0.01, LON + 0.01)
+    assert [summary.size for summary, _ in results] == [2, 1]
+    assert results[0][0].cluster_id is None
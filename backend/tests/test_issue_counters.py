@@ -0,0 +1,73 @@
+from backend.models import Issue, IssueCounter
+from backend.issue_counters import (
+    count_issues, read_issue_counters, reconcile_issue_counters, record_status_change, stats_from_counters
+)
+from backend.routers.utility import compute_stats
+
+
+def test_orm_writes_maintain_counters(db_session):
+    db_session.add_all([
+        Issue(description="a", category="Road"),
+        Issue(description="b", category="Road", status="resolved"),
+        Issue(description="c", category="Garbage"),
+    ])
+    db_session.commit()
+    assert read_issue_counters(db_session) == count_issues(db_session)
+
+    # Status change on a loaded-then-expired object still moves the count
+    issue = db_session.query(Issue).filter(Issue.description == "a").first()
+    db_session.commit()
+    issue.status = "verified"
+    issue.category = "Garbage"
+    db_session.commit()
+
+    db_session.delete(db_session.query(Issue).filter(Issue.description == "c").first())
+    db_session.commit()
+
+    counters = read_issue_counters(db_session)
+    assert counters == {**count_issues(db_session), "category:Garbage": 1, "status:open": 0}
+    assert compute_stats(db_session) == {
+        "total_issues": 2,
+        "resolved_issues": 2,
+        "pending_issues": 0,
+        "issues_by_category": {"Road": 1, "Garbage": 1},
+    }
+
+
+def test_rolled_back_writes_leave_counters_untouched(db_session):
+    db_session.add(Issue(description="a", category="Road"))
+    db_session.flush()
+    db_session.rollback()
+    assert read_issue_counters(db_session) == {}
+
+
+def test_bulk_update_with_record_status_change(db_session):
+    db_session.add(Issue(id=1, description="a", category="Road"))
+    db_session.commit()
+
+    db_session.query(Issue).filter(Issue.id == 1).update({Issue.status: "verified"}, synchronize_session=False)
+    record_status_change(db_session, "open", "verified")
+    db_session.commit()
+
+    stats = stats_from_counters(read_issue_counters(db_session))
+    assert stats["resolved_issues"] == 1
+    assert stats["pending_issues"] == 0
+
+
+def test_reconcile_repairs_drift(db_session):
+    db_session.add_all([Issue(description="a", category="Road"), Issue(description="b", category="Water")])
+    db_session.commit()
+
+    # Writes that bypass the session hooks
+    db_session.query(Issue).filter(Issue.category == "Water").delete(synchronize_session=False)
+    db_session.query(IssueCounter).filter(IssueCounter.name == "category:Road").delete()
+    db_session.commit()
+
+    report = reconcile_issue_counters(db_session, repair=False)
+    assert not report["consistent"]
+    assert report["drift"]["total"] == {"stored": 2, "expected": 1}
+    assert report["drift"]["category:Road"] == {"stored": 0, "expected": 1}
+
+    assert reconcile_issue_counters(db_session)["repaired"]
+    assert reconcile_issue_counters(db_session)["consistent"]
+    assert stats_from_counters(read_issue_counters(db_session))["issues_by_category"] == {"Road": 1}
@@ -0,0 +1,118 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from backend.models import Issue
+from backend.pagination import encode_cursor, next_cursor
+from backend.issue_search import ensure_search_index, search_backend, search_issues, search_query, _search_backend
+
+
+@pytest.fixture
+def db_session(db_session):
+    # create_all made the FTS5 table and triggers too
+    db_session.add_all([
+        Issue(id=1, description="Huge pothole on the main road", category="Road", location="Pune",
+              status="open", latitude=18.52, longitude=73.85),
+        Issue(id=2, description="Pothole pothole pothole near the school", category="Road", location="Mumbai",
+              status="open", latitude=19.07, longitude=72.87),
+        Issue(id=3, description="Garbage dumped next to the river", category="Garbage", location="Pune",
+              status="resolved", latitude=18.53, longitude=73.86),
+        Issue(id=4, description="Streetlight broken for a week", category="Streetlight", location="Nagpur",
+              status="open"),
+    ])
+    db_session.commit()
+    return db_session
+
+
+def ids(rows):
+    return [row.id for row in rows]
+
+
+def test_uses_fts5_index(db_session):
+    assert search_backend(db_session) == "fts5"
+
+
+def test_matches_are_ranked(db_session):
+    rows = search_issues(db_session, "pothole")
+    assert ids(rows) == [2, 1]  # the repeated term ranks higher
+    assert rows[0].rank <= rows[1].rank
+
+
+def test_searches_location_and_category_with_stemming_and_prefixes(db_session):
+    assert set(ids(search_issues(db_session, "pune"))) == {1, 3}
+    assert ids(search_issues(db_session, "potholes")) == [2, 1]
+    assert ids(search_issues(db_session, "street")) == [4]  # prefix of the last word
+    assert ids(search_issues(db_session, "garbage river")) == [3]
+
+
+def test_status_and_bbox_filters(db_session):
+    assert set(ids(search_issues(db_session, "pune", status="open"))) == {1}
+    assert ids(search_issues(db_session, "road", bbox=(73.0, 18.0, 74.0, 19.0))) == [1]
+
+
+def test_index_follows_inserts_updates_and_deletes(db_session):
+    db_session.add(Issue(id=5, description="Water leakage from pipeline", category="Water"))
+    db_session.commit()
+    assert ids(search_issues(db_session, "leakage")) == [5]
+
+    db_session.get(Issue, 5).description = "Sewage overflow"
+    db_session.commit()
+    assert ids(search_issues(db_session, "leakage")) == []
+    assert ids(search_issues(db_session, "sewage")) == [5]
+
+    db_session.query(Issue).filter(Issue.id == 5).delete()
+    db_session.commit()
+    assert ids(search_issues(db_session, "sewage")) == []
+
+
+def test_cursor_pages_cover_every_match_once(db_session):
+    db_session.add_all([Issue(description=f"Pothole number {i}", category="Road") for i in range(7)])
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        rows = search_issues(db_session, "pothole", limit=3, cursor=cursor)
+        seen += ids(rows)
+        cursor = next_cursor(rows, 3, lambda row: (row.rank, row.id))
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(ids(search_issues(db_session, "pothole", limit=100)))
+    assert len(seen) == 9
+
+
+def test_query_syntax_is_not_interpreted(db_session):
+    assert ids(search_issues(db_session, 'pothole" OR NEAR(* -school')) == []
+    with pytest.raises(HTTPException) as exc_info:
+        search_issues(db_session, '"*" -')
+    assert exc_info.value.status_code == 400
+
+
+def test_backfill_and_like_fallback(db_session):
+    engine = db_session.get_bind()
+    db_session.execute(text("DROP TABLE issues_fts"))
+    db_session.commit()
+    _search_backend.pop(engine, None)
+    assert search_backend(db_session) == "like"
+    assert set(ids(search_issues(db_session, "pothole"))) == {1, 2}
+
+    # Migration path: the index is rebuilt from the existing rows
+    with engine.begin() as conn:
+        assert ensure_search_index(conn)
+    assert search_backend(db_session) == "fts5"
+    assert ids(search_issues(db_session, "pothole")) == [2, 1]
+
+
+def test_postgres_rank_cursor_round_trips_in_double_precision():
+    rank = 0.1  # a float8 cursor value; as float4 it would read back as 0.100000001490116
+    query = search_query(Session(), ["pothole"], "tsvector", limit=3, cursor=encode_cursor(rank, 7))
+    compiled = query.statement.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+
+    # Selected, compared with the cursor and ordered by: always the double precision rank
+    assert sql.count("ts_rank_cd(") == sql.count("CAST(ts_rank_cd(") == 3
+    assert sql.count(")) AS FLOAT(53))") == 3
+    assert ", issues.id) < (%(param_1)s" in sql and "AS FLOAT(53)) DESC, issues.id DESC" in sql
+    assert (compiled.params["param_1"], compiled.params["param_2"]) == (rank, 7)
+    assert query.statement.selected_columns.rank.type.precision == 53
@@ -0,0 +1,84 @@
+from sqlalchemy import create_engine, inspect, text
+
+from backend.database import Base
+import backend.models  # noqa: F401
+from backend.migrations import (
+    LATEST_VERSION, MIGRATIONS, applied_versions, ensure_schema_current, pending_migrations, upgrade
+)
+
+
+def legacy_engine(tmp_path):
+    """A database created by an old release: issues without the later columns."""
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE issues (id INTEGER PRIMARY KEY, description TEXT, category VARCHAR, "
+            "image_path VARCHAR, source VARCHAR, status VARCHAR, created_at DATETIME, user_email VARCHAR)"
+        ))
+        conn.execute(text("INSERT INTO issues (description, status) VALUES ('old', 'open')"))
+    return engine
+
+
+def test_upgrade_migrates_legacy_schema_once(tmp_path):
+    engine = legacy_engine(tmp_path)
+    assert [m.version for m in pending_migrations(engine)] == [m.version for m in MIGRATIONS]
+
+    assert upgrade(engine) == [m.version for m in MIGRATIONS]
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("issues")}
+    assert {"upvotes", "latitude", "longitude", "location", "integrity_hash", "prev_hash"} <= columns
+    assert "action_plan" in columns  # copied to issue_action_plans; dropped by a later release
+    indexes = {i["name"] for i in inspector.get_indexes("issues")}
+    assert {"ix_issues_status_lat_lon", "ix_issues_user_email_created_at"} <= indexes
+
+    # Nothing left to do, and no statement is re-run
+    assert upgrade(engine) == []
+    assert applied_versions(engine) == [m.version for m in MIGRATIONS]
+
+
+def test_action_plans_move_out_of_the_issues_table(tmp_path):
+    engine = legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE issues ADD COLUMN action_plan TEXT"))
+        conn.execute(text(
+            "INSERT INTO issues (description, status, action_plan) VALUES ('planned', 'open', '{\"x_post\": \"@mybmc\"}')"
+        ))
+    upgrade(engine)
+
+    with engine.connect() as conn:
+        plans = conn.execute(text("SELECT issue_id, plan FROM issue_action_plans")).all()
+        # Processes of the previous release still read the column
+        kept = conn.execute(text("SELECT action_plan FROM issues WHERE id = 2")).scalar()
+    assert plans == [(2, '{"x_post": "@mybmc"}')]
+    assert kept == '{"x_post": "@mybmc"}'
+
+
+def test_steps_are_noops_on_tables_created_by_create_all(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/fresh.db")
+    Base.metadata.create_all(bind=engine)
+    assert upgrade(engine) == [m.version for m in MIGRATIONS]
+
+
+def test_startup_check(tmp_path):
+    engine = legacy_engine(tmp_path)
+    assert not ensure_schema_current(engine, auto_migrate=False)
+    assert applied_versions(engine) == []
+
+    assert ensure_schema_current(engine, auto_migrate=True)
+    assert applied_versions(engine)[-1] == LATEST_VERSION
+    assert ensure_schema_current(engine, auto_migrate=False)
+
+
+def test_version_claimed_by_another_process_is_skipped(tmp_path, monkeypatch):
+    engine = legacy_engine(tmp_path)
+    # Both processes saw every migration as pending; the other one committed version 1 first
+    monkeypatch.setattr("backend.migrations.pending_migrations", lambda engine: list(MIGRATIONS))
+    applied_versions(engine)  # creates schema_migrations
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO schema_migrations (version, name, applied_at) VALUES (1, 'baseline', '2024-01-01')"
+        ))
+
+    assert upgrade(engine) == [m.version for m in MIGRATIONS[1:]]
+    # The baseline step did not run here
+    assert "upvotes" not in {c["name"] for c in inspect(engine).get_columns("issues")}
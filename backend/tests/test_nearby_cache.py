@@ -0,0 +1,105 @@
+import json
+import random
+import pytest
+
+from backend.cache import ThreadSafeCache
+from backend.cache_backend import InProcessCacheBackend
+from backend.models import Issue
+from backend.nearby_cache import NearbyIssuesCache
+from backend.spatial_index import open_issue_index
+from backend.spatial_utils import find_nearby_issues
+
+LAT, LON = 19.0760, 72.8777
+
+
+@pytest.fixture
+def db_session(db_session):
+    open_issue_index.rebuild(db_session)
+    return db_session
+
+
+def test_nearby_requests_share_a_cell_entry(db_session):
+    db_session.add(Issue(description="pothole", category="Road", status="open", latitude=LAT, longitude=LON))
+    db_session.commit()
+
+    cache = NearbyIssuesCache(ThreadSafeCache(ttl=60, max_size=100))
+    first = cache.get_nearby(db_session, LAT, LON, 50.0, 10)
+    # ~1m away, smaller radius: same bucket and cell
+    second = cache.get_nearby(db_session, LAT + 0.00001, LON, 40.0, 10)
+
+    assert [row.id for row, _ in first] == [row.id for row, _ in second]
+    assert second[0][1] == pytest.approx(1.1, abs=0.2)
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_cached_results_are_exact(db_session):
+    random.seed(3)
+    db_session.add_all([
+        Issue(description=f"issue {i}", category="Road", status="open",
+              latitude=LAT + random.uniform(-0.006, 0.006), longitude=LON + random.uniform(-0.006, 0.006))
+        for i in range(300)
+    ])
+    db_session.commit()
+    all_rows = db_session.query(Issue.id, Issue.latitude, Issue.longitude).all()
+
+    cache = NearbyIssuesCache(ThreadSafeCache(ttl=60, max_size=1000))
+    for _ in range(100):
+        lat = LAT + random.uniform(-0.004, 0.004)
+        lon = LON + random.uniform(-0.004, 0.004)
+        radius = random.choice([30.0, 50.0, 80.0, 200.0, 500.0])
+        expected = find_nearby_issues(all_rows, lat, lon, radius, limit=10)
+        actual = cache.get_nearby(db_session, lat, lon, radius, 10)
+        assert [row.id for row, _ in actual] == [row.id for row, _ in expected]
+
+    assert cache.get_stats()["hits"] > 0
+
+
+def test_invalidation_makes_new_issue_visible(db_session):
+    cache = NearbyIssuesCache(ThreadSafeCache(ttl=60, max_size=100))
+    assert cache.get_nearby(db_session, LAT, LON, 100.0, 10) == []
+
+    issue = Issue(description="new pothole", category="Road", status="open", latitude=LAT + 0.0005, longitude=LON)
+    db_session.add(issue)
+    db_session.commit()
+
+    # Still served from the cached (empty) cell until invalidated
+    assert cache.get_nearby(db_session, LAT, LON, 100.0, 10) == []
+
+    assert cache.invalidate_at(issue.latitude, issue.longitude) > 0
+    assert [row.id for row, _ in cache.get_nearby(db_session, LAT, LON, 100.0, 10)] == [issue.id]
+
+
+def test_points_are_invalidated_in_one_shared_event():
+    backend = InProcessCacheBackend()
+    cache = NearbyIssuesCache(ThreadSafeCache(ttl=60, max_size=100, backend=backend, name="nearby_issues"))
+    far = (LAT + 0.05, LON)
+    keys = cache.invalidate_points([(LAT, LON), (LAT + 0.00001, LON), far])
+
+    events = backend.poll(0)
+    assert len(events) == 1
+    assert len(events[0].targets) == keys == len(set(events[0].targets))
+    assert keys > cache.invalidate_points([(LAT, LON)])
+    assert cache.invalidate_points([]) == 0
+
+
+def test_nearby_json_matches_response_model(db_session):
+    from backend.schemas import NearbyIssueResponse
+
+    db_session.add_all([
+        Issue(description="x" * 150, category="Road", status="open", latitude=LAT, longitude=LON),
+        Issue(description="garbage", category="Garbage", status="open", latitude=LAT + 0.0002, longitude=LON),
+    ])
+    db_session.commit()
+
+    cache = NearbyIssuesCache(ThreadSafeCache(ttl=60, max_size=100))
+    body = json.loads(cache.get_nearby_json(db_session, LAT, LON, 50.0, 10))
+
+    assert [item["id"] for item in body] == [row.id for row, _ in cache.get_nearby(db_session, LAT, LON, 50.0, 10)]
+    for item in body:
+        # Same fields, in the same order, as the declared response model
+        assert list(item) == list(NearbyIssueResponse.model_fields)
+        NearbyIssueResponse(**item)
+    assert body[0]["description"] == "x" * 100 + "..."
+    assert body[0]["distance_meters"] == 0.0
+    assert body[1]["distance_meters"] > 0
@@ -0,0 +1,70 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+
+from backend.models import Issue
+from backend.pagination import decode_cursor, encode_cursor, next_cursor, paginate
+
+KEY = (Issue.created_at, Issue.id)
+PARSERS = (datetime.fromisoformat, int)
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def db_session(db_session):
+    # Pairs of issues share a timestamp, so id has to break the ties
+    db_session.add_all([
+        Issue(id=i, description=f"issue {i}", category="Road", created_at=START + timedelta(minutes=i // 2))
+        for i in range(1, 24)
+    ])
+    db_session.commit()
+    return db_session
+
+
+def fetch_all_pages(db, limit):
+    pages, cursor = [], None
+    while True:
+        rows = paginate(db.query(Issue.id, Issue.created_at), KEY, PARSERS, limit, cursor=cursor).all()
+        pages.append([row.id for row in rows])
+        cursor = next_cursor(rows, limit, lambda row: (row.created_at, row.id))
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(START, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, PARSERS) == (START, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(1, 2, 3), encode_cursor("yesterday", 1)])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, PARSERS)
+    assert exc_info.value.status_code == 400
+
+
+def test_cursor_pages_cover_every_row_once_in_offset_order(db_session):
+    pages = fetch_all_pages(db_session, 5)
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+
+    by_offset = [
+        row.id for row in paginate(db_session.query(Issue.id), KEY, PARSERS, 100, offset=0).all()
+    ]
+    assert sum(pages, []) == by_offset == sorted(range(1, 24), key=lambda i: (i // 2, i), reverse=True)
+
+
+def test_inserts_do_not_shift_cursor_pages(db_session):
+    first = paginate(db_session.query(Issue.id, Issue.created_at), KEY, PARSERS, 5).all()
+    cursor = next_cursor(first, 5, lambda row: (row.created_at, row.id))
+
+    db_session.add(Issue(description="newer", category="Road", created_at=START + timedelta(days=1)))
+    db_session.commit()
+
+    second = paginate(db_session.query(Issue.id), KEY, PARSERS, 5, cursor=cursor).all()
+    assert [row.id for row in second] == [18, 17, 16, 15, 14]
+
+
+def test_cursor_and_offset_are_exclusive(db_session):
+    with pytest.raises(HTTPException):
+        paginate(db_session.query(Issue.id), KEY, PARSERS, 5, offset=5, cursor=encode_cursor(START, 1))
@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.rate_limiter import (
+    InMemoryRateLimitStorage, SQLiteRateLimitStorage, RateLimiter, RateLimitPolicy,
+    RateLimitMiddleware, route_policy, UPLOAD_POLICY, DETECTION_POLICY, AUTH_POLICY
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_sliding_window_limits_and_decays():
+    clock = FakeClock(1000.0)
+    storage = InMemoryRateLimitStorage(clock=clock)
+
+    results = [storage.hit("k", 5, 60.0) for _ in range(6)]
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert results[4].remaining == 0
+    assert 0 < results[5].retry_after <= 60.0
+
+    # Halfway into the next window ([1020, 1080)) half of the previous count still weighs in
+    clock.now = 1050.0
+    assert storage.hit("k", 5, 60.0).allowed
+    assert storage.hit("k", 5, 60.0).allowed
+    assert not storage.hit("k", 5, 60.0).allowed
+
+    # Two windows later nothing is left
+    clock.now += 120.0
+    assert sum(storage.hit("k", 5, 60.0).allowed for _ in range(6)) == 5
+
+
+def test_retry_after_is_accurate():
+    clock = FakeClock(0.0)
+    storage = InMemoryRateLimitStorage(clock=clock)
+    for _ in range(3):
+        storage.hit("k", 3, 60.0)
+    denied = storage.hit("k", 3, 60.0)
+    assert not denied.allowed
+
+    clock.now += denied.retry_after + 0.01
+    assert storage.hit("k", 3, 60.0).allowed
+
+
+def test_check_and_consume_is_atomic():
+    storage = InMemoryRateLimitStorage()
+    allowed = []
+
+    def worker():
+        for _ in range(20):
+            allowed.append(storage.hit("k", 50, 3600.0).allowed)
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(allowed) == 50
+
+
+def test_memory_storage_is_bounded():
+    clock = FakeClock(0.0)
+    storage = InMemoryRateLimitStorage(max_keys=10, clock=clock)
+    for i in range(25):
+        storage.hit(f"k{i}", 5, 60.0)
+    assert storage.get_stats()["keys"] == 10
+
+
+def test_sqlite_storage_shared_between_instances(tmp_path):
+    path = str(tmp_path / "rate_limits.db")
+    clock = FakeClock(0.0)
+    # Two storages on the same file behave like two worker processes
+    first = SQLiteRateLimitStorage(path, clock=clock)
+    second = SQLiteRateLimitStorage(path, clock=clock)
+
+    assert first.hit("k", 3, 60.0).allowed
+    assert second.hit("k", 3, 60.0).allowed
+    assert first.hit("k", 3, 60.0).allowed
+    assert not second.hit("k", 3, 60.0).allowed
+    assert first.get_stats()["keys"] == 1
+
+
+def test_route_policies():
+    assert route_policy("POST", "/api/issues") is UPLOAD_POLICY
+    assert route_policy("POST", "/api/issues/12/verify") is UPLOAD_POLICY
+    assert route_policy("POST", "/api/detect-pothole") is DETECTION_POLICY
+    assert route_policy("POST", "/auth/login") is AUTH_POLICY
+    assert route_policy("GET", "/api/issues") is None
+    assert route_policy("POST", "/api/issues/12/vote") is None
+
+
+def test_middleware_rejects_over_limit_requests():
+    limiter = RateLimiter(InMemoryRateLimitStorage())
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware, limiter=limiter,
+        policy_for=lambda method, path: RateLimitPolicy("test", 2, 60.0) if path == "/limited" else None
+    )
+
+    @app.get("/limited")
+    def limited():
+        return {"ok": True}
+
+    @app.get("/open")
+    def open_route():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert [client.get("/limited").status_code for _ in range(3)] == [200, 200, 429]
+    response = client.get("/limited")
+    assert int(response.headers["retry-after"]) > 0
+    assert client.get("/open").status_code == 200
+    assert limiter.get_stats()["policies"]["test"] == {"allowed": 2, "denied": 2}
+
+
+def test_storage_errors_fail_open():
+    class BrokenStorage:
+        def hit(self, key, limit, window):
+            raise RuntimeError("storage down")
+
+    limiter = RateLimiter(BrokenStorage())
+    assert limiter.hit(RateLimitPolicy("test", 1, 60.0), "client").allowed
+
+
+def test_sqlite_storage_prunes_idle_keys(tmp_path):
+    clock = FakeClock(0.0)
+    storage = SQLiteRateLimitStorage(str(tmp_path / "rate_limits.db"), clock=clock, prune_every=10)
+    for i in range(9):
+        storage.hit(f"idle{i}", 5, 60.0)
+
+    # Two windows later, the 10th hit prunes every key that is idle by then
+    clock.now = 200.0
+    storage.hit("active", 5, 60.0)
+    stats = storage.get_stats()
+    assert stats["keys"] == 1 and stats["pruned"] == 9
+
+
+def test_middleware_keeps_blocking_storage_off_the_event_loop():
+    class BlockingStorage(InMemoryRateLimitStorage):
+        blocking = True
+        threads = []
+
+        def hit(self, key, limit, window):
+            self.threads.append(threading.get_ident())
+            return super().hit(key, limit, window)
+
+    limiter = RateLimiter(BlockingStorage())
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=limiter,
+                       policy_for=lambda method, path: RateLimitPolicy("test", 5, 60.0))
+
+    @app.get("/loop")
+    async def loop_thread():
+        return {"thread": threading.get_ident()}
+
+    response = TestClient(app).get("/loop")
+    assert response.status_code == 200
+    assert BlockingStorage.threads and BlockingStorage.threads[0] != response.json()["thread"]
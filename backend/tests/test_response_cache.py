@@ -0,0 +1,36 @@
+import gzip
+import json
+
+from fastapi import Request
+
+from backend.response_cache import encode_payload, payload_response, GZIP_MIN_SIZE
+
+
+def _request(accept_encoding=None):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_encoded_body_matches_json():
+    data = [{"id": 1, "description": "Gaddha near मंदिर", "upvotes": 3, "location": None}]
+    payload = encode_payload(data)
+    assert json.loads(payload.body) == data
+    assert payload.data is data
+    # Small bodies get no gzip variant
+    assert payload.gzip_body is None
+
+
+def test_gzip_variant_served_when_accepted():
+    data = [{"id": i, "description": "pothole " * 10} for i in range(20)]
+    payload = encode_payload(data)
+    assert len(payload.body) >= GZIP_MIN_SIZE
+    assert gzip.decompress(payload.gzip_body) == payload.body
+
+    response = payload_response(payload, _request("gzip, deflate"))
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.body == payload.gzip_body
+
+    response = payload_response(payload, _request())
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.body == payload.body
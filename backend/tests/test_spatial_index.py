@@ -0,0 +1,190 @@
+from datetime import datetime
+
+from backend.cache_backend import InProcessCacheBackend
+from backend.models import Issue
+from backend.spatial_index import OpenIssueIndex, OpenIssueRecord, open_issue_index, find_nearby_open_issues
+
+LAT, LON = 19.0760, 72.8777
+
+
+def test_nearby_lookup_across_cell_boundaries():
+    index = OpenIssueIndex(cell_size_meters=50.0)
+    index.upsert(OpenIssueRecord(1, LAT, LON, 0, datetime.now()))
+    # ~40m north: very likely in a neighbouring cell
+    index.upsert(OpenIssueRecord(2, LAT + 0.00036, LON, 0, datetime.now()))
+    # ~1km away
+    index.upsert(OpenIssueRecord(3, LAT + 0.009, LON, 0, datetime.now()))
+
+    results = index.nearby(LAT, LON, 50.0)
+    assert [record.id for record, _ in results] == [1, 2]
+
+    index.discard(1)
+    assert [record.id for record, _ in index.nearby(LAT, LON, 50.0)] == [2]
+
+
+def test_apply_removes_closed_issues():
+    index = OpenIssueIndex()
+    index.apply(1, "open", LAT, LON, 3, None)
+    assert index.get_stats()["indexed_issues"] == 1
+
+    index.add_upvotes(1, 2)
+    assert index.nearby(LAT, LON, 50.0)[0][0].upvotes == 5
+
+    index.apply(1, "resolved", LAT, LON, 5, None)
+    assert index.get_stats()["indexed_issues"] == 0
+
+
+def test_consistency_check_detects_and_repairs_drift(db_session):
+    db_session.add_all([
+        Issue(id=1, description="a", status="open", latitude=LAT, longitude=LON),
+        Issue(id=2, description="b", status="open", latitude=LAT, longitude=LON + 0.0001),
+    ])
+    db_session.commit()
+
+    index = OpenIssueIndex()
+    index.rebuild(db_session)
+    assert index.check_consistency(db_session)["consistent"]
+
+    # Simulate a write the index never saw
+    index.discard(2)
+    report = index.check_consistency(db_session, repair=True)
+    assert not report["consistent"]
+    assert report["missing"] == [2]
+    assert report["rebuilt"]
+    assert index.check_consistency(db_session)["consistent"]
+
+
+def test_session_hooks_keep_global_index_in_sync(db_session):
+    open_issue_index.rebuild(db_session)
+
+    issue = Issue(description="pothole", status="open", latitude=LAT, longitude=LON)
+    db_session.add(issue)
+    db_session.commit()
+
+    results = find_nearby_open_issues(db_session, LAT, LON, 50.0, 3)
+    assert [row.id for row, _ in results] == [issue.id]
+    assert results[0][0].description == "pothole"
+
+    # Rolled back changes are not applied
+    issue.status = "resolved"
+    db_session.flush()
+    db_session.rollback()
+    assert open_issue_index.nearby(LAT, LON, 50.0)
+
+    issue.status = "verified"
+    db_session.commit()
+    assert open_issue_index.nearby(LAT, LON, 50.0) == []
+    assert find_nearby_open_issues(db_session, LAT, LON, 50.0, 3) == []
+
+
+def test_nearest_expands_until_k_found():
+    index = OpenIssueIndex(cell_size_meters=50.0)
+    # Dense cluster far away, a couple of issues close by
+    for i in range(200):
+        index.upsert(OpenIssueRecord(100 + i, LAT + 0.05 + i * 1e-5, LON, 0, None))
+    index.upsert(OpenIssueRecord(1, LAT + 0.0009, LON, 0, None))   # ~100m
+    index.upsert(OpenIssueRecord(2, LAT + 0.0045, LON, 0, None))   # ~500m
+
+    results = index.nearest(LAT, LON, k=2, max_radius_meters=5000.0)
+    assert [record.id for record, _ in results] == [1, 2]
+    assert results[0][1] < results[1][1]
+
+    # Sparse: fewer than k within the max radius
+    results = index.nearest(LAT, LON, k=5, max_radius_meters=1000.0)
+    assert [record.id for record, _ in results] == [1, 2]
+
+
+def test_find_nearest_open_issues_db_fallback(db_session, monkeypatch):
+    from backend.spatial_index import find_nearest_open_issues
+
+    db_session.add_all([
+        Issue(id=1, description="close", status="open", latitude=LAT + 0.0009, longitude=LON),
+        Issue(id=2, description="further", status="open", latitude=LAT + 0.009, longitude=LON),
+        Issue(id=3, description="closed", status="resolved", latitude=LAT, longitude=LON),
+    ])
+    db_session.commit()
+
+    # An index that was never built forces the expanding-radius DB queries
+    monkeypatch.setattr("backend.spatial_index.open_issue_index", OpenIssueIndex())
+
+    results = find_nearest_open_issues(db_session, LAT, LON, k=2, max_radius_meters=5000.0)
+    assert [row.id for row, _ in results] == [1, 2]
+
+
+def test_refresh_exchanges_changed_ids_with_other_workers(db_session):
+    db_session.add_all([
+        Issue(id=1, description="a", status="open", latitude=LAT, longitude=LON, upvotes=0),
+        Issue(id=2, description="b", status="resolved", latitude=LAT, longitude=LON + 0.0001),
+        Issue(id=3, description="c", status="open", latitude=LAT, longitude=LON + 0.0002, upvotes=0),
+    ])
+    db_session.commit()
+    backend = InProcessCacheBackend()
+    worker_a, worker_b = OpenIssueIndex(backend=backend), OpenIssueIndex(backend=backend)
+    worker_a.rebuild(db_session)
+    worker_b.rebuild(db_session)
+
+    # Core statements bypass the session hooks: worker A applies its writes explicitly
+    issues = Issue.__table__
+    db_session.execute(issues.insert().values(id=4, description="d", status="open", latitude=LAT, longitude=LON))
+    db_session.commit()
+    assert worker_b.catch_up(db_session) == 1
+    assert sorted(record.id for record, _ in worker_b.nearby(LAT, LON, 50.0)) == [1, 3, 4]
+    assert worker_b.catch_up(db_session) == 0
+
+    db_session.execute(issues.update().where(issues.c.id == 2).values(status="open"))
+    db_session.execute(issues.update().where(issues.c.id == 3).values(status="resolved"))
+    db_session.execute(issues.update().where(issues.c.id == 1).values(upvotes=7))
+    db_session.commit()
+    worker_a.apply(2, "open", LAT, LON + 0.0001, 0, None)
+    worker_a.discard(3)
+    worker_a.add_upvotes(1, 7)
+    assert worker_a.refresh(db_session) == {"new": 1, "published": 3, "updated": 0, "closed": 0}
+    assert worker_b.refresh(db_session) == {"new": 0, "published": 0, "updated": 2, "closed": 1}
+    assert worker_b.check_consistency(db_session)["consistent"]
+    assert worker_b.refresh(db_session) == {"new": 0, "published": 0, "updated": 0, "closed": 0}
+
+    # Only published ids are reloaded; anything else waits for the consistency check
+    db_session.execute(issues.update().where(issues.c.id == 1).values(upvotes=9))
+    db_session.commit()
+    assert worker_b.refresh(db_session)["updated"] == 0
+    assert worker_b.check_consistency(db_session, repair=True)["rebuilt"]
+    assert worker_b.nearby(LAT, LON, 10.0)[0][0].upvotes == 9
+
+
+def test_refresh_checks_consistency_when_events_expired(db_session):
+    db_session.add(Issue(id=1, description="a", status="open", latitude=LAT, longitude=LON, upvotes=0))
+    db_session.commit()
+    backend = InProcessCacheBackend()
+    index = OpenIssueIndex(backend=backend)
+    index.rebuild(db_session)
+
+    db_session.query(Issue).filter(Issue.id == 1).update({"status": "resolved"})
+    db_session.commit()
+    backend.publish("other", "open_issue_index", "issues", ("1",))
+    backend.publish("other", "open_issue_index", "issues", ("1",))
+    del backend._events[0]  # past the retention window
+    index.refresh(db_session)
+    assert index.get_stats()["indexed_issues"] == 0
+
+
+def test_refresh_keeps_changes_made_after_its_snapshot(db_session):
+    db_session.add(Issue(id=1, description="a", status="open", latitude=LAT, longitude=LON))
+    db_session.commit()
+    backend = InProcessCacheBackend()
+    index = OpenIssueIndex(backend=backend)
+    index.rebuild(db_session)
+    # Another worker upvoted the issue
+    backend.publish("other", "open_issue_index", "issues", ("1",))
+
+    # This process closes the issue while a refresh is between its snapshot and its apply step
+    original_query = db_session.query
+
+    def query_then_close(*args, **kwargs):
+        result = original_query(*args, **kwargs)
+        index.discard(1)
+        return result
+
+    db_session.query = query_then_close
+    index.refresh(db_session)
+    db_session.query = original_query
+    assert index.nearby(LAT, LON, 50.0) == []
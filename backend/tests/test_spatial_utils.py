@@ -139,3 +139,107 @@ def test_find_nearby_issues_functional():
     found_issue3 = next((res for res in nearby_large if res[0].id == 3), None)
     assert found_issue3 is not None
     assert 19000 < found_issue3[1] < 21000
+
+def _make_spatial_session():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from backend.database import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def test_query_open_issues_near_uses_rtree_index():
+    """
+    The R*Tree index is created with the issues table and returns only
+    open issues inside the bounding box.
+    """
+    from backend.spatial_utils import query_open_issues_near, has_spatial_index
+
+    db = _make_spatial_session()
+    lat, lon = 18.52, 73.85
+    db.add_all([
+        Issue(id=1, description="near", status="open", latitude=lat, longitude=lon),
+        Issue(id=2, description="near but resolved", status="resolved", latitude=lat, longitude=lon),
+        Issue(id=3, description="same latitude, far east", status="open", latitude=lat, longitude=lon + 0.5),
+        Issue(id=4, description="no coordinates", status="open"),
+    ])
+    db.commit()
+
+    assert has_spatial_index(db)
+
+    ids = {row.id for row in query_open_issues_near(db, (Issue.id,), lat, lon, 50.0).all()}
+    assert ids == {1}
+
+def test_spatial_index_tracks_status_changes_and_deletes():
+    from backend.spatial_utils import query_open_issues_near
+
+    db = _make_spatial_session()
+    lat, lon = 18.52, 73.85
+    db.add_all([
+        Issue(id=1, description="a", status="open", latitude=lat, longitude=lon),
+        Issue(id=2, description="b", status="open", latitude=lat + 0.0001, longitude=lon),
+    ])
+    db.commit()
+
+    # Bulk update (bypasses ORM events) is picked up by the triggers
+    db.query(Issue).filter(Issue.id == 1).update({Issue.status: "verified"}, synchronize_session=False)
+    db.commit()
+    ids = {row.id for row in query_open_issues_near(db, (Issue.id,), lat, lon, 50.0).all()}
+    assert ids == {2}
+
+    # Reopening puts the issue back into the index
+    db.query(Issue).filter(Issue.id == 1).update({Issue.status: "open"}, synchronize_session=False)
+    db.query(Issue).filter(Issue.id == 2).delete(synchronize_session=False)
+    db.commit()
+    ids = {row.id for row in query_open_issues_near(db, (Issue.id,), lat, lon, 50.0).all()}
+    assert ids == {1}
+
+def test_batch_distance_kernels_match_scalar():
+    from backend.spatial_utils import batch_haversine_distance, batch_equirectangular_distance
+    import numpy as np
+
+    lat, lon = 18.52, 73.85
+    lats = np.array([18.52, 18.5209, 18.70, 0.0])
+    lons = np.array([73.85, 73.85, 73.85, -179.9])
+
+    hav = batch_haversine_distance(lat, lon, lats, lons)
+    eq = batch_equirectangular_distance(lat, lon, lats, lons)
+    for i in range(len(lats)):
+        assert abs(hav[i] - haversine_distance(lat, lon, lats[i], lons[i])) < 1e-6
+        assert abs(eq[i] - equirectangular_distance(lat, lon, lats[i], lons[i])) < 1e-6
+
+def test_find_nearby_issues_vectorized_matches_scalar():
+    """
+    Large candidate sets take the NumPy path; results and the top-k
+    selection must match the scalar loop.
+    """
+    import random
+    from backend.spatial_utils import _find_nearby_issues_scalar
+
+    random.seed(42)
+    lat, lon = 18.52, 73.85
+    issues = [
+        Issue(id=i, latitude=lat + random.uniform(-0.005, 0.005), longitude=lon + random.uniform(-0.005, 0.005))
+        for i in range(1000)
+    ]
+
+    expected = _find_nearby_issues_scalar(issues, lat, lon, 300.0)
+    result = find_nearby_issues(issues, lat, lon, radius_meters=300.0)
+    assert [issue.id for issue, _ in result] == [issue.id for issue, _ in expected]
+    assert all(isinstance(distance, float) for _, distance in result)
+
+    top3 = find_nearby_issues(issues, lat, lon, radius_meters=300.0, limit=3)
+    assert [issue.id for issue, _ in top3] == [issue.id for issue, _ in expected[:3]]
+
+def test_cluster_issues_dbscan_eps_in_meters():
+    """eps is a distance in meters: 20m apart clusters, 100m apart does not."""
+    lat, lon = 18.52, 73.85
+    issues = [
+        Issue(id=1, latitude=lat, longitude=lon),
+        Issue(id=2, latitude=lat + 0.00018, longitude=lon),   # ~20m
+        Issue(id=3, latitude=lat + 0.0011, longitude=lon),    # ~100m further
+    ]
+
+    clusters = cluster_issues_dbscan(issues, eps_meters=30.0)
+    assert sorted(sorted(issue.id for issue in cluster) for cluster in clusters) == [[1, 2], [3]]
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import (
+    ClosureConfirmation, Grievance, GrievanceFollower, GrievanceStatus, Jurisdiction, JurisdictionLevel,
+    SeverityLevel
+)
+from backend.closure_service import ClosureService
+from backend.escalation_engine import EscalationEngine
+from backend.sql_instrumentation import SQLInstrumentationMiddleware, SQLReport, statement_shape, track_queries
+
+PAST = datetime.now(timezone.utc) - timedelta(days=1)
+
+
+@pytest.fixture
+def SessionLocal():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        for j in range(1, 4):
+            db.add(Jurisdiction(id=j, level=JurisdictionLevel.LOCAL, geographic_coverage={}, responsible_authority=f"J{j}",
+                                default_sla_hours=24))
+        for g in range(1, 31):
+            db.add(Grievance(id=g, unique_id=f"G-{g}", category="Road", severity=SeverityLevel.LOW,
+                             current_jurisdiction_id=g % 3 + 1, assigned_authority="PWD", sla_deadline=PAST,
+                             pending_closure=True, closure_confirmation_deadline=PAST))
+            db.add_all([GrievanceFollower(grievance_id=g, user_email=f"user{u}@example.com") for u in range(5)])
+            confirmed = 4 if g % 2 else 1
+            db.add_all([ClosureConfirmation(grievance_id=g, user_email=f"user{u}@example.com",
+                                            confirmation_type="confirmed") for u in range(confirmed)])
+        db.commit()
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_statement_shapes_ignore_literals_and_list_lengths():
+    assert statement_shape("SELECT * FROM issues WHERE id = ?") == statement_shape("SELECT * FROM issues\n WHERE id = 42")
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+    assert statement_shape("SELECT * FROM t WHERE name = 'a''b' AND x = :x") == "SELECT * FROM t WHERE name = ? AND x = ?"
+    assert statement_shape("SELECT anon_1.id FROM t AS anon_1") == "SELECT anon_1.id FROM t AS anon_1"
+
+
+def test_repeated_statement_shapes_are_flagged(SessionLocal):
+    report = SQLReport(threshold=10)
+    with SessionLocal() as db:
+        with track_queries("loop", report) as stats:
+            for grievance_id in range(1, 21):
+                db.execute(select(Grievance.id).where(Grievance.id == grievance_id)).all()
+        with track_queries("batched", report):
+            db.execute(select(Grievance.id).where(Grievance.id.in_(range(1, 21)))).all()
+        db.execute(text("SELECT 1"))  # outside any tracked block: not recorded
+
+    assert stats.count == 20 and stats.seconds > 0 and stats.slowest_statement.startswith("SELECT")
+    result = report.get_report()
+    assert {route["route"]: route["requests"] for route in result["routes"]} == {"loop": 1, "batched": 1}
+    assert [(finding["route"], finding["max_executions"]) for finding in result["n_plus_one"]] == [("loop", 20)]
+
+
+def test_middleware_reports_per_request_and_sets_debug_headers(SessionLocal):
+    report = SQLReport(threshold=3)
+    app = FastAPI()
+    app.add_middleware(SQLInstrumentationMiddleware, report=report, debug_headers=True)
+
+    def get_db():
+        with SessionLocal() as db:
+            yield db
+
+    @app.get("/grievances/{count}")
+    def list_grievances(count: int, db=Depends(get_db)):
+        return [db.get(Grievance, grievance_id).unique_id for grievance_id in range(1, count + 1)]
+
+    @app.get("/async")
+    async def no_queries():
+        return {}
+
+    client = TestClient(app)
+    response = client.get("/grievances/5")
+    assert response.headers["x-db-query-count"] == "5"
+    assert response.headers["x-db-n-plus-one"] == "1"
+    assert float(response.headers["x-db-time-ms"]) >= float(response.headers["x-db-slowest-ms"]) > 0
+    assert client.get("/async").headers["x-db-query-count"] == "0"
+
+    result = report.get_report()
+    routes = {route["route"]: route for route in result["routes"]}
+    assert routes["GET /grievances/{count}"]["max_queries"] == 5
+    assert result["n_plus_one"][0]["route"] == "GET /grievances/{count}"
+    assert [entry["queries"] for entry in result["recent"]] == [5, 0]
+
+
+def test_escalation_candidates_load_their_jurisdictions(SessionLocal):
+    engine = EscalationEngine(routing_service=None, sla_service=None, rules_config={})
+    with SessionLocal() as db, track_queries("escalation", SQLReport()) as stats:
+        levels = {grievance.jurisdiction.level for grievance in engine._get_grievances_for_evaluation(db)}
+    assert levels == {JurisdictionLevel.LOCAL}
+    assert stats.count == 1
+
+
+def test_closure_timeouts_are_checked_in_constant_queries(SessionLocal):
+    with SessionLocal() as db, track_queries("closure", SQLReport()) as stats:
+        assert ClosureService.check_timeout_and_finalize(db) == 30
+    assert stats.count == 5  # expired ids, two grouped counts, two UPDATEs
+
+    with SessionLocal() as db:
+        resolved = db.query(Grievance).filter(Grievance.status == GrievanceStatus.RESOLVED).count()
+        still_pending = db.query(Grievance).filter(Grievance.pending_closure == True).count()
+    assert (resolved, still_pending) == (15, 0)  # 4 of 5 followers confirmed on odd ids
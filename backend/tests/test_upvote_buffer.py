@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from backend.models import Issue
+from backend.spatial_index import OpenIssueIndex, OpenIssueRecord
+from backend.upvote_buffer import UpvoteBuffer
+
+
+@pytest.fixture
+def db_session(threaded_db_session):
+    # Flushes run in the threadpool
+    threaded_db_session.add_all([Issue(id=1, description="hot", category="Road", upvotes=10),
+                                 Issue(id=2, description="cold", category="Road", upvotes=None)])
+    threaded_db_session.commit()
+    return threaded_db_session
+
+
+def upvotes(db, issue_id):
+    db.expire_all()
+    return db.get(Issue, issue_id).upvotes
+
+
+def test_votes_are_coalesced_into_one_batch(db_session):
+    buffer = UpvoteBuffer(flush_events=1000)
+    for _ in range(50):
+        buffer.add(1)
+    assert buffer.add(2) == 1
+    assert buffer.pending(1) == 50
+    assert upvotes(db_session, 1) == 10  # nothing written yet
+
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    assert buffer.flush(db_session) == 51
+
+    assert sum(statement.startswith("UPDATE issues") for statement in statements) == 1
+    assert upvotes(db_session, 1) == 60
+    assert upvotes(db_session, 2) == 1
+    assert buffer.get_stats()["pending_votes"] == 0
+    assert buffer.flush(db_session) == 0
+
+
+def test_failed_flush_keeps_the_votes(db_session, monkeypatch):
+    buffer = UpvoteBuffer()
+    buffer.add(1, 3)
+
+    def fail():
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(db_session, "commit", fail)
+    with pytest.raises(RuntimeError):
+        buffer.flush(db_session)
+    monkeypatch.undo()
+
+    buffer.add(1)
+    assert buffer.pending(1) == 4
+    assert buffer.get_stats()["failed_flushes"] == 1
+    buffer.flush(db_session)
+    assert upvotes(db_session, 1) == 14
+
+
+def test_take_hands_the_delta_to_the_caller():
+    buffer = UpvoteBuffer()
+    buffer.add(1, 2)
+    assert buffer.take(1) == 2
+    assert buffer.pending(1) == 0
+    buffer.restore({1: 2})
+    assert buffer.pending(1) == 2
+
+
+def test_event_threshold_triggers_a_flush_and_stop_flushes_the_rest(db_session, monkeypatch):
+    flushed = []
+    buffer = UpvoteBuffer(flush_seconds=3600, flush_events=5)
+    monkeypatch.setattr("backend.upvote_buffer.run_with_session", lambda func: flushed.append(func(db_session)))
+
+    async def scenario():
+        buffer.start()
+        for _ in range(5):
+            buffer.add(1)
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if flushed:
+                break
+        buffer.add(2)
+        await buffer.stop()
+
+    asyncio.run(scenario())
+    assert flushed[0] == 5  # reached flush_events long before flush_seconds
+    assert flushed[-1] == 1  # written at shutdown
+    assert upvotes(db_session, 1) == 15
+    assert upvotes(db_session, 2) == 1
+
+
+def test_flush_invalidates_nearby_cells_of_open_issues(db_session, monkeypatch):
+    index = OpenIssueIndex()
+    index.upsert(OpenIssueRecord(1, 19.076, 72.8777, 10, None))  # issue 2 is not open: not indexed
+    nearby = MagicMock()
+    monkeypatch.setattr("backend.upvote_buffer.open_issue_index", index)
+    monkeypatch.setattr("backend.upvote_buffer.nearby_cache", nearby)
+
+    buffer = UpvoteBuffer()
+    buffer.add(1, 3)
+    buffer.add(2)
+    buffer.flush(db_session)
+
+    assert index.nearby(19.076, 72.8777, 10.0)[0][0].upvotes == 13
+    nearby.invalidate_points.assert_called_once_with([(19.076, 72.8777)])
+
+
+def test_votes_for_missing_issues_are_logged_as_dropped(db_session, caplog):
+    buffer = UpvoteBuffer()
+    buffer.add(1)
+    buffer.add(99, 2)
+    assert buffer.flush(db_session) == 3
+    assert upvotes(db_session, 1) == 11
+    assert buffer.get_stats()["dropped_votes"] == 2
+    assert "ids [99]" in caplog.text
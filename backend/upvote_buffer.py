@@ -0,0 +1,206 @@
+"""
+Write-coalescing buffer for issue upvotes.
+
+A popular issue turns every upvote into an UPDATE of the same row, and each
+one commits on its own. On SQLite every such commit takes the database write
+lock. Votes now only increment a per-issue delta in memory. The buffer writes
+all pending deltas as one batch of UPDATEs in a single transaction, every
+UPVOTE_FLUSH_SECONDS, or sooner once UPVOTE_FLUSH_EVENTS votes are waiting.
+
+The vote endpoints answer with an optimistic count: the stored value plus the
+pending delta. The open issue index, the cached issue pages and the nearby
+cells around each voted open issue are updated after each flush (one
+invalidation per cache for the whole batch), so they always match the
+database. Pending deltas are
+flushed when the application shuts down (see main.py). A failed flush puts
+its deltas back for the next attempt. Deltas of issues that no longer exist
+in the issues table match no row; they are logged and counted as dropped
+(issue_archive.py takes the deltas of the issues it moves). Votes still pending when the process is
+killed without a shutdown are lost, so keep the interval short.
+"""
+import asyncio
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from backend.cache import recent_issues_cache, issue_tag
+from backend.database import run_with_session
+from backend.models import Issue
+from backend.nearby_cache import nearby_cache
+from backend.spatial_index import open_issue_index
+
+logger = logging.getLogger(__name__)
+
+UPVOTE_FLUSH_SECONDS = float(os.environ.get("UPVOTE_FLUSH_SECONDS", "0.25"))
+UPVOTE_FLUSH_EVENTS = int(os.environ.get("UPVOTE_FLUSH_EVENTS", "200"))
+
+_issues = Issue.__table__
+# Core executemany: one statement, one parameter set per issue
+_increment_upvotes = (
+    update(_issues)
+    .where(_issues.c.id == bindparam("issue_id"))
+    .values(upvotes=func.coalesce(_issues.c.upvotes, 0) + bindparam("delta"))
+)
+
+
+class UpvoteBuffer:
+    """Per-issue upvote deltas waiting to be written."""
+
+    def __init__(self, flush_seconds: float = UPVOTE_FLUSH_SECONDS, flush_events: int = UPVOTE_FLUSH_EVENTS):
+        self._flush_seconds = flush_seconds
+        self._flush_events = flush_events
+        self._lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        self._events = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flushes = 0
+        self._flushed_votes = 0
+        self._failed_flushes = 0
+        self._dropped_votes = 0
+
+    def add(self, issue_id: int, delta: int = 1) -> int:
+        """Record a vote; returns the issue's pending (unwritten) delta."""
+        with self._lock:
+            pending = self._pending[issue_id] = self._pending.get(issue_id, 0) + delta
+            self._events += 1
+            full = self._events >= self._flush_events
+        if full:
+            self._wake()
+        return pending
+
+    def pending(self, issue_id: int) -> int:
+        with self._lock:
+            return self._pending.get(issue_id, 0)
+
+    def take(self, issue_id: int) -> int:
+        """Remove and return an issue's pending delta, for a caller writing it itself."""
+        with self._lock:
+            return self._pending.pop(issue_id, 0)
+
+    def take_many(self, issue_ids: Iterable[int]) -> Dict[int, int]:
+        """Remove and return the pending deltas of several issues (those with votes only)."""
+        with self._lock:
+            taken = {issue_id: self._pending.pop(issue_id, 0) for issue_id in issue_ids}
+        return {issue_id: delta for issue_id, delta in taken.items() if delta}
+
+    def restore(self, deltas: Dict[int, int]) -> None:
+        """Put back deltas whose write failed."""
+        with self._lock:
+            for issue_id, delta in deltas.items():
+                if delta:
+                    self._pending[issue_id] = self._pending.get(issue_id, 0) + delta
+
+    def flush(self, db: Session) -> int:
+        """Write every pending delta in one transaction. Returns the number of votes written."""
+        with self._lock:
+            deltas, self._pending, self._events = self._pending, {}, 0
+        if not deltas:
+            return 0
+
+        try:
+            result = db.connection().execute(
+                _increment_upvotes,
+                [{"issue_id": issue_id, "delta": delta} for issue_id, delta in deltas.items()]
+            )
+            if result.supports_sane_multi_rowcount() and result.rowcount < len(deltas):
+                self._log_dropped(db, deltas)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.restore(deltas)
+            self._failed_flushes += 1
+            raise
+
+        # Closed issues are not in the index and not in nearby results either
+        records = [open_issue_index.add_upvotes(issue_id, delta) for issue_id, delta in deltas.items()]
+        # The votes are committed: a failed invalidation only leaves entries to expire.
+        # One invalidation per cache for the whole batch (one event each on a shared backend)
+        try:
+            recent_issues_cache.invalidate_tags(*(issue_tag(issue_id) for issue_id in deltas))
+            nearby_cache.invalidate_points(
+                [(record.latitude, record.longitude) for record in records if record is not None]
+            )
+        except Exception as e:
+            logger.error(f"Error invalidating caches after upvote flush: {e}")
+
+        votes = sum(deltas.values())
+        self._flushes += 1
+        self._flushed_votes += votes
+        return votes
+
+    def _log_dropped(self, db: Session, deltas: Dict[int, int]) -> None:
+        """Log the votes whose UPDATE matched no row (issue deleted or archived meanwhile)."""
+        existing = set(db.execute(select(_issues.c.id).where(_issues.c.id.in_(list(deltas)))).scalars())
+        dropped = {issue_id: delta for issue_id, delta in deltas.items() if issue_id not in existing}
+        if dropped:
+            self._dropped_votes += sum(dropped.values())
+            logger.warning(
+                f"Upvote flush matched no issue row for ids {sorted(dropped)}: "
+                f"{sum(dropped.values())} votes dropped"
+            )
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # Loop already closed; the shutdown flush picks the votes up
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+            try:
+                await run_in_threadpool(run_with_session, self.flush)
+            except Exception as e:
+                logger.error(f"Upvote flush failed (votes kept for the next attempt): {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start the periodic flusher on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = self._wakeup = None
+        votes = await run_in_threadpool(run_with_session, self.flush)
+        if votes:
+            logger.info(f"Flushed {votes} pending upvotes at shutdown")
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            pending_votes = sum(self._pending.values())
+            pending_issues = len(self._pending)
+        return {
+            "pending_issues": pending_issues,
+            "pending_votes": pending_votes,
+            "flushes": self._flushes,
+            "flushed_votes": self._flushed_votes,
+            "failed_flushes": self._failed_flushes,
+            "dropped_votes": self._dropped_votes,
+        }
+
+
+# Global instance shared by the vote endpoints
+upvote_buffer = UpvoteBuffer()
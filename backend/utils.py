@@ -2,15 +2,15 @@ from __future__ import annotations
 from fastapi import UploadFile, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
 from PIL import Image
 import os
 import shutil
 import logging
 import io
+import math
 from typing import Optional
 
-from backend.cache import user_upload_cache
+from backend.rate_limiter import rate_limiter, RateLimitPolicy
 from backend.models import Issue
 from backend.schemas import DetectionResponse
 from backend.pothole_detection import validate_image_for_processing
@@ -43,25 +43,18 @@ UPLOAD_LIMIT_PER_IP = 10
 
 def check_upload_limits(identifier: str, limit: int) -> None:
     """
-    Check if the user/IP has exceeded upload limits using thread-safe cache.
+    Check and consume one upload for the user/IP against its hourly limit.
+    Uses the shared sliding-window rate limiter (constant memory per client,
+    atomic check-and-consume).
     """
-    current_uploads = user_upload_cache.get(identifier) or []
-    now = datetime.now()
-    one_hour_ago = now - timedelta(hours=1)
-
-    # Filter out old timestamps (older than 1 hour)
-    recent_uploads = [ts for ts in current_uploads if ts > one_hour_ago]
-
-    if len(recent_uploads) >= limit:
+    result = rate_limiter.hit(RateLimitPolicy("uploads_per_hour", limit, 3600.0), identifier)
+    if not result.allowed:
         raise HTTPException(
             status_code=429,
-            detail=f"Upload limit exceeded. Maximum {limit} uploads per hour allowed."
+            detail=f"Upload limit exceeded. Maximum {limit} uploads per hour allowed.",
+            headers={"Retry-After": str(math.ceil(result.retry_after))}
         )
 
-    # Add current timestamp and update cache atomically
-    recent_uploads.append(now)
-    user_upload_cache.set(recent_uploads, identifier)
-
 def _validate_uploaded_file_sync(file: UploadFile) -> Optional[Image.Image]:
     """
     Synchronous validation logic to be run in a threadpool.
@@ -13,15 +13,12 @@ const ActionView = ({ actionPlan, setActionPlan, setView }) => {
 
     const interval = setInterval(async () => {
       try {
-        const res = await fetch(`${API_URL}/api/issues/recent`);
+        const res = await fetch(`${API_URL}/api/issues/${actionPlan.id}/action-plan`);
         if (res.ok) {
           const data = await res.json();
-          // Find the issue by ID
-          const issue = data.find(i => i.id === actionPlan.id);
-          if (issue && issue.action_plan && issue.action_plan.whatsapp) {
-             // Plan is ready! Merge with existing to keep status/id if needed, but actually we replace it completely
-             // Issue.action_plan from DB has the full plan now (including rule and AI content)
-             setActionPlan(issue.action_plan);
+          if (data.action_plan && data.action_plan.whatsapp) {
+             // Plan is ready! The stored plan is complete (including rule and AI content), so replace it
+             setActionPlan(data.action_plan);
           }
         }
       } catch (e) {
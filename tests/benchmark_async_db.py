@@ -0,0 +1,136 @@
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base, create_db_engine, create_async_db_engine
+from backend.models import Issue
+
+ISSUES = 200
+REQUESTS = 2000
+CONCURRENCY = 20
+# One in five requests is a vote, the rest are point reads
+VOTE_EVERY = 5
+# Blocking work (image processing, sync handlers) keeping the threadpool busy meanwhile
+BUSY_WORKERS = 60
+BUSY_JOB_SECONDS = 0.05
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def request_threadpool(SessionLocal, issue_id, vote):
+    """The old pattern: a blocking handler, run in the threadpool by FastAPI."""
+    db = SessionLocal()
+    try:
+        if vote:
+            db.query(Issue).filter(Issue.id == issue_id).update(
+                {Issue.upvotes: func.coalesce(Issue.upvotes, 0) + 1}, synchronize_session=False
+            )
+            db.commit()
+        return db.query(Issue.upvotes, Issue.status).filter(Issue.id == issue_id).first()
+    finally:
+        db.close()
+
+
+async def request_async(AsyncSessionLocal, issue_id, vote):
+    async with AsyncSessionLocal() as db:
+        if vote:
+            result = await db.execute(
+                update(Issue).where(Issue.id == issue_id)
+                .values(upvotes=func.coalesce(Issue.upvotes, 0) + 1)
+                .returning(Issue.upvotes, Issue.status)
+                .execution_options(synchronize_session=False)
+            )
+            row = result.first()
+            await db.commit()
+            return row
+        return (await db.execute(select(Issue.upvotes, Issue.status).where(Issue.id == issue_id))).first()
+
+
+async def run_load(make_request, busy_threadpool):
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    done = asyncio.Event()
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            await make_request(1 + i % ISSUES, i % VOTE_EVERY == 0)
+            latencies.append(time.perf_counter() - start)
+
+    async def busy_worker():
+        while not done.is_set():
+            await run_in_threadpool(time.sleep, BUSY_JOB_SECONDS)
+
+    workers = [asyncio.create_task(busy_worker()) for _ in range(BUSY_WORKERS if busy_threadpool else 0)]
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(REQUESTS)))
+    total = time.perf_counter() - start
+    done.set()
+    await asyncio.gather(*workers)
+    return latencies, total
+
+
+def run_benchmark():
+    print("⚡ Bolt Async DB Layer Benchmark ⚡")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/bench.db"
+        engine = create_db_engine(url)
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as db:
+            db.add_all([Issue(description=f"issue {i}", category="Road", upvotes=0) for i in range(ISSUES)])
+            db.commit()
+
+        async_engine = create_async_db_engine(url)
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def main():
+            results = {}
+            for busy in (False, True):
+                results[("threadpool", busy)] = await run_load(
+                    lambda issue_id, vote: run_in_threadpool(request_threadpool, SessionLocal, issue_id, vote), busy
+                )
+                results[("async", busy)] = await run_load(
+                    lambda issue_id, vote: request_async(AsyncSessionLocal, issue_id, vote), busy
+                )
+            await async_engine.dispose()
+            return results
+
+        results = asyncio.run(main())
+        engine.dispose()
+
+    print(f"{REQUESTS} requests (1 in {VOTE_EVERY} a vote), concurrency {CONCURRENCY}")
+    for busy in (False, True):
+        print("threadpool busy with blocking work:" if busy else "idle threadpool:")
+        for name in ("threadpool", "async"):
+            latencies, total = results[(name, busy)]
+            print(f"  {name:>10}: p50 {statistics.median(latencies) * 1000:7.2f} ms | "
+                  f"p99 {percentile(latencies, 99) * 1000:7.2f} ms | {REQUESTS / total:7.0f} req/s")
+
+    # Writers still queue on SQLite's single write lock (the busy handler backs off),
+    # so the tail is set by votes; what the async path removes is the wait for a
+    # threadpool token, which shows in the median and throughput under load.
+    sync_busy, async_busy = results[("threadpool", True)][0], results[("async", True)][0]
+    if statistics.median(async_busy) < statistics.median(sync_busy):
+        print("✅ SUCCESS: Async session is unaffected by a saturated threadpool.")
+    else:
+        print("❌ FAILURE: No improvement observed.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
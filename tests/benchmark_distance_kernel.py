@@ -0,0 +1,63 @@
+import time
+import random
+import sys
+import os
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.spatial_utils import find_nearby_issues, _find_nearby_issues_scalar
+
+
+class Candidate:
+    """Minimal stand-in for a projected Issue row."""
+    __slots__ = ("id", "latitude", "longitude")
+
+    def __init__(self, id, latitude, longitude):
+        self.id = id
+        self.latitude = latitude
+        self.longitude = longitude
+
+
+def time_call(func, iterations):
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start_time) / iterations
+
+
+def run_benchmark():
+    print("⚡ Bolt Distance Kernel Benchmark ⚡")
+
+    target_lat, target_lon = 19.0760, 72.8777
+    radius = 500.0
+
+    speedups = []
+    for size in (1000, 10000, 100000):
+        candidates = [
+            Candidate(i, target_lat + random.uniform(-0.01, 0.01), target_lon + random.uniform(-0.01, 0.01))
+            for i in range(size)
+        ]
+        iterations = max(5, 100000 // size)
+
+        avg_scalar = time_call(
+            lambda: _find_nearby_issues_scalar(candidates, target_lat, target_lon, radius)[:3],
+            iterations
+        )
+        avg_vector = time_call(
+            lambda: find_nearby_issues(candidates, target_lat, target_lon, radius, limit=3),
+            iterations
+        )
+
+        print(f"{size:>7,} candidates: scalar {avg_scalar * 1000:8.3f} ms | "
+              f"vectorized top-3 {avg_vector * 1000:8.3f} ms | speedup {avg_scalar / avg_vector:5.1f}x")
+        speedups.append(avg_scalar / avg_vector)
+
+    if min(speedups) > 1.0:
+        print("✅ SUCCESS: Vectorized kernel is faster at every candidate-set size.")
+    else:
+        print("❌ FAILURE: No improvement observed.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
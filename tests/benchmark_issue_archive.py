@@ -0,0 +1,108 @@
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base, create_db_engine
+from backend.models import Issue
+from backend.issue_archive import IssueArchiver, find_issue_row, table_sizes
+from backend.routers.issues import compute_recent_issues
+
+ISSUES = 500_000
+CLOSED_SHARE = 0.9  # resolved or verified long ago
+INSERT_BATCH = 50_000
+REPEATS = 5
+
+CATEGORIES = ["Road", "Water", "Streetlight", "Garbage", "College Infra", "Women Safety"]
+
+
+def generate(db):
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    for batch_start in range(0, ISSUES, INSERT_BATCH):
+        rows = []
+        for i in range(batch_start, min(batch_start + INSERT_BATCH, ISSUES)):
+            created_at = now - timedelta(days=730 * (ISSUES - i) / ISSUES)
+            closed = rng.random() < CLOSED_SHARE and created_at < now - timedelta(days=120)
+            rows.append({
+                "reference_id": f"ref-{i}", "description": f"Issue number {i} reported by a citizen",
+                "category": rng.choice(CATEGORIES), "status": "resolved" if closed else "open",
+                "created_at": created_at, "resolved_at": created_at + timedelta(days=7) if closed else None,
+                "latitude": 18.0 + rng.random(), "longitude": 73.0 + rng.random(), "upvotes": rng.randint(0, 20),
+                "user_email": f"user{rng.randint(1, 5000)}@example.com", "integrity_hash": f"{i:064x}",
+            })
+        db.execute(Issue.__table__.insert(), rows)
+    db.commit()
+
+
+def median_ms(fn):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+QUERIES = [
+    # Offset pages of the recent issues list walk the created_at index row by row
+    ("recent issues, page 50", lambda db: compute_recent_issues(db, 20, 1000)),
+    ("open issues per category", lambda db: db.execute(
+        select(Issue.category, func.count()).where(Issue.status != "resolved").group_by(Issue.category)).all()),
+    ("reports of one user", lambda db: db.execute(
+        select(Issue.id).where(Issue.user_email == "user42@example.com").order_by(Issue.created_at.desc())).all()),
+    ("upvotes above 15", lambda db: db.execute(select(func.count()).where(Issue.upvotes > 15)).scalar()),
+]
+
+
+def run_benchmark():
+    print("⚡ Bolt Hot/Cold Issue Archive Benchmark ⚡")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/archive.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        print(f"Generating {ISSUES:,} issues ({CLOSED_SHARE:.0%} of those older than 120 days resolved)...")
+        generate(db)
+
+        before = {label: median_ms(lambda: query(db)) for label, query in QUERIES}
+
+        archiver = IssueArchiver(after_days=90, batch_size=1000)
+        report = archiver.archive(db)
+        sizes = table_sizes(db)
+        print(f"Archived {report['archived']:,} issues in {report['batches']} batches: "
+              f"{report['seconds']:.1f} s ({report['rows_per_second']:,.0f} rows/s)")
+        print(f"  hot issues: {sizes['issues']:,}, archived: {sizes['issues_archive']:,}")
+
+        print(f"{'query':<26} | {'all rows':>9} | {'hot only':>9} | speedup")
+        speedups = []
+        for label, query in QUERIES:
+            after = median_ms(lambda: query(db))
+            speedups.append(before[label] / after)
+            print(f"{label:<26} | {before[label]:>6.1f} ms | {after:>6.1f} ms | {before[label] / after:.1f}x")
+
+        archived_id = db.execute(select(func.min(Issue.id))).scalar() - 1
+        fallthrough_ms = median_ms(lambda: find_issue_row(db, ["id", "status"], issue_id=archived_id))
+        print(f"Read of an archived issue by id (falls through): {fallthrough_ms:.2f} ms")
+
+        db.close()
+        engine.dispose()
+
+    if report["archived"] and min(speedups) > 1:
+        print(f"✅ SUCCESS: Hot-table queries are faster after archiving ({min(speedups):.1f}x-{max(speedups):.1f}x).")
+    else:
+        print("❌ FAILURE: Archiving did not speed up the hot-table queries.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,114 @@
+import os
+import random
+import statistics
+import sys
+import time
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import Issue
+from backend.pagination import next_cursor
+import backend.issue_search as issue_search
+
+ISSUES = 1_000_000
+INSERT_BATCH = 50_000
+PAGE_SIZE = 20
+REPEATS = 5
+
+WORDS = (
+    "pothole road broken crack water leakage pipeline garbage dumped overflowing drain sewage streetlight "
+    "dark wire hanging tree fallen traffic signal footpath encroachment stray dogs noise construction debris "
+    "flooding waterlogging school hospital market bus stop near behind opposite main lane colony"
+).split()
+LOCATIONS = ["Pune", "Mumbai", "Nagpur", "Nashik", "Thane", "Aurangabad", "Solapur", "Kolhapur"]
+CATEGORIES = ["Road", "Water", "Streetlight", "Garbage", "College Infra", "Women Safety"]
+STATUSES = ["open", "open", "open", "verified", "resolved"]
+RARE_WORD = "sinkhole"  # in one issue out of 10,000
+
+QUERIES = [
+    ("rare word", RARE_WORD, None),
+    ("common word", "pothole", None),
+    ("two words + status", "garbage school", "open"),
+    ("location", "kolhapur drain", None),
+]
+
+
+def generate(db):
+    rng = random.Random(42)
+    for batch_start in range(0, ISSUES, INSERT_BATCH):
+        rows = []
+        for i in range(batch_start, min(batch_start + INSERT_BATCH, ISSUES)):
+            words = rng.choices(WORDS, k=8)
+            if i % 10_000 == 0:
+                words.append(RARE_WORD)
+            rows.append({"description": " ".join(words), "category": rng.choice(CATEGORIES),
+                         "location": rng.choice(LOCATIONS), "status": rng.choice(STATUSES), "upvotes": 0})
+        db.execute(Issue.__table__.insert(), rows)
+    db.commit()
+
+
+def median_ms(fn):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def with_backend(db, backend, fn):
+    engine = db.get_bind().engine
+    saved = issue_search._search_backend.get(engine)
+    issue_search._search_backend[engine] = backend
+    try:
+        return fn()
+    finally:
+        issue_search._search_backend[engine] = saved
+
+
+def run_benchmark():
+    print("⚡ Bolt Full-Text Search Benchmark ⚡")
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)  # issues table plus FTS5 index and triggers
+    db = sessionmaker(bind=engine)()
+
+    print(f"Generating {ISSUES:,} issues (indexed by the insert triggers)...")
+    start = time.perf_counter()
+    generate(db)
+    print(f"  generated in {time.perf_counter() - start:.1f} s")
+    assert issue_search.search_backend(db) == "fts5"
+
+    print(f"{'query':<20} | {'LIKE scan':>10} | {'FTS5':>9} | first page")
+    speedups = []
+    for label, q, status in QUERIES:
+        like_ms = median_ms(lambda: with_backend(
+            db, "like", lambda: issue_search.search_issues(db, q, status=status, limit=PAGE_SIZE)))
+        fts_ms = median_ms(lambda: issue_search.search_issues(db, q, status=status, limit=PAGE_SIZE))
+        speedups.append(like_ms / fts_ms)
+        print(f"{label:<20} | {like_ms:>7.1f} ms | {fts_ms:>6.1f} ms | {like_ms / fts_ms:.1f}x")
+
+    # Deep cursor page of a selective query
+    cursor = None
+    for _ in range(10):
+        rows = issue_search.search_issues(db, "kolhapur drain", limit=PAGE_SIZE, cursor=cursor)
+        cursor = next_cursor(rows, PAGE_SIZE, lambda row: (row.rank, row.id))
+    deep_ms = median_ms(lambda: issue_search.search_issues(db, "kolhapur drain", limit=PAGE_SIZE, cursor=cursor))
+    print(f"Cursor page 11 of 'kolhapur drain': {deep_ms:.1f} ms")
+
+    db.close()
+
+    if min(speedups) > 1:
+        print(f"✅ SUCCESS: Indexed search beats LIKE scans on every query ({min(speedups):.1f}x-{max(speedups):.1f}x).")
+    else:
+        print("❌ FAILURE: Indexed search was not faster than LIKE scans.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
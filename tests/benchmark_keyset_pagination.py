@@ -0,0 +1,90 @@
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import Issue
+from backend.pagination import next_cursor, paginate
+
+ISSUES = 200000
+PAGE_SIZE = 20
+DEPTHS = (0, 1000, 5000, 9000)  # page numbers
+REPEATS = 20
+
+PAGE_KEY = (Issue.created_at, Issue.id)
+PARSERS = (datetime.fromisoformat, int)
+
+
+def summary_query(db):
+    return db.query(Issue.id, Issue.category, Issue.created_at, Issue.status, Issue.upvotes)
+
+
+def time_page(fetch):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fetch()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run_benchmark():
+    print("⚡ Bolt Keyset Pagination Benchmark ⚡")
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    print(f"Generating {ISSUES:,} issues...")
+    start = datetime(2024, 1, 1)
+    db.execute(insert(Issue), [
+        {"description": f"issue {i}", "category": "Road", "status": "open", "upvotes": 0,
+         # Several issues per second, so the id tie-breaker matters
+         "created_at": start + timedelta(seconds=i // 3)}
+        for i in range(ISSUES)
+    ])
+    db.commit()
+
+    # Cursor at the start of each measured page, found by walking the pages once
+    cursors = {}
+    cursor = None
+    for page in range(max(DEPTHS) + 1):
+        if page in DEPTHS:
+            cursors[page] = cursor
+        rows = paginate(summary_query(db), PAGE_KEY, PARSERS, PAGE_SIZE, cursor=cursor).all()
+        cursor = next_cursor(rows, PAGE_SIZE, lambda row: (row.created_at, row.id))
+
+    print(f"{'page':>6} | {'OFFSET/LIMIT':>12} | {'cursor':>8}")
+    offset_times, cursor_times = [], []
+    for page in DEPTHS:
+        offset_ms = time_page(
+            lambda: paginate(summary_query(db), PAGE_KEY, PARSERS, PAGE_SIZE, offset=page * PAGE_SIZE).all()
+        )
+        cursor_ms = time_page(
+            lambda: paginate(summary_query(db), PAGE_KEY, PARSERS, PAGE_SIZE, cursor=cursors[page]).all()
+        )
+        offset_times.append(offset_ms)
+        cursor_times.append(cursor_ms)
+        print(f"{page:>6} | {offset_ms:>9.2f} ms | {cursor_ms:>5.2f} ms")
+
+    db.close()
+
+    # Flat: the deepest cursor page costs about what the first one does
+    flat = cursor_times[-1] < max(3 * cursor_times[0], 1.0)
+    if flat and cursor_times[-1] < offset_times[-1]:
+        print("✅ SUCCESS: Cursor page latency stays flat with depth.")
+    else:
+        print("❌ FAILURE: Cursor pages slow down with depth.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,117 @@
+import math
+import os
+import statistics
+import sys
+import time
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import Issue
+from backend.integrity_chain import chain_hash
+from backend.chain_audit import create_checkpoints, prove_inclusion, verify_inclusion_proof, verify_range
+
+ISSUES = 1_000_000
+BLOCK_SIZE = 1024
+INSERT_BATCH = 50_000
+SINGLE_LINK_SAMPLES = 2000
+PROOF_SAMPLES = 200
+
+
+def verify_single_link(db, issue_id):
+    """What auditing costs with /blockchain-verify: the issue, then its predecessor."""
+    row = db.execute(
+        select(Issue.description, Issue.category, Issue.integrity_hash).where(Issue.id == issue_id)
+    ).first()
+    prev_hash = db.execute(
+        select(Issue.integrity_hash).where(Issue.id < issue_id).order_by(Issue.id.desc()).limit(1)
+    ).scalar() or ""
+    return chain_hash(row.description, row.category, prev_hash) == row.integrity_hash
+
+
+def generate_chain(db):
+    head = ""
+    for batch_start in range(1, ISSUES + 1, INSERT_BATCH):
+        rows = []
+        for issue_id in range(batch_start, min(batch_start + INSERT_BATCH, ISSUES + 1)):
+            description = f"Synthetic issue {issue_id}"
+            integrity_hash = chain_hash(description, "Road", head)
+            rows.append({"id": issue_id, "description": description, "category": "Road", "status": "open",
+                         "upvotes": 0, "prev_hash": head, "integrity_hash": integrity_hash})
+            head = integrity_hash
+        db.execute(Issue.__table__.insert(), rows)
+    db.commit()
+
+
+def run_benchmark():
+    print("⚡ Bolt Merkle Chain Audit Benchmark ⚡")
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    print(f"Generating a {ISSUES:,}-issue chain...")
+    start = time.perf_counter()
+    generate_chain(db)
+    print(f"  generated in {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    checkpoints = create_checkpoints(db, block_size=BLOCK_SIZE, settle_seconds=0)
+    checkpoint_seconds = time.perf_counter() - start
+    print(f"Checkpointing: {checkpoints} blocks of {BLOCK_SIZE} in {checkpoint_seconds:.1f} s")
+
+    # Old approach: one link per request, extrapolated from a sample
+    step = ISSUES // SINGLE_LINK_SAMPLES
+    start = time.perf_counter()
+    for issue_id in range(1, ISSUES + 1, step):
+        assert verify_single_link(db, issue_id)
+    single_link_seconds = (time.perf_counter() - start) / SINGLE_LINK_SAMPLES * ISSUES
+
+    start = time.perf_counter()
+    report = verify_range(db, 1, ISSUES)
+    range_seconds = time.perf_counter() - start
+
+    print(f"Full audit, per-issue verify (extrapolated): {single_link_seconds:.1f} s "
+          f"({2 * ISSUES:,} queries)")
+    print(f"Full audit, streamed range verify:           {range_seconds:.1f} s "
+          f"({report['checked']:,} rows, {report['checkpoints_checked']} blocks, "
+          f"{ISSUES / range_seconds:,.0f} rows/s)")
+
+    proof_ids = range(1, checkpoints * BLOCK_SIZE, (checkpoints * BLOCK_SIZE) // PROOF_SAMPLES)
+    samples, proof_lengths, proofs_valid = [], [], True
+    for issue_id in proof_ids:
+        start = time.perf_counter()
+        proof = prove_inclusion(db, issue_id)
+        samples.append(time.perf_counter() - start)
+        proof_lengths.append(len(proof["block_proof"]) + len(proof["root_proof"]))
+        proofs_valid = proofs_valid and verify_inclusion_proof(proof)
+    max_length = math.ceil(math.log2(checkpoints * BLOCK_SIZE)) + 1
+    print(f"Inclusion proof: median {statistics.median(samples) * 1000:.2f} ms, "
+          f"{max(proof_lengths)} hashes (bound {max_length})")
+
+    # A forged row with a recomputed seal is only caught by its checkpoint
+    forged_id = ISSUES // 2
+    prev_hash = db.execute(select(Issue.prev_hash).where(Issue.id == forged_id)).scalar()
+    db.execute(update(Issue).where(Issue.id == forged_id).values(
+        description="forged", integrity_hash=chain_hash("forged", "Road", prev_hash)))
+    db.commit()
+    tampered = verify_range(db, forged_id - BLOCK_SIZE, forged_id + BLOCK_SIZE)
+    print(f"Tampered range: checkpoint mismatches {tampered['checkpoint_mismatches']}, "
+          f"broken links {tampered['broken_links']}")
+
+    db.close()
+
+    if (report["is_valid"] and range_seconds < single_link_seconds and proofs_valid
+            and max(proof_lengths) <= max_length and not tampered["is_valid"]):
+        print("✅ SUCCESS: Streamed range audits beat per-issue checks and proofs stay logarithmic.")
+    else:
+        print("❌ FAILURE: Chain audit did not meet expectations.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,120 @@
+import time
+import random
+import sys
+import os
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database import Base
+from backend.models import Issue
+from backend.spatial_utils import get_bounding_box, query_open_issues_near, has_spatial_index
+
+NUM_ISSUES = 200000
+RADIUS_METERS = 50.0
+ITERATIONS = 200
+
+
+def run_benchmark():
+    print("⚡ Bolt R*Tree Spatial Index Benchmark ⚡")
+
+    # Use in-memory SQLite with StaticPool to share connection
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Creating the issues table also installs the R*Tree index and its triggers
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+
+    print(f"Generating {NUM_ISSUES:,} open issues...")
+    # A city-sized area around Mumbai (19.0760, 72.8777): ~44km x ~44km
+    rows = [
+        {
+            "description": "benchmark issue",
+            "category": "Road",
+            "status": "open",
+            "latitude": 19.0760 + random.uniform(-0.2, 0.2),
+            "longitude": 72.8777 + random.uniform(-0.2, 0.2),
+        }
+        for _ in range(NUM_ISSUES)
+    ]
+    db.execute(Issue.__table__.insert(), rows)
+    db.commit()
+    db.execute(text("ANALYZE"))
+    print("Data inserted.")
+
+    assert has_spatial_index(db), "R*Tree index was not created"
+
+    targets = [
+        (19.0760 + random.uniform(-0.15, 0.15), 72.8777 + random.uniform(-0.15, 0.15))
+        for _ in range(ITERATIONS)
+    ]
+
+    # Candidate set the B-tree index can narrow to: ix_issues_status_lat_lon
+    # can only use the latitude range, so every row in the latitude band is read.
+    band_sql = text("""
+        SELECT count(*) FROM issues
+        WHERE status = 'open' AND latitude >= :min_lat AND latitude <= :max_lat
+    """)
+    btree_sql = text("""
+        SELECT id, latitude, longitude FROM issues
+        WHERE status = 'open'
+        AND latitude >= :min_lat AND latitude <= :max_lat
+        AND longitude >= :min_lon AND longitude <= :max_lon
+    """)
+
+    rtree_sql = text("""
+        SELECT id, latitude, longitude FROM issues
+        WHERE status = 'open' AND id IN (
+            SELECT id FROM issues_rtree
+            WHERE min_lat <= :max_lat AND max_lat >= :min_lat
+            AND min_lon <= :max_lon AND max_lon >= :min_lon
+        )
+    """)
+
+    band_sizes = []
+    rtree_sizes = []
+
+    start_time = time.time()
+    for lat, lon in targets:
+        min_lat, max_lat, min_lon, max_lon = get_bounding_box(lat, lon, RADIUS_METERS)
+        db.execute(btree_sql, {"min_lat": min_lat, "max_lat": max_lat, "min_lon": min_lon, "max_lon": max_lon}).all()
+    avg_btree = (time.time() - start_time) / ITERATIONS
+
+    start_time = time.time()
+    for lat, lon in targets:
+        min_lat, max_lat, min_lon, max_lon = get_bounding_box(lat, lon, RADIUS_METERS)
+        db.execute(rtree_sql, {"min_lat": min_lat, "max_lat": max_lat, "min_lon": min_lon, "max_lon": max_lon}).all()
+    avg_rtree = (time.time() - start_time) / ITERATIONS
+
+    for lat, lon in targets:
+        # Same candidate set the application query (query_open_issues_near) sees
+        rtree_sizes.append(len(query_open_issues_near(db, (Issue.id,), lat, lon, RADIUS_METERS).all()))
+        min_lat, max_lat, _, _ = get_bounding_box(lat, lon, RADIUS_METERS)
+        band_sizes.append(db.execute(band_sql, {"min_lat": min_lat, "max_lat": max_lat}).scalar())
+
+    avg_band = sum(band_sizes) / len(band_sizes)
+    avg_box = sum(rtree_sizes) / len(rtree_sizes)
+
+    print(f"Average rows scanned (B-TREE latitude band): {avg_band:,.1f}")
+    print(f"Average candidates (R*TREE bounding box):    {avg_box:,.1f}")
+    print(f"Candidate-set reduction: {avg_band / max(avg_box, 1):,.0f}x")
+    print(f"Average query time (B-TREE): {avg_btree * 1000:.4f} ms")
+    print(f"Average query time (R*TREE): {avg_rtree * 1000:.4f} ms")
+
+    if avg_rtree < avg_btree:
+        print("✅ SUCCESS: R*Tree index reduced the candidate set and query time.")
+    else:
+        print("❌ FAILURE: No improvement observed.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Ensure backend modules can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base, create_db_engine
+from backend.models import Issue
+from backend.upvote_buffer import UpvoteBuffer
+
+VOTES = 5000
+THREADS = 16
+FLUSH_EVENTS = 200
+
+
+def vote_direct(SessionLocal):
+    """The old pattern: one UPDATE ... upvotes + 1 and one commit per vote, then read the count back."""
+    with SessionLocal() as db:
+        db.execute(update(Issue).where(Issue.id == 1).values(upvotes=func.coalesce(Issue.upvotes, 0) + 1))
+        db.commit()
+        return db.execute(select(Issue.upvotes).where(Issue.id == 1)).scalar()
+
+
+def vote_buffered(SessionLocal, buffer):
+    """Read the stored count, buffer the vote; every FLUSH_EVENTS votes one caller writes the batch."""
+    with SessionLocal() as db:
+        stored = db.execute(select(Issue.upvotes).where(Issue.id == 1)).scalar() or 0
+        pending = buffer.add(1)
+        if buffer.get_stats()["pending_votes"] >= FLUSH_EVENTS:
+            buffer.flush(db)
+        return stored + pending
+
+
+def run(label, SessionLocal, vote):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(lambda _: vote(), range(VOTES)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:6.2f} s  ({VOTES / elapsed:,.0f} votes/s)")
+    return elapsed
+
+
+def run_benchmark():
+    print("⚡ Bolt Upvote Buffer Benchmark ⚡")
+    print(f"{VOTES:,} votes on one issue from {THREADS} threads")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/votes.db")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as db:
+            db.add(Issue(id=1, description="Viral pothole", category="Road", upvotes=0))
+            db.commit()
+
+        direct = run("Row UPDATE + commit per vote", SessionLocal, lambda: vote_direct(SessionLocal))
+
+        buffer = UpvoteBuffer(flush_events=FLUSH_EVENTS)
+        buffered = run("Buffered, batched flushes", SessionLocal, lambda: vote_buffered(SessionLocal, buffer))
+        with SessionLocal() as db:
+            buffer.flush(db)
+            total = db.execute(select(Issue.upvotes).where(Issue.id == 1)).scalar()
+        stats = buffer.get_stats()
+        print(f"Flushes: {stats['flushes']} for {stats['flushed_votes']:,} votes; stored count {total:,}")
+        engine.dispose()
+
+    if total == 2 * VOTES and buffered < direct:
+        print(f"✅ SUCCESS: Buffering is {direct / buffered:.1f}x faster and no vote was lost.")
+    else:
+        print("❌ FAILURE: Buffered votes were slower or lost.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -4,6 +4,7 @@ import hashlib
 from backend.main import app
 from backend.database import get_db, Base, engine
 from backend.models import Issue
+from backend.upvote_buffer import upvote_buffer
 from sqlalchemy.orm import Session
 
 @pytest.fixture
@@ -94,6 +95,7 @@ def test_upvote_optimization(client, db_session):
     data = response.json()
     assert data["upvotes"] == 11
 
-    # Verify in DB
+    # Votes are buffered; verify in DB once they are flushed
+    upvote_buffer.flush(db_session)
     db_session.refresh(issue)
     assert issue.upvotes == 11
@@ -9,6 +9,7 @@ os.environ["AI_SERVICE_TYPE"] = "mock"
 
 from backend.main import app
 from backend.cache import recent_issues_cache
+from backend.database import get_async_db
 
 client = TestClient(app)
 
@@ -16,55 +17,35 @@ def test_cache_invalidation_behavior():
     """
     Verifies the cache behavior during issue creation.
     """
-    # Create a mock for the cache methods
-    # We patch the object methods on the actual instance
-    with patch.object(recent_issues_cache, 'clear') as mock_clear, \
-         patch.object(recent_issues_cache, 'set') as mock_set, \
-         patch.object(recent_issues_cache, 'get') as mock_get:
-
-        # Setup initial cache state
-        mock_get.return_value = [{"id": 999, "title": "Old Issue"}] # Simulate existing cache
-
-        # Perform issue creation
-        # We need to send a multipart request
-        # Patch run_in_threadpool in the router where create_issue lives
-        with patch('backend.routers.issues.run_in_threadpool') as mock_threadpool, \
-             patch('backend.routers.issues.process_uploaded_image', new_callable=AsyncMock) as mock_process: # Patch validation
-
-             mock_process.return_value = (MagicMock(), b"processed")
-
-             # Mock the DB save to return a dummy issue with an ID
-             mock_saved_issue = MagicMock()
-             mock_saved_issue.id = 123
-             mock_saved_issue.created_at = "2024-01-01T00:00:00"
-             mock_saved_issue.description = "Test Description"
-             mock_saved_issue.category = "Road"
-             mock_saved_issue.status = "Reported"
-             mock_saved_issue.upvotes = 0
-             mock_saved_issue.image_path = "data/uploads/test.jpg"
-             mock_saved_issue.location = None
-             mock_saved_issue.latitude = None
-             mock_saved_issue.longitude = None
-             mock_saved_issue.action_plan = {"whatsapp": "msg"} # Dict, as expected by the optimization logic
-
-             # We need to make sure run_in_threadpool returns this mock when called for save_issue_db
-             # run_in_threadpool is called twice: file save, db save.
-             def side_effect(func, *args, **kwargs):
-                 # Check which function is being called
-                 if getattr(func, '__name__', '') == 'save_issue_db':
-                     # args[1] is new_issue (args[0] is db)
-                     issue = args[1]
-                     issue.id = 123
-                     # Set fields that DB normally sets
-                     import datetime
-                     issue.created_at = datetime.datetime.now(datetime.timezone.utc)
-                     issue.status = "Reported"
-                     return issue
-                 return None
-
-             mock_threadpool.side_effect = side_effect
-
-             response = client.post(
+    # Mock the async DB session; the issue is "saved" by the patched chain append below
+    mock_db = AsyncMock()
+    app.dependency_overrides[get_async_db] = lambda: mock_db
+
+    async def append(db, issues):
+        # Set fields that DB normally sets
+        for issue in issues:
+            issue.id = 123
+
+    # Setup initial cache state: a listing page and an entry embedding an unrelated issue
+    recent_issues_cache.set([{"id": 999}], "recent_issues_10_0", tags=["issues:recent", "issue:999"])
+    recent_issues_cache.set({"id": 999}, "issue_999", tags=["issue:999"])
+
+    # Wrap/mock the cache methods on the actual instance
+    try:
+        with patch.object(recent_issues_cache, 'invalidate_tags',
+                          wraps=recent_issues_cache.invalidate_tags) as mock_invalidate_tags, \
+             patch.object(recent_issues_cache, 'set') as mock_set, \
+             patch('backend.routers.issues.integrity_chain.append_async', side_effect=append) as mock_append, \
+             patch('backend.routers.issues.process_uploaded_image', new_callable=AsyncMock) as mock_process, \
+             patch('backend.routers.issues.save_processed_image'), \
+             patch('backend.routers.issues.process_action_plan_background', new_callable=AsyncMock), \
+             patch('backend.routers.issues.create_grievance_from_issue_background', new_callable=AsyncMock):
+
+            mock_process.return_value = (MagicMock(), b"processed")
+
+            # Perform issue creation
+            # We need to send a multipart request
+            response = client.post(
                 "/api/issues",
                 data={
                     "description": "Test Issue",
@@ -74,15 +55,23 @@ def test_cache_invalidation_behavior():
                 files={"image": ("test.jpg", b"fake image content", "image/jpeg")}
             )
 
-        assert response.status_code == 201
+            assert response.status_code == 201
+            assert response.json()["id"] == 123
+            mock_append.assert_awaited_once()
+
+            # NEW BEHAVIOR CHECK (After Tag-Based Invalidation):
+            # Only entries tagged with what a new issue changes are dropped
 
-        # NEW BEHAVIOR CHECK (After Pagination Update):
-        # We now clear cache instead of optimistic update
+            mock_invalidate_tags.assert_called_once_with("issues:recent", "issues:stats", "issues:leaderboard")
+            assert not mock_set.called, "Cache.set should NOT be called (optimistic update removed)"
 
-        assert mock_clear.called, "Cache should be cleared"
-        assert not mock_set.called, "Cache.set should NOT be called (optimistic update removed)"
+        assert recent_issues_cache.get("recent_issues_10_0") is None, "Listing pages must be dropped"
+        assert recent_issues_cache.get("issue_999") == {"id": 999}, "Unrelated entries must survive"
+    finally:
+        app.dependency_overrides = {}
+        recent_issues_cache.invalidate_tags("issue:999")
 
-        print("\n[Success] Cache behavior verified: Cleared cache for pagination consistency.")
+    print("\n[Success] Cache behavior verified: Invalidated recent/stats/leaderboard tags.")
 
 if __name__ == "__main__":
     # verification via running with pytest
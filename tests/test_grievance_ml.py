@@ -26,7 +26,7 @@ def client():
          patch("backend.main.start_bot_thread") as mock_bot, \
          patch("backend.main.stop_bot_thread") as mock_stop_bot, \
          patch("backend.main.httpx.AsyncClient", return_value=mock_client_instance) as mock_http, \
-         patch("backend.main.migrate_db"), \
+         patch("backend.main.ensure_schema_current"), \
          patch("backend.main.load_maharashtra_pincode_data"), \
          patch("backend.main.load_maharashtra_mla_data"):
 
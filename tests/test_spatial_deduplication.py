@@ -190,6 +190,32 @@ def test_verification_endpoint():
     finally:
         db.close()
 
+def test_clusters_endpoint():
+    """Test the precomputed clusters endpoint"""
+    print("Testing clusters endpoint...")
+
+    db = SessionLocal()
+    try:
+        setup_test_issues(db)
+
+        with TestClient(app) as client:
+            response = client.get("/api/issues/clusters", params={"bbox": "72.87,19.07,72.89,19.09"})
+            bad_response = client.get("/api/issues/clusters", params={"bbox": "72.89,19.07"})
+
+        print(f"Clusters API status: {response.status_code}")
+        assert response.status_code == 200
+        assert bad_response.status_code == 400
+
+        clusters = response.json()
+        # Two open issues ~11m apart form one cluster, the distant one its own
+        assert [cluster["size"] for cluster in clusters] == [2, 1]
+        assert clusters[0]["representative"]["description"] == "Pothole on Main Street"
+
+        print("✓ Clusters endpoint test passed")
+
+    finally:
+        db.close()
+
 if __name__ == "__main__":
     print("Running spatial deduplication tests...\n")
 
@@ -199,6 +225,9 @@ if __name__ == "__main__":
     test_deduplication_api()
     print()
 
+    test_clusters_endpoint()
+    print()
+
     test_verification_endpoint()
     print()
 
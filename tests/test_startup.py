@@ -32,10 +32,27 @@ def test_root_endpoint():
     assert "data" in json_response
     assert json_response["data"]["service"] == "VishwaGuru API"
 
+def test_dashboard_cache_warmer():
+    """Test that the startup warmer precomputes the dashboard cache entries"""
+    from main import warm_dashboard_caches
+    from backend.cache import recent_issues_cache
+    from backend.database import Base, engine
+
+    Base.metadata.create_all(bind=engine)
+    recent_issues_cache.clear()
+
+    warm_dashboard_caches()
+
+    assert recent_issues_cache.get("stats") is not None
+    assert recent_issues_cache.get("leaderboard") is not None
+    assert recent_issues_cache.get("recent_issues_10_0") is not None
+
 if __name__ == "__main__":
     print("Testing startup and port binding...")
     test_health_endpoint()
     print("✓ Health endpoint test passed")
     test_root_endpoint()
     print("✓ Root endpoint test passed")
+    test_dashboard_cache_warmer()
+    print("✓ Dashboard cache warmer test passed")
     print("\nAll tests passed! The app can bind to port successfully.")
@@ -2,7 +2,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 from backend.main import app
-from backend.database import get_db
+from backend.database import get_async_db
 
 @pytest.fixture
 def client():
@@ -11,29 +11,21 @@ def client():
 
 # Test Manual Verification (Upvote)
 def test_manual_verification_upvote(client):
-    # Mock DB dependency to return a fake issue
-    mock_db = MagicMock()
-    mock_issue = MagicMock()
-    mock_issue.id = 1
-    mock_issue.status = "open"
-    mock_issue.upvotes = 2 # Initial upvotes
+    # Mock the async DB session: every db.execute() returns the same result mock
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()
+    mock_result = MagicMock()
+    mock_db.execute.return_value = mock_result
 
-    # We need to mock the query chain: db.query().filter().first()
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_issue
-
-    # Mock Issue class for Issue.upvotes expression
     # Since we can't easily mock the expression evaluation in SQLAlchemy without a real DB or complex mocks,
-    # we just verify the flow doesn't crash and calls commits/flush.
-    # We patch run_in_threadpool to execute immediately or mock it.
-
-    # Actually, we can rely on MagicMock accepting everything.
+    # we just verify the flow doesn't crash and executes/commits.
 
     # Override dependency
-    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_async_db] = lambda: mock_db
 
     try:
-        # We need to mock the query chain: db.query().filter().first() for updated_issue
-        # The first call is for issue_data check, the second is for updated_issue check.
+        # We need to mock result.first(): the first call is for the issue_data
+        # check, the second for the row RETURNING from the upvote update.
         mock_issue_data = MagicMock()
         mock_issue_data.id = 1
         mock_issue_data.category = "Road"
@@ -44,26 +36,20 @@ def test_manual_verification_upvote(client):
         mock_updated_issue.upvotes = 5 # Reached threshold
         mock_updated_issue.status = "open"
 
-        mock_db.query.return_value.filter.return_value.first.side_effect = [
+        mock_result.first.side_effect = [
             mock_issue_data, # Initial check
             mock_updated_issue # After upvote increment
         ]
 
-        # Mock update().filter().update()
-        mock_db.query.return_value.filter.return_value.update.return_value = 1
-
         response = client.post("/api/issues/1/verify") # No image = manual
 
         assert response.status_code == 200
-        # Check that update was called to set status to verified
-        # We can verify that update was called with Issue.status: "verified"
-        # Since we are using mocks, we check if update was called at least twice
-        # (once for upvotes, once for status)
-        assert mock_db.query.return_value.filter.return_value.update.call_count >= 2
+        # Check that the status update to verified was executed too:
+        # one select, then one update for upvotes and one for status
+        assert mock_db.execute.await_count >= 3
 
-        # Verify flush and commit were called
-        assert mock_db.flush.called
-        assert mock_db.commit.called
+        # Verify the transaction was committed
+        mock_db.commit.assert_awaited()
 
     finally:
         app.dependency_overrides = {}
@@ -80,18 +66,19 @@ def test_ai_verification_resolved(mock_vqa, mock_validate, client):
     }
 
     # Mock DB dependency to return a fake issue
-    mock_db = MagicMock()
+    mock_db = AsyncMock()
     mock_issue = MagicMock()
     mock_issue.id = 1
     mock_issue.category = "pothole"
     mock_issue.status = "open"
     mock_issue.upvotes = 0
 
-    # We need to mock the query chain: db.query().filter().first()
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_issue
+    # We need to mock the result of db.execute(select(...)).first()
+    mock_db.execute.return_value = MagicMock()
+    mock_db.execute.return_value.first.return_value = mock_issue
 
     # Override dependency
-    app.dependency_overrides[get_db] = lambda: mock_db
+    app.dependency_overrides[get_async_db] = lambda: mock_db
 
     try:
         response = client.post(